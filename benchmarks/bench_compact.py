@@ -0,0 +1,79 @@
+"""Memory kept by a resolved config with and without string interning and
+compact numeric arrays.
+
+The loader parses TOML text held in memory, so every file gets fresh
+string objects, as it would when read from disk.
+
+    python benchmarks/bench_compact.py
+"""
+
+import sys
+import time
+import tomllib
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reconfig import resolve_config  # noqa: E402
+
+BASE = Path("/bench")
+
+
+def service(i: int) -> str:
+    return "\n".join(
+        f"[instance_{j}]\n"
+        f'host = "host-{j % 8}.internal"\n'
+        f"port = {8000 + j % 4}\n"
+        f"timeout = {30 + j % 3}.0\n"
+        f'protocol = "https"\n'
+        f'region = "eu-west-{i % 3}"\n'
+        f"retry_delays = [100, 200, 400, 800, 1600]\n"
+        f"weights = [0.1, 0.2, 0.3, 0.4]\n"
+        for j in range(20)
+    )
+
+
+def graph(services: int) -> dict[Path, str]:
+    files = {
+        BASE / "root.toml": "imports = [\n"
+        + "".join(f'{{import = "service_{i}.toml"}},\n' for i in range(services))
+        + "]\n"
+    }
+    for i in range(services):
+        files[BASE / f"service_{i}.toml"] = service(i)
+    return files
+
+
+def bench(name: str, files: dict[Path, str], **kwargs) -> None:
+    def loader(path: Path) -> dict:
+        return tomllib.loads(files[path])
+
+    start = time.perf_counter()
+    resolve_config(BASE / "root.toml", loader=loader, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = resolve_config(BASE / "root.toml", loader=loader, **kwargs)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    print(f"{name:<40} {retained / 2**20:9.2f} MiB {elapsed * 1000:9.1f} ms")
+
+
+def main() -> None:
+    files = graph(500)
+    bench("plain", files)
+    bench("intern_strings", files, intern_strings=True)
+    bench("compact_arrays", files, compact_arrays=True)
+    bench(
+        "intern_strings + compact_arrays",
+        files,
+        intern_strings=True,
+        compact_arrays=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Time `resolve_config` on deep and wide synthetic import graphs.
+
+The trees are kept in memory and served by a dict-backed loader, so the
+numbers measure resolution only, not TOML parsing.
+
+    python benchmarks/bench_deep_resolve.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generators import ROOT, Graph, deep_chain, wide_fan_out  # noqa: E402
+from reconfig import resolve_config  # noqa: E402
+
+
+def bench(name: str, files: Graph, repeat: int = 20) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resolve_config(ROOT, loader=files.__getitem__)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<40} {best * 1000:10.2f} ms")
+
+
+def main() -> None:
+    bench("deep tables (depth 400, 1 file)", deep_chain(1, 400))
+    bench("deep chain (depth 50, 200 files)", deep_chain(200, 50))
+    bench("wide (500 files x 40 tables)", wide_fan_out(500, 40))
+
+    # beyond the recursion limit
+    depth = 4 * sys.getrecursionlimit()
+    for name, files in [
+        (f"deep tables (depth {depth}, 1 file)", deep_chain(1, depth)),
+        (f"deep chain (depth 1, {depth} files)", deep_chain(depth, 1)),
+    ]:
+        try:
+            bench(name, files, 1)
+        except RecursionError:
+            print(f"{name:<40} RecursionError")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Memory and time of plain vs `frozen=True` output on the README graph,
+scaled up 1000 times.
+
+Every copy lives in its own directory, so the copies are different files
+with the same content; the frozen result shares them through
+hash-consing. Files are parsed up front and served from memory.
+
+    python benchmarks/bench_frozen.py
+"""
+
+import sys
+import time
+import tomllib
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reconfig import resolve_config  # noqa: E402
+from reconfig.reconfig import copy_tree  # noqa: E402
+
+BASE = Path("/bench")
+FIXTURE = Path(__file__).resolve().parent.parent / "test/test_configs/conf_integration"
+
+
+def graph(copies: int) -> dict[Path, dict]:
+    fragment = {p.name: tomllib.loads(p.read_text()) for p in FIXTURE.glob("*.toml")}
+    files = {
+        BASE / "root.toml": {
+            "imports": [
+                {"import": f"copy_{i}/root.toml", "as": f"copy_{i}"}
+                for i in range(copies)
+            ]
+        }
+    }
+    for i in range(copies):
+        for name, data in fragment.items():
+            files[BASE / f"copy_{i}" / name] = copy_tree(data)
+    return files
+
+
+def bench(name: str, files: dict[Path, dict], **kwargs) -> None:
+    def run():
+        return resolve_config(BASE / "root.toml", loader=files.__getitem__, **kwargs)
+
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = run()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    print(
+        f"{name:<24} {best * 1000:9.2f} ms "
+        f"{retained / 2**20:9.2f} MiB retained {peak / 2**20:9.2f} MiB peak"
+    )
+
+
+def main() -> None:
+    files = graph(1000)
+    bench("plain", files)
+    bench("frozen=True", files, frozen=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Time `resolve_config` on long import chains and wide fan-outs.
+
+Files are served from memory, so the numbers cover the per-import work
+of `resolve` (path handling, circular import checks, merging).
+
+    python benchmarks/bench_import_chains.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generators import ROOT, Graph, deep_chain, fan_out_tree  # noqa: E402
+from reconfig import resolve_config  # noqa: E402
+
+
+def bench(name: str, files: Graph, repeat: int = 5) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resolve_config(ROOT, loader=files.__getitem__)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<36} {len(files):6} files {best * 1000:10.2f} ms")
+
+
+def main() -> None:
+    bench("linear chain (1000)", deep_chain(1000))
+    bench("linear chain (4000)", deep_chain(4000))
+    bench("fan-out (depth 4, width 8)", fan_out_tree(4, 8))
+    bench("fan-out (depth 2, width 60)", fan_out_tree(2, 60))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Memory and time of resolving data-heavy files whose tables hold no imports.
+
+The loaded data is built up front, so the reported allocation is what
+`resolve` adds on top of the loader output.
+
+    python benchmarks/bench_import_free_tables.py
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reconfig.reconfig import ResolveCache, resolve  # noqa: E402
+
+BASE = Path("/bench")
+
+
+def lookup_tables(tables: int, keys: int) -> dict:
+    """A file with `tables` tables of `keys` keys each, nested two deep."""
+    return {
+        f"group_{i}": {
+            f"table_{j}": {f"key_{k}": k for k in range(keys)} for j in range(10)
+        }
+        for i in range(tables // 10)
+    }
+
+
+def graph(tables: int, keys: int) -> dict[Path, dict]:
+    return {
+        BASE / "root.toml": {
+            "imports": [{"import": "data.toml"}],
+            "service": {"imports": [{"from": "data.toml", "import": "group_0"}]},
+        },
+        BASE / "data.toml": lookup_tables(tables, keys),
+    }
+
+
+def bench(name: str, files: dict[Path, dict]) -> None:
+    root = BASE / "root.toml"
+
+    def run():
+        cache = ResolveCache(loaded=dict(files))
+        return resolve(root.parent, files[root], [root], files.__getitem__, cache=cache)
+
+    best = float("inf")
+    for _ in range(10):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    print(f"{name:<36} {best * 1000:9.2f} ms {peak / 2**20:9.2f} MiB")
+
+
+def main() -> None:
+    bench("400 tables x 100 keys", graph(400, 100))
+    bench("4000 tables x 10 keys", graph(4000, 10))
+    bench("40 tables x 1000 keys", graph(40, 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""One `resolve_config` call per root vs `resolve_many` on 2000 service roots.
+
+Each root imports 20 of 50 shared fragments from `common/`, with 20
+service tables each. The files are written to a temporary directory and
+read with the default loader.
+
+    python benchmarks/bench_many.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generators import service_table  # noqa: E402
+from reconfig import resolve_config, resolve_many  # noqa: E402
+
+
+def write_tree(base: Path, roots: int, fragments: int, imports: int) -> list[Path]:
+    common = base / "common"
+    common.mkdir()
+    for i in range(fragments):
+        lines = []
+        for j in range(20):
+            lines.append(f"[table_{j}]")
+            lines.extend(f"{k} = {v!r}" for k, v in service_table(j).items())
+        text = "\n".join(lines).replace("'", '"')
+        (common / f"fragment_{i}.toml").write_text(text)
+
+    paths = []
+    for i in range(roots):
+        service = base / f"service_{i}"
+        service.mkdir()
+        chosen = [(i + k * 7) % fragments for k in range(imports)]
+        lines = [f'name = "service_{i}"', "imports = ["]
+        lines.extend(f'  {{import = "../common/fragment_{n}.toml"}},' for n in chosen)
+        lines.append("]")
+        (service / "root.toml").write_text("\n".join(lines))
+        paths.append(service / "root.toml")
+    return paths
+
+
+def timed(name: str, fn) -> None:
+    start = time.perf_counter()
+    fn()
+    print(f"{name:<32} {time.perf_counter() - start:8.2f} s", flush=True)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        roots = write_tree(Path(tmp), 2000, 50, 20)
+        cpus = os.cpu_count() or 1
+        timed("resolve_config per root", lambda: [resolve_config(r) for r in roots])
+        timed("resolve_many", lambda: resolve_many(roots))
+        timed("resolve_many, frozen", lambda: resolve_many(roots, frozen=True))
+        timed(
+            f"resolve_many, {cpus} processes",
+            lambda: resolve_many(roots, processes=cpus),
+        )
+
+
+if __name__ == "__main__":
+    main()
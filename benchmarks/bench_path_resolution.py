@@ -0,0 +1,71 @@
+"""Time `resolve_config` on an on-disk tree where many fragments in deep
+directories import the same shared files.
+
+Imported paths have to be canonicalized with `Path.resolve()`, which costs
+an `lstat` per path segment; this benchmark shows how much of that the
+per-run path cache saves.
+
+    python benchmarks/bench_path_resolution.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reconfig import resolve_config  # noqa: E402
+
+
+def write_tree(base: Path, fragments: int, depth: int) -> Path:
+    common = base / "common"
+    common.mkdir()
+    (common / "base.toml").write_text('host = "localhost"\nport = 8080\n')
+    (common / "timeouts.toml").write_text("connect = 1\nread = 5\n")
+
+    fragment_dir = base.joinpath(*(f"level_{i}" for i in range(depth)))
+    fragment_dir.mkdir(parents=True)
+    up = "../" * depth
+    for i in range(fragments):
+        (fragment_dir / f"service_{i}.toml").write_text(
+            "imports = [\n"
+            f'    {{from = "{up}common/base.toml", import = "*"}},\n'
+            f'    {{import = "{up}common/timeouts.toml"}},\n'
+            f'    {{import = "{base}/common/timeouts.toml", as = "abs_timeouts"}},\n'
+            "]\n"
+            f'name = "service_{i}"\n'
+        )
+
+    root = base / "root.toml"
+    prefix = "/".join(f"level_{i}" for i in range(depth))
+    root.write_text(
+        "imports = [\n"
+        + "".join(
+            f'    {{import = "{prefix}/service_{i}.toml"}},\n' for i in range(fragments)
+        )
+        + "]\n"
+    )
+    return root
+
+
+def bench(name: str, root: Path, repeat: int = 5, **kwargs) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resolve_config(root, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<44} {best * 1000:10.2f} ms")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = write_tree(Path(tmp).resolve(), fragments=300, depth=8)
+        bench("300 fragments, 8 dirs deep", root)
+        bench(
+            "300 fragments, 8 dirs deep, trusted abs", root, trust_absolute_paths=True
+        )
+
+
+if __name__ == "__main__":
+    main()
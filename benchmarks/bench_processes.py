@@ -0,0 +1,79 @@
+"""Serial vs thread vs process-pool parsing of 5000 TOML fragments.
+
+The root imports 50 hub files that import 100 fragments each; every
+fragment holds 20 service tables. The files are written to a temporary
+directory and parsed with `tomllib`, or with the backend named in
+RECONFIG_TOML_BACKEND, so the serial time is mostly that parser. The
+process pool only parses; the merge runs in the parent, so the speedup
+is bounded by the parse share of the serial time and by the number of
+cores.
+
+    python benchmarks/bench_processes.py [fragments]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generators import service_table  # noqa: E402
+from reconfig import resolve_config  # noqa: E402
+from reconfig.loaders import TOML_BACKEND_ENV_VAR  # noqa: E402
+
+
+def fragment(i: int) -> str:
+    lines = []
+    for j in range(20):
+        lines.append(f"[table_{j}]")
+        lines.extend(f"{k} = {v!r}" for k, v in service_table(i + j).items())
+    return "\n".join(lines).replace("'", '"')
+
+
+def write_tree(base: Path, fragments: int, hubs: int = 50) -> Path:
+    per_hub = -(-fragments // hubs)
+    for h in range(hubs):
+        names = [f"f{n}.toml" for n in range(h * per_hub, (h + 1) * per_hub)]
+        names = names[: max(0, fragments - h * per_hub)]
+        imports = ", ".join(f'{{import = "{name}"}}' for name in names)
+        (base / f"hub_{h}.toml").write_text(f"imports = [{imports}]\n")
+    for n in range(fragments):
+        (base / f"f{n}.toml").write_text(fragment(n))
+    root = base / "root.toml"
+    imports = ", ".join(f'{{import = "hub_{h}.toml"}}' for h in range(hubs))
+    root.write_text(f"imports = [{imports}]\n")
+    return root
+
+
+def timed(name: str, root: Path, baseline: float | None = None, **kwargs) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        resolve_config(root, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    speedup = f"{baseline / best:6.2f}x" if baseline else ""
+    print(f"{name:<20} {best:8.2f} s {speedup}", flush=True)
+    return best
+
+
+def main() -> None:
+    fragments = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    cpus = os.cpu_count() or 1
+    # set before anything is parsed, and inherited by the worker processes;
+    # a loader for one backend could not be sent to them
+    backend = os.environ.setdefault(TOML_BACKEND_ENV_VAR, "tomllib")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = write_tree(Path(tmp), fragments)
+        print(f"{fragments} fragments, {cpus} cores, {backend}")
+        serial = timed("serial", root)
+        timed(f"{cpus * 2} threads", root, serial, max_workers=cpus * 2)
+        processes = 1
+        while processes <= cpus:
+            timed(f"{processes} processes", root, serial, processes=processes)
+            processes *= 2
+
+
+if __name__ == "__main__":
+    main()
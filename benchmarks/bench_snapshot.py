@@ -0,0 +1,79 @@
+"""Startup time and memory of a worker: resolving vs opening a snapshot.
+
+The config is a generated JSON file, so resolving measures the cheapest
+parse. Memory is what the worker allocates itself (tracemalloc); the
+mapped snapshot pages are shared through the page cache and not counted.
+
+    python benchmarks/bench_snapshot.py
+"""
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reconfig import resolve_config  # noqa: E402
+from reconfig.snapshot import open_snapshot, write_snapshot  # noqa: E402
+
+
+def config(services: int) -> dict:
+    return {
+        f"service_{i}": {
+            "host": f"host-{i % 50}.internal",
+            "port": 8000 + i % 100,
+            "replicas": i % 7,
+            "tags": ["prod", "eu", f"team-{i % 20}"],
+            "limits": {"cpu": 0.5 * (i % 8), "memory": "512Mi"},
+        }
+        for i in range(services)
+    }
+
+
+def measure(run) -> tuple[float, float]:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    result = run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def bench(services: int, directory: Path) -> None:
+    source = directory / f"config_{services}.json"
+    source.write_text(json.dumps(config(services)))
+    snapshot = directory / f"config_{services}.snap"
+    write_snapshot(resolve_config(source), snapshot)
+
+    def read_one():
+        table = open_snapshot(snapshot)
+        return table[f"service_{services // 2}"]["limits"]["cpu"]
+
+    for name, run in [
+        ("resolve_config", lambda: resolve_config(source)),
+        ("open_snapshot", lambda: open_snapshot(snapshot)),
+        ("open_snapshot + one lookup", read_one),
+    ]:
+        best, peak = measure(run)
+        print(
+            f"{services:>7} services  {name:<28} {best * 1000:9.2f} ms "
+            f"{peak / 2**20:9.2f} MiB"
+        )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for services in (1000, 100_000):
+            bench(services, Path(directory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Parse time of every installed TOML backend on generated documents.
+
+python benchmarks/bench_toml_backends.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reconfig.loaders import available_toml_backends, toml_parser  # noqa: E402
+
+
+def document(tables: int, keys: int) -> str:
+    """`tables` tables, each with `keys` keys of mixed types and one import."""
+    lines = []
+    for i in range(tables):
+        lines.append(f"[group_{i % 10}.table_{i}]")
+        lines.append(f'imports = [{{from = "other_{i}.toml", import = "*"}}]')
+        for k in range(keys):
+            match k % 4:
+                case 0:
+                    lines.append(f"int_{k} = {k}")
+                case 1:
+                    lines.append(f'str_{k} = "value {k}"')
+                case 2:
+                    lines.append(f"list_{k} = [{k}, {k + 1}, {k + 2}]")
+                case 3:
+                    lines.append(f"float_{k} = {k}.5")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def bench(name: str, text: str) -> None:
+    for backend in available_toml_backends():
+        parse = toml_parser(backend)
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            parse(text)
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:<28} {backend:<10} {best * 1000:9.2f} ms")
+
+
+def main() -> None:
+    bench("100 tables x 10 keys", document(100, 10))
+    bench("2000 tables x 10 keys", document(2000, 10))
+    bench("200 tables x 200 keys", document(200, 200))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Synthetic import graphs for the benchmarks.
+
+Every generator returns the loaded data of each file, keyed by path under
+`BASE`, with the root at `ROOT`; serve it with `files.__getitem__` as the
+loader. The data is what a TOML parser would return for the file, so
+resolution is measured without parsing.
+"""
+
+from pathlib import Path
+
+BASE = Path("/bench")
+ROOT = BASE / "root.toml"
+
+type Graph = dict[Path, dict]
+
+
+def service_table(i: int, keys: int = 8) -> dict:
+    """A table shaped like a typical service section."""
+    table = {
+        "host": f"host-{i % 16}.internal",
+        "port": 8000 + i % 100,
+        "timeout": 30.0,
+        "tags": ["prod", f"team-{i % 10}"],
+    }
+    table.update({f"option_{k}": k for k in range(keys - len(table))})
+    return table
+
+
+def nested_tables(depth: int) -> dict:
+    """One file whose tables are nested `depth` levels deep."""
+    data = {"leaf": 0}
+    for i in range(depth):
+        data = {f"t{i}": data, f"v{i}": i}
+    return data
+
+
+def deep_chain(length: int, depth: int = 0) -> Graph:
+    """A chain of `length` files, each importing the next and holding
+    `depth` levels of nested tables."""
+    files = {}
+    for i in range(length):
+        data = nested_tables(depth)
+        if i + 1 < length:
+            data["imports"] = [{"import": f"f{i + 1}.toml"}]
+        files[BASE / f"f{i}.toml"] = data
+    files[ROOT] = {"imports": [{"from": "f0.toml", "import": "*"}]}
+    return files
+
+
+def wide_fan_out(width: int, tables: int) -> Graph:
+    """A root importing `width` files with `tables` service tables each."""
+    files = {ROOT: {"imports": [{"import": f"w{i}.toml"} for i in range(width)]}}
+    for i in range(width):
+        files[BASE / f"w{i}.toml"] = {
+            f"table_{j}": service_table(j) for j in range(tables)
+        }
+    return files
+
+
+def fan_out_tree(depth: int, width: int) -> Graph:
+    """A tree of `depth` levels where every file imports `width` new files."""
+    files = {}
+    level = ["root"]
+    for _ in range(depth):
+        next_level = []
+        for name in level:
+            children = [f"{name}_{i}" for i in range(width)]
+            files[BASE / f"{name}.toml"] = {
+                "imports": [{"import": f"{c}.toml"} for c in children]
+            }
+            next_level.extend(children)
+        level = next_level
+    for name in level:
+        files[BASE / f"{name}.toml"] = {"var": name}
+    return files
+
+
+def diamond_dag(layers: int, width: int) -> Graph:
+    """`layers` layers of `width` files; every file imports every file of
+    the next layer, so each shared file is reached along many paths."""
+    files = {ROOT: {"imports": [{"import": f"l0_{i}.toml"} for i in range(width)]}}
+    for layer in range(layers):
+        for i in range(width):
+            data = {"layer": layer, "service": service_table(i)}
+            if layer + 1 < layers:
+                data["deps"] = {
+                    "imports": [
+                        {"import": f"l{layer + 1}_{j}.toml"} for j in range(width)
+                    ]
+                }
+            files[BASE / f"l{layer}_{i}.toml"] = data
+    return files
+
+
+def huge_file(tables: int, keys: int) -> Graph:
+    """A root importing one file of `tables` tables, grouped by ten, with
+    `keys` keys each; only a small part of it has imports."""
+    data = {
+        f"group_{i}": {f"table_{j}": service_table(j, keys) for j in range(10)}
+        for i in range(tables // 10)
+    }
+    data["group_0"]["imports"] = [{"import": "small.toml"}]
+    return {
+        ROOT: {"imports": [{"import": "data.toml"}]},
+        BASE / "data.toml": data,
+        BASE / "small.toml": {"var": "value"},
+    }
+
+
+def star_merges(files_count: int, keys: int) -> Graph:
+    """A root whose one table star-imports `files_count` files with
+    `keys` distinct keys each."""
+    files = {
+        ROOT: {
+            "merged": {
+                "imports": [
+                    {"from": f"s{i}.toml", "import": "*"} for i in range(files_count)
+                ]
+            }
+        }
+    }
+    for i in range(files_count):
+        files[BASE / f"s{i}.toml"] = {f"s{i}_key_{k}": k for k in range(keys)}
+    return files
+
+
+def deep_addressing(depth: int, imports: int) -> Graph:
+    """A root importing `imports` values addressed `depth` tables deep
+    (`data.toml::l0.l1...`), each into its own table."""
+    data = leaf = {}
+    for i in range(depth):
+        leaf[f"l{i}"] = {f"value_{j}": j for j in range(imports)}
+        leaf = leaf[f"l{i}"]
+    address = ".".join(f"l{i}" for i in range(depth))
+    return {
+        ROOT: {
+            f"t{j}": {"imports": [{"import": f"data.toml::{address}.value_{j}"}]}
+            for j in range(imports)
+        },
+        BASE / "data.toml": data,
+    }
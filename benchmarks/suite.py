@@ -0,0 +1,158 @@
+"""Benchmark suite for `resolve_config` on synthetic import graphs.
+
+For each scenario it reports the best and median wall time, the peak
+memory allocated during one run (tracemalloc) and the number of loader
+calls. Results can be saved as JSON and compared with an earlier run:
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --compare results.json
+    python benchmarks/suite.py --filter diamond --repeat 20 --scale 0.5
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from importlib import metadata
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generators import (  # noqa: E402
+    ROOT,
+    Graph,
+    deep_addressing,
+    deep_chain,
+    diamond_dag,
+    fan_out_tree,
+    huge_file,
+    star_merges,
+    wide_fan_out,
+)
+from reconfig import resolve_config  # noqa: E402
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def n(size: int, scale: float) -> int:
+    return max(1, round(size * scale))
+
+
+# name -> graph factory taking the size scale
+SCENARIOS: dict[str, Callable[[float], Graph]] = {
+    "wide fan-out": lambda s: wide_fan_out(n(500, s), 40),
+    "fan-out tree": lambda s: fan_out_tree(4, n(8, s)),
+    "deep chain": lambda s: deep_chain(n(2000, s)),
+    "deep chain, nested tables": lambda s: deep_chain(n(200, s), depth=50),
+    "diamond DAG": lambda s: diamond_dag(5, n(6, s)),
+    "huge single file": lambda s: huge_file(n(20000, s), 10),
+    "star merges": lambda s: star_merges(n(500, s), 20),
+    "deep addressing": lambda s: deep_addressing(n(200, s), 200),
+}
+
+
+def run_scenario(name: str, files: Graph, repeat: int) -> dict:
+    calls: Counter[Path] = Counter()
+
+    def loader(path: Path) -> dict:
+        calls[path] += 1
+        return files[path]
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resolve_config(ROOT, loader=loader)
+        times.append(time.perf_counter() - start)
+
+    calls.clear()
+    tracemalloc.start()
+    result = resolve_config(ROOT, loader=loader)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        "name": name,
+        "files": len(files),
+        "best_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_bytes": peak,
+        "loader_calls": sum(calls.values()),
+        "files_loaded": len(calls),
+    }
+
+
+def run(scale: float, repeat: int, name_filter: str | None) -> dict:
+    results = []
+    for name, factory in SCENARIOS.items():
+        if name_filter and name_filter not in name:
+            continue
+        result = run_scenario(name, factory(scale), repeat)
+        results.append(result)
+        print(
+            f"{name:<28} {result['files']:6} files "
+            f"{result['best_s'] * 1000:10.2f} ms "
+            f"{result['peak_bytes'] / 2**20:9.2f} MiB "
+            f"{result['loader_calls']:7} loads",
+            flush=True,
+        )
+    return {
+        "format": RESULTS_FORMAT_VERSION,
+        "reconfig": reconfig_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "repeat": repeat,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+
+
+def reconfig_version() -> str | None:
+    try:
+        return metadata.version("reconfig")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def compare(old: dict, new: dict) -> None:
+    """Print the new results relative to the old ones, scenario by scenario."""
+    if old.get("scale") != new["scale"]:
+        print(f"warning: scale {old.get('scale')} vs {new['scale']}")
+    previous = {r["name"]: r for r in old["results"]}
+    print(f"\n{'scenario':<28} {'time':>8} {'memory':>8} {'loads':>12}")
+    for r in new["results"]:
+        o = previous.get(r["name"])
+        if o is None:
+            print(f"{r['name']:<28} {'new':>8}")
+            continue
+        print(
+            f"{r['name']:<28} {r['best_s'] / o['best_s']:7.2f}x "
+            f"{r['peak_bytes'] / max(o['peak_bytes'], 1):7.2f}x "
+            f"{o['loader_calls']:>5} -> {r['loader_calls']:<5}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="earlier results to compare")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="size factor")
+    parser.add_argument("--filter", help="only scenarios whose name contains this")
+    args = parser.parse_args()
+
+    results = run(args.scale, args.repeat, args.filter)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        compare(json.loads(args.compare.read_text()), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,176 @@
+import functools
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from reconfig.reconfig import Loader, resolve, load_toml_dict
+from reconfig import disk_cache
+from reconfig.async_reconfig import AsyncLoader, resolve_config_async
+from reconfig.batch import resolve_many
+from reconfig.diff import MISSING, Change, diff
+from reconfig.frozen import FrozenTable, freeze
+from reconfig.import_graph import GraphEdge, ImportGraph, graph
+from reconfig.lazy import LazyTable, resolve_config_lazy, select_paths
+from reconfig.loaders import load_config_dict, load_toml_dict, toml_loader
+from reconfig.prefetch import preloaded_loader, prefetch
+from reconfig.profiler import FileProfile, Profiler
+from reconfig.provenance import Origin, Provenance
+from reconfig.reconfig import (
+    ImportEdge,
+    Loader,
+    ResolveCache,
+    compacting_loader,
+    resolve,
+)
+from reconfig.resolver import Resolver
+from reconfig.watch import ConfigWatcher
 
+__all__ = [
+    "AsyncLoader",
+    "Change",
+    "ConfigWatcher",
+    "FileProfile",
+    "FrozenTable",
+    "GraphEdge",
+    "ImportEdge",
+    "ImportGraph",
+    "LazyTable",
+    "Loader",
+    "MISSING",
+    "Origin",
+    "Provenance",
+    "Profiler",
+    "ResolveCache",
+    "Resolver",
+    "compacting_loader",
+    "diff",
+    "freeze",
+    "graph",
+    "load_config_dict",
+    "load_toml_dict",
+    "resolve",
+    "resolve_config",
+    "resolve_config_async",
+    "resolve_many",
+    "toml_loader",
+]
+
+# files per process pool task; larger batches save round trips, smaller
+# ones spread the files of one importer over more processes
+PARSE_BATCH_SIZE = 16
+
+
+def resolve_config(
+    root_path: Path,
+    loader: Loader = load_config_dict,
+    cache_dir: Path | None = None,
+    max_workers: int | None = None,
+    trust_absolute_paths: bool = False,
+    lazy: bool = False,
+    select: Iterable[str] | None = None,
+    frozen: bool = False,
+    intern_strings: bool = False,
+    compact_arrays: bool = False,
+    profiler: Profiler | None = None,
+    provenance: Provenance | None = None,
+    processes: int | None = None,
+    cache_key: str | None = None,
+) -> dict | LazyTable | FrozenTable:
+    compact = intern_strings or compact_arrays
+    if lazy or select is not None:
+        if (
+            cache_dir is not None
+            or max_workers is not None
+            or processes is not None
+            or profiler is not None
+            or provenance is not None
+        ):
+            raise ValueError(
+                "lazy and select cannot be combined with cache_dir, max_workers, "
+                "processes, profiler or provenance"
+            )
+        if lazy and frozen:
+            raise ValueError("lazy cannot be combined with frozen")
+        if compact:
+            loader = compacting_loader(loader, intern_strings, compact_arrays)
+        table = resolve_config_lazy(root_path, loader, trust_absolute_paths)
+        if select is not None:
+            selected = select_paths(table, select)
+            return freeze(selected) if frozen else selected
+        return table
+
+    if max_workers is not None and processes is not None:
+        raise ValueError("max_workers cannot be combined with processes")
+    if profiler is not None and processes is not None:
+        # the files would be parsed in the workers, out of the profiler's sight
+        raise ValueError("profiler cannot be combined with processes")
 
-def resolve_config(root_path: Path, loader: Loader = load_toml_dict) -> dict:
     root_path = root_path.resolve()
     base_path = root_path.parent
-    initial_data = loader(root_path)
-    return resolve(
+
+    if cache_dir is not None:
+        # options that change the result need their own cache entry
+        variant = ",".join(
+            name
+            for name, enabled in [
+                ("intern_strings", intern_strings),
+                ("compact_arrays", compact_arrays),
+                ("frozen", frozen),
+                ("trust_absolute_paths", trust_absolute_paths),
+            ]
+            if enabled
+        )
+        cache_file = disk_cache.cache_file_for(
+            Path(cache_dir), root_path, loader, variant, cache_key
+        )
+        # a cache hit resolves nothing, so it would leave provenance empty
+        cached = None
+        if provenance is None:
+            cached = disk_cache.read_cache(cache_file, trust_absolute_paths)
+        if cached is not None:
+            return freeze(cached) if frozen else cached
+
+    if processes is not None:
+        # parse every reachable file on a process pool; the wrappers below
+        # and the merge run in this process on the parsed data
+        parsed = ResolveCache(trust_absolute_paths=trust_absolute_paths)
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            prefetch([root_path], loader, parsed, executor, batch_size=PARSE_BATCH_SIZE)
+        loader = preloaded_loader(parsed.loaded, loader)
+
+    # the profiler wraps the loader itself, so it can tell reading from parsing
+    if profiler is not None:
+        loader = profiler.loader(loader)
+    if cache_dir is not None:
+        fingerprints = {}
+        loader = disk_cache.fingerprinting_loader(loader, fingerprints)
+    if compact:
+        loader = compacting_loader(loader, intern_strings, compact_arrays)
+
+    # frozen output cannot be mutated, so imports of the same file may share
+    # their resolved data instead of each getting a copy
+    cache = ResolveCache(
+        trust_absolute_paths=trust_absolute_paths,
+        copy_hits=not frozen,
+        profiler=profiler,
+        provenance=provenance,
+        finalize=functools.partial(freeze, interned={}) if frozen else None,
+    )
+    if processes is not None:
+        cache.paths = parsed.paths
+    if provenance is not None:
+        provenance.files.clear()
+    if max_workers is not None:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            prefetch([root_path], loader, cache, executor)
+
+    initial_data = cache.load(root_path, loader)
+    result = resolve(
         base_path=base_path,
         initial_data=initial_data,
         import_path_stack=[root_path],
         loader=loader,
+        cache=cache,
     )
+
+    if cache_dir is not None:
+        disk_cache.write_cache(cache_file, fingerprints, result, cache.paths)
+    return result
@@ -0,0 +1,154 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from reconfig.import_types import BaseImport, detect_import
+from reconfig.loaders import load_config_dict, load_toml_dict
+from reconfig.reconfig import build_extender, copy_tree, resolve_path
+
+
+type AsyncLoader = Callable[[Path], Awaitable[dict]]
+
+
+async def load_toml_dict_async(path: Path) -> dict:
+    return await asyncio.to_thread(load_toml_dict, path)
+
+
+async def load_config_dict_async(path: Path) -> dict:
+    return await asyncio.to_thread(load_config_dict, path)
+
+
+@dataclass
+class AsyncResolveCache:
+    """Async counterpart of `ResolveCache`.
+
+    `loads` holds one task per path, so concurrent imports of the same file
+    share a single in-flight load.
+    """
+
+    loads: dict[Path, asyncio.Task] = field(default_factory=dict)
+    resolved: dict[Path, dict] = field(default_factory=dict)
+
+    def load(self, path: Path, loader: AsyncLoader) -> asyncio.Task:
+        if path not in self.loads:
+            self.loads[path] = asyncio.ensure_future(loader(path))
+        return self.loads[path]
+
+
+async def resolve_child_async(
+    base_path: Path,
+    ch_imp_dict: dict,
+    import_path_stack: list[Path],
+    loader: AsyncLoader,
+    cache: AsyncResolveCache,
+) -> tuple[BaseImport, dict, bool]:
+    """Load and resolve one import; the flag tells if the data came from cache."""
+    ch_imp = detect_import(ch_imp_dict)
+    ch_abs_fn = resolve_path(base_path, ch_imp.path_string)
+    if ch_abs_fn in import_path_stack:
+        raise ValueError(
+            f"Circular import detected: {' -> '.join(str(p) for p in import_path_stack + [ch_abs_fn])}"
+        )
+    if ch_abs_fn in cache.resolved:
+        return ch_imp, cache.resolved[ch_abs_fn], True
+
+    ch_initial_data = await cache.load(ch_abs_fn, loader)
+    ch_resolved_data = await resolve_async(
+        base_path=ch_abs_fn.parent,
+        initial_data=ch_initial_data,
+        import_path_stack=import_path_stack + [ch_abs_fn],
+        loader=loader,
+        cache=cache,
+    )
+    # a concurrent sibling may have stored its own copy first; ours is unshared
+    cache.resolved.setdefault(ch_abs_fn, ch_resolved_data)
+    return ch_imp, ch_resolved_data, False
+
+
+async def resolve_async(
+    base_path: Path,
+    initial_data: dict,
+    import_path_stack: list[Path],
+    loader: AsyncLoader,
+    delete_imports_from_result: bool = True,
+    cache: AsyncResolveCache | None = None,
+) -> dict:
+    """Async version of `resolve`.
+
+    All imports and child environments of a table are resolved concurrently,
+    but their results are merged in the original order, and the first failure
+    in that order is raised. Output and errors are the same as `resolve`.
+    """
+    cache = AsyncResolveCache() if cache is None else cache
+
+    child_envs = {
+        name: val for name, val in initial_data.items() if isinstance(val, dict)
+    }
+    child_imports_list = initial_data.get("imports", [])
+
+    output_data = initial_data.copy()
+    if delete_imports_from_result and "imports" in output_data:
+        del output_data["imports"]
+
+    import_results, env_results = await asyncio.gather(
+        asyncio.gather(
+            *(
+                resolve_child_async(
+                    base_path, ch_imp_dict, import_path_stack, loader, cache
+                )
+                for ch_imp_dict in child_imports_list
+            ),
+            return_exceptions=True,
+        ),
+        asyncio.gather(
+            *(
+                resolve_async(
+                    base_path=base_path,
+                    initial_data=ch_data,
+                    import_path_stack=import_path_stack,
+                    loader=loader,
+                    cache=cache,
+                )
+                for ch_data in child_envs.values()
+            ),
+            return_exceptions=True,
+        ),
+    )
+
+    for result in import_results:
+        if isinstance(result, BaseException):
+            raise result
+        ch_imp, ch_resolved_data, hit = result
+        ch_extender = build_extender(ch_imp, ch_resolved_data)
+        if hit:
+            ch_extender = copy_tree(ch_extender)
+
+        if set(ch_extender) & set(output_data):
+            raise ValueError(
+                f"Import conflict: keys {set(ch_extender) & set(output_data)} already exist in the output data."
+            )
+
+        output_data.update(ch_extender)
+
+    for name, result in zip(child_envs, env_results):
+        if isinstance(result, BaseException):
+            raise result
+        output_data[name] = result
+
+    return output_data
+
+
+async def resolve_config_async(
+    root_path: Path, loader: AsyncLoader = load_config_dict_async
+) -> dict:
+    root_path = root_path.resolve()
+    cache = AsyncResolveCache()
+    initial_data = await cache.load(root_path, loader)
+    return await resolve_async(
+        base_path=root_path.parent,
+        initial_data=initial_data,
+        import_path_stack=[root_path],
+        loader=loader,
+        cache=cache,
+    )
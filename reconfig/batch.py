@@ -0,0 +1,142 @@
+import functools
+import pickle
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from reconfig.frozen import FrozenTable, freeze
+from reconfig.prefetch import prefetch
+from reconfig.loaders import Loader, load_config_dict
+from reconfig.reconfig import ResolveCache, copy_tree, resolve
+
+
+def resolve_many(
+    root_paths: Iterable[Path],
+    loader: Loader = load_config_dict,
+    max_workers: int | None = None,
+    processes: int | None = None,
+    trust_absolute_paths: bool = False,
+    frozen: bool = False,
+) -> dict[Path, dict | FrozenTable | Exception]:
+    """Resolve many root files against one shared cache.
+
+    Every file is loaded and resolved once for the whole batch, however
+    many roots import it. The result maps each root, as given, to its
+    resolved config or to the exception its resolution raised; a root
+    that fails does not stop the others.
+
+    `max_workers` loads the files of all roots on a thread pool first, as
+    in `resolve_config`. `processes` splits the roots into that many
+    contiguous chunks, each resolved in its own process with its own
+    cache; `loader` must then be picklable. With `frozen`, the results
+    share the tables of the files they have in common.
+    """
+    root_paths = list(root_paths)
+    if processes is not None:
+        return _resolve_in_processes(
+            root_paths, loader, processes, max_workers, trust_absolute_paths, frozen
+        )
+
+    cache = ResolveCache(
+        trust_absolute_paths=trust_absolute_paths,
+        copy_hits=not frozen,
+        finalize=functools.partial(freeze, interned={}) if frozen else None,
+    )
+    absolute = [root_path.resolve() for root_path in root_paths]
+    if max_workers is not None:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            prefetch(absolute, loader, cache, executor)
+
+    results: dict[Path, dict | FrozenTable | Exception] = {}
+    for root_path, abs_path in zip(root_paths, absolute):
+        if abs_path in cache.resolved:
+            # imported by an earlier root: a hit like any other import
+            result = cache.resolved[abs_path]
+            results[root_path] = copy_tree(result) if cache.copy_hits else result
+            continue
+        try:
+            result = resolve(
+                base_path=abs_path.parent,
+                initial_data=cache.load(abs_path, loader),
+                import_path_stack=[abs_path],
+                loader=loader,
+                cache=cache,
+            )
+        except Exception as e:
+            result = e
+        else:
+            # so that later roots importing this one get a copy of it
+            cache.resolved[abs_path] = result
+        results[root_path] = result
+    return results
+
+
+def _resolve_in_processes(
+    root_paths: list[Path],
+    loader: Loader,
+    processes: int,
+    max_workers: int | None,
+    trust_absolute_paths: bool,
+    frozen: bool,
+) -> dict[Path, dict | FrozenTable | Exception]:
+    # contiguous chunks keep roots that sit next to each other, and so
+    # likely import the same files, in the same process
+    size = -(-len(root_paths) // processes) or 1
+    chunks = [root_paths[i : i + size] for i in range(0, len(root_paths), size)]
+    results: dict[Path, dict | FrozenTable | Exception] = {}
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(
+                _resolve_chunk,
+                chunk,
+                loader,
+                max_workers,
+                trust_absolute_paths,
+                frozen,
+            )
+            for chunk in chunks
+        ]
+        for chunk, future in zip(chunks, futures):
+            try:
+                results.update(future.result())
+            except Exception as e:
+                # e.g. a crashed worker or a result that cannot be pickled
+                results.update((root_path, e) for root_path in chunk)
+    return results
+
+
+def _resolve_chunk(
+    root_paths: list[Path],
+    loader: Loader,
+    max_workers: int | None,
+    trust_absolute_paths: bool,
+    frozen: bool,
+) -> dict[Path, dict | FrozenTable | Exception]:
+    """`resolve_many` in a worker, with every error made picklable so that
+    one root's error cannot fail the whole chunk."""
+    results = resolve_many(
+        root_paths, loader, max_workers, None, trust_absolute_paths, frozen
+    )
+    return {
+        root_path: _picklable(result) if isinstance(result, Exception) else result
+        for root_path, result in results.items()
+    }
+
+
+def _picklable(error: Exception) -> Exception:
+    """`error`, or if it cannot be pickled, an exception of its nearest
+    built-in base class whose message names the original type."""
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        pass
+    name = f"{type(error).__module__}.{type(error).__qualname__}"
+    for base in type(error).__mro__:
+        if base.__module__ == "builtins":
+            try:
+                return base(f"{name}: {error}")
+            except TypeError:
+                # e.g. UnicodeDecodeError, which takes more arguments
+                continue
+    return Exception(f"{name}: {error}")
@@ -0,0 +1,57 @@
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+# `old` of an added key and `new` of a removed one
+MISSING: Any = _Missing()
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    path: tuple[str | int, ...]
+    old: Any
+    new: Any
+
+
+def diff(old: Any, new: Any) -> Iterator[Change]:
+    """Yield the changed values between two resolved configs, depth-first.
+
+    Within a table the keys of `old` come first, in order, then the keys
+    that only `new` has.
+
+    Tables are compared key by key and arrays of the same length item by
+    item; any other difference, including a changed type, is reported at
+    the path where it occurs. Subtrees that are the same object in both
+    configs are skipped without being walked. Results of a frozen
+    `Resolver` share the tables of every file that did not change, so
+    comparing two of them costs about as much as the changed files.
+    """
+    todo: list[tuple[tuple[str | int, ...], Any, Any]] = [((), old, new)]
+    while todo:
+        path, a, b = todo.pop()
+        if a is b:
+            continue
+        if isinstance(a, Mapping) and isinstance(b, Mapping):
+            children = [(path + (k,), v, b.get(k, MISSING)) for k, v in a.items()]
+            children.extend(
+                (path + (k,), MISSING, v) for k, v in b.items() if k not in a
+            )
+            children.reverse()
+            todo.extend(children)
+        elif _is_array(a) and _is_array(b) and len(a) == len(b):
+            children = [(path + (i,), x, y) for i, (x, y) in enumerate(zip(a, b))]
+            children.reverse()
+            todo.extend(children)
+        elif type(a) is not type(b) or (a != b and not (a != a and b != b)):
+            # (nan is the only value that differs from itself)
+            yield Change(path, a, b)
+
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, (list, tuple))
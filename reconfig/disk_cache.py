@@ -0,0 +1,148 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from reconfig.reconfig import Loader, resolve_path
+
+
+CACHE_FORMAT_VERSION = 2
+
+# (st_mtime_ns, st_size)
+type StatFingerprint = tuple[int, int]
+
+
+def stat_fingerprint(path: Path) -> StatFingerprint:
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def content_digest(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def cache_file_for(
+    cache_dir: Path,
+    root_path: Path,
+    loader: Loader,
+    variant: str = "",
+    loader_key: str | None = None,
+) -> Path:
+    """Cache entries are keyed by the absolute root path, the loader and
+    `variant`, which names options that change the result.
+
+    The loader is identified by `loader_key`, or else by its qualified
+    name. Lambdas and nested functions cannot be told apart by name, so
+    they need a `loader_key`.
+    """
+    if loader_key is None:
+        qualname = loader.__qualname__
+        if "<lambda>" in qualname or "<locals>" in qualname:
+            raise ValueError(
+                f"Cannot name loader {qualname} in the disk cache; pass cache_key."
+            )
+        loader_key = f"{loader.__module__}.{qualname}"
+    name = f"{root_path}\0{loader_key}"
+    if variant:
+        name += f"\0{variant}"
+    key = hashlib.sha256(name.encode()).hexdigest()
+    return cache_dir / f"{key}.pickle"
+
+
+def fingerprinting_loader(
+    loader: Loader, fingerprints: dict[Path, StatFingerprint]
+) -> Loader:
+    """Wrap `loader` so that every file is stat'ed right before it is read."""
+
+    def wrapped(path: Path) -> dict:
+        fingerprints[path] = stat_fingerprint(path)
+        return loader(path)
+
+    return wrapped
+
+
+def read_cache(cache_file: Path, trust_absolute_paths: bool = False) -> dict | None:
+    """Return the cached result if every dependency is unchanged, else None.
+
+    A dependency whose stat fingerprint changed but whose content digest did
+    not (e.g. a deploy that rewrites identical files) still counts as
+    unchanged, and its new fingerprint is written back. Every import path
+    must also still resolve to the same file, so re-pointing a symlink
+    invalidates the entry.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if entry.get("version") != CACHE_FORMAT_VERSION:
+        return None
+    try:
+        for (base_path, import_path), target in entry["paths"].items():
+            if resolve_path(base_path, import_path, trust_absolute_paths) != target:
+                return None
+    except OSError:
+        return None
+
+    refreshed = False
+    dependencies = entry["dependencies"]
+    for path, (fingerprint, digest) in dependencies.items():
+        try:
+            current = stat_fingerprint(path)
+            if current == fingerprint:
+                continue
+            if current[1] != fingerprint[1] or content_digest(path) != digest:
+                return None
+        except OSError:
+            return None
+        dependencies[path] = (current, digest)
+        refreshed = True
+
+    if refreshed:
+        _write_entry(cache_file, entry)
+    return entry["result"]
+
+
+def write_cache(
+    cache_file: Path,
+    fingerprints: dict[Path, StatFingerprint],
+    result: dict,
+    paths: dict[tuple[Path, str], Path] | None = None,
+) -> bool:
+    """Store `result` with the fingerprints of the files it was built from
+    and `paths`, what each import path resolved to (`ResolveCache.paths`).
+
+    Nothing is written if a file changed while it was being resolved.
+    """
+    dependencies = {}
+    try:
+        for path, fingerprint in fingerprints.items():
+            digest = content_digest(path)
+            if stat_fingerprint(path) != fingerprint:
+                return False
+            dependencies[path] = (fingerprint, digest)
+    except OSError:
+        return False
+
+    entry = {
+        "version": CACHE_FORMAT_VERSION,
+        "dependencies": dependencies,
+        "paths": dict(paths or {}),
+        "result": result,
+    }
+    _write_entry(cache_file, entry)
+    return True
+
+
+def _write_entry(cache_file: Path, entry: dict) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
@@ -0,0 +1,121 @@
+import datetime
+from array import array
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from reconfig.lazy import materialize
+
+
+class FrozenTable(Mapping):
+    """Immutable, hashable table of a config resolved with `frozen=True`.
+
+    Compares equal to any mapping with the same items, like a dict does.
+    """
+
+    __slots__ = ("_data", "_hash")
+
+    def __init__(self, data: Mapping | Any = ()):
+        self._data = dict(data)
+        self._hash: int | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenTable):
+            return self is other or self._data == other._data
+        if isinstance(other, dict):
+            return self._data == other
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"FrozenTable({self._data!r})"
+
+    def __reduce__(self):
+        return (FrozenTable, (self._data,))
+
+    def to_dict(self) -> dict:
+        """A mutable copy, with tables as dicts and arrays as lists."""
+        return materialize(self)
+
+
+def _intern_key(value: Any) -> Any:
+    # frozen containers are already interned, so their identity is enough;
+    # scalars carry their type so that 1, 1.0 and True stay apart
+    if isinstance(value, (FrozenTable, tuple)):
+        return id(value)
+    if isinstance(value, float):
+        return (float, value.hex())
+    if isinstance(value, (datetime.datetime, datetime.time)):
+        # aware values with different offsets compare equal when they are
+        # the same instant, but they are different values in a config
+        return (type(value), value.isoformat(), value.tzinfo)
+    return (type(value), value)
+
+
+def _mutable(value: Any) -> bool:
+    return isinstance(value, (Mapping, list, array)) and not isinstance(
+        value, FrozenTable
+    )
+
+
+def freeze(value: Any, interned: dict | None = None) -> Any:
+    """Turn tables into `FrozenTable`s and lists and arrays into tuples.
+
+    Equal subtrees, compared by type and key order, become one shared
+    object, so identical files imported from many places are stored once.
+    Pass the same `interned` dict to several calls to share subtrees
+    between their results. `FrozenTable`s and tuples are taken as already
+    frozen and are not walked again.
+    """
+    if not _mutable(value):
+        return value
+    interned = {} if interned is None else interned
+
+    # id of an input container -> its frozen counterpart; children are
+    # frozen before their parents
+    frozen: dict[int, Any] = {}
+    todo: list[tuple[Any, bool]] = [(value, False)]
+    while todo:
+        container, children_done = todo.pop()
+        if id(container) in frozen:
+            continue
+        children = container.values() if isinstance(container, Mapping) else container
+        if not children_done:
+            todo.append((container, True))
+            todo.extend(
+                (child, False)
+                for child in children
+                if _mutable(child) and id(child) not in frozen
+            )
+            continue
+
+        if isinstance(container, Mapping):
+            items = tuple(
+                (key, frozen.get(id(child), child)) for key, child in container.items()
+            )
+            key = (FrozenTable, tuple((k, _intern_key(v)) for k, v in items))
+            if key not in interned:
+                interned[key] = FrozenTable(items)
+        else:
+            items = tuple(frozen.get(id(child), child) for child in container)
+            key = (tuple, tuple(_intern_key(v) for v in items))
+            if key not in interned:
+                interned[key] = items
+        frozen[id(container)] = interned[key]
+
+    return frozen[id(value)]
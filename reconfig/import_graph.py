@@ -0,0 +1,173 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from reconfig.import_types import BaseImport, detect_import
+from reconfig.prefetch import prefetch
+from reconfig.loaders import Loader, load_config_dict
+from reconfig.reconfig import ImportEdge, ResolveCache
+
+
+@dataclass(frozen=True, slots=True)
+class GraphEdge:
+    """One import: `parent` imports `child` with `imp`, which is written in
+    the `imports` list of the table at key path `table` of `parent`."""
+
+    parent: Path
+    child: Path
+    imp: BaseImport
+    table: tuple[str, ...]
+
+
+@dataclass
+class ImportGraph:
+    """The files reachable from `root` and the imports between them.
+
+    `edges` are in resolution order: the files in the order they were
+    found, and the imports of each file in the order `resolve` merges them.
+    They are `GraphEdge`s when built by `graph`, and the `ImportEdge`s of
+    the last resolution when built by `Resolver.graph`.
+    """
+
+    root: Path
+    edges: list[GraphEdge] | list[ImportEdge]
+
+    @property
+    def files(self) -> list[Path]:
+        """The root and every file it reaches, in the order they were found."""
+        return list(dict.fromkeys([self.root] + [edge.child for edge in self.edges]))
+
+    def imports(self) -> dict[Path, list[GraphEdge] | list[ImportEdge]]:
+        """Map each file to the edges of its own imports, in order."""
+        imports: dict[Path, list[GraphEdge]] = {path: [] for path in self.files}
+        for edge in self.edges:
+            imports[edge.parent].append(edge)
+        return imports
+
+    def importers(self) -> dict[Path, set[Path]]:
+        """Map each file to the set of files that import it directly."""
+        importers: dict[Path, set[Path]] = {}
+        for edge in self.edges:
+            importers.setdefault(edge.child, set()).add(edge.parent)
+        return importers
+
+    def affected(self, changed: Iterable[Path]) -> set[Path]:
+        """The changed files plus every file that transitively imports one."""
+        importers = self.importers()
+        affected = set()
+        todo = [Path(p).resolve() for p in changed]
+        while todo:
+            path = todo.pop()
+            if path in affected:
+                continue
+            affected.add(path)
+            todo.extend(importers.get(path, ()))
+        return affected
+
+    def cycles(self) -> list[list[Path]]:
+        """Every circular import found, as the list of files along it from
+        the first file back to itself; empty if the graph is a DAG."""
+        return self._walk()[1]
+
+    def topological_order(self) -> list[Path]:
+        """All files, each after every file it imports, ending with the root.
+
+        This is the order in which `resolve` finishes the files. Raises
+        `ValueError` with the full cycle if there is a circular import.
+        """
+        order, cycles = self._walk()
+        if cycles:
+            raise ValueError(
+                f"Circular import detected: {' -> '.join(str(p) for p in cycles[0])}"
+            )
+        return order
+
+    def _walk(self) -> tuple[list[Path], list[list[Path]]]:
+        """Depth-first post-order from the root, and the cycles closed by
+        imports of a file that is still on the chain."""
+        imports = self.imports()
+        order: list[Path] = []
+        cycles: dict[tuple[Path, ...], None] = {}
+        done: set[Path] = set()
+        chain = [self.root]
+        on_chain = {self.root}
+        stack = [iter(imports[self.root])]
+        while stack:
+            for edge in stack[-1]:
+                child = edge.child
+                if child in on_chain:
+                    cycle = chain[chain.index(child) :] + [child]
+                    cycles.setdefault(tuple(cycle))
+                elif child not in done:
+                    chain.append(child)
+                    on_chain.add(child)
+                    stack.append(iter(imports[child]))
+                    break
+            else:
+                stack.pop()
+                path = chain.pop()
+                on_chain.discard(path)
+                done.add(path)
+                order.append(path)
+        return order, [list(cycle) for cycle in cycles]
+
+
+def table_imports(
+    data: dict, compiled: dict[int, list[BaseImport | dict]]
+) -> Iterator[tuple[tuple[str, ...], BaseImport]]:
+    """Yield the imports of `data` and its nested tables with the key path
+    of their table, in the order `resolve` merges them.
+
+    `compiled` is the `compile_imports` result of `data`; only the tables
+    it lists are visited.
+    """
+    todo: list[tuple[tuple[str, ...], dict]] = [((), data)]
+    while todo:
+        keys, table = todo.pop()
+        for imp in compiled.get(id(table), ()):
+            # a definition compile_imports rejected raises here
+            yield keys, imp if isinstance(imp, BaseImport) else detect_import(imp)
+        children = [
+            (keys + (k,), v)
+            for k, v in table.items()
+            if isinstance(v, dict) and id(v) in compiled
+        ]
+        children.reverse()
+        todo.extend(children)
+
+
+def graph(
+    root_path: Path,
+    loader: Loader = load_config_dict,
+    trust_absolute_paths: bool = False,
+    max_workers: int | None = None,
+) -> ImportGraph:
+    """Load every file reachable from `root_path` and return the import
+    graph, without merging any values.
+
+    Circular imports do not raise here; see `ImportGraph.cycles`. Invalid
+    import definitions and load errors raise as in `resolve_config`.
+    """
+    root = root_path.resolve()
+    cache = ResolveCache(trust_absolute_paths=trust_absolute_paths)
+    if max_workers is not None:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            prefetch([root], loader, cache, executor)
+
+    edges = []
+    seen = {root}
+    todo = deque([root])
+    while todo:
+        path = todo.popleft()
+        data = cache.load(path, loader)
+        for table, imp in table_imports(data, cache.compiled_of(path)):
+            child = cache.resolve_path(path.parent, imp.path_string)
+            edges.append(GraphEdge(path, child, imp, table))
+            if child not in seen:
+                seen.add(child)
+                todo.append(child)
+        # the data is not needed once its imports are known
+        cache.evict(path)
+    return ImportGraph(root, edges)
@@ -1,55 +1,54 @@
-from dataclasses import dataclass
-from typing import Protocol
+from dataclasses import dataclass, field
 
 
-class BaseImport(Protocol):
-    import_string: str
+@dataclass(frozen=True, slots=True)
+class BaseImport:
+    """Common part of all import specs.
+
+    `path_string` and `inside_address` are parsed from `import_string` once,
+    when the import is created.
+    """
 
-    @property
-    def path_string(self) -> str:
-        return self.import_string.split("::")[0]
+    import_string: str
+    path_string: str = field(init=False, repr=False, compare=False)
+    inside_address: tuple[str, ...] = field(init=False, repr=False, compare=False)
 
-    @property
-    def inside_address(self) -> list[str]:
+    def __post_init__(self) -> None:
         parts = self.import_string.split("::")
-        if len(parts) <= 1:
-            return []
-        return parts[1].split(".")
+        inside_address = tuple(parts[1].split(".")) if len(parts) > 1 else ()
+        object.__setattr__(self, "path_string", parts[0])
+        object.__setattr__(self, "inside_address", inside_address)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Import(BaseImport):
-    import_string: str
+    pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImportAs(BaseImport):
-    import_string: str
     as_name: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FromImportOne(BaseImport):
-    import_string: str
     import_name: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FromImportOneAs(BaseImport):
-    import_string: str
     import_name: str
     as_name: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FromImportMany(BaseImport):
-    import_string: str
-    import_names: list[str]
+    import_names: tuple[str, ...]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FromImportStar(BaseImport):
-    import_string: str
+    pass
 
 
 def detect_import(import_dict: dict) -> BaseImport:
@@ -61,7 +60,9 @@ def detect_import(import_dict: dict) -> BaseImport:
         case {"from": from_str, "import": "*"}:
             return FromImportStar(import_string=from_str)
         case {"from": from_str, "import": [*import_names]}:
-            return FromImportMany(import_string=from_str, import_names=import_names)
+            return FromImportMany(
+                import_string=from_str, import_names=tuple(import_names)
+            )
         case {"from": from_str, "import": import_name}:
             return FromImportOne(import_string=from_str, import_name=import_name)
         case {"import": import_str, "as": as_name}:
@@ -70,3 +71,35 @@ def detect_import(import_dict: dict) -> BaseImport:
             return Import(import_string=import_str)
         case _:
             raise ValueError(f"Invalid import definition: {import_dict}")
+
+
+def compile_imports(data: dict) -> dict[int, list[BaseImport | dict]]:
+    """Parse the `imports` lists of `data` and its nested tables once.
+
+    The result maps the id of every table that has an `imports` key somewhere
+    in its subtree to the parsed imports of that table (empty if the table
+    only has imports further down). Every other table needs no resolving.
+
+    An import definition that `detect_import` rejects is kept as the raw
+    dict, so that the error is raised when resolution reaches it.
+    """
+    # pre-order walk; reversed, every table comes after all of its children
+    order = []
+    todo: list[tuple[dict, dict | None]] = [(data, None)]
+    while todo:
+        table, parent = todo.pop()
+        order.append((table, parent))
+        todo.extend((v, table) for v in table.values() if isinstance(v, dict))
+
+    compiled: dict[int, list[BaseImport | dict]] = {}
+    for table, parent in reversed(order):
+        if "imports" in table:
+            imports = compiled[id(table)] = []
+            for import_dict in table["imports"]:
+                try:
+                    imports.append(detect_import(import_dict))
+                except ValueError:
+                    imports.append(import_dict)
+        if id(table) in compiled and parent is not None:
+            compiled.setdefault(id(parent), [])
+    return compiled
@@ -0,0 +1,308 @@
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from reconfig.import_types import (
+    BaseImport,
+    FromImportMany,
+    FromImportOne,
+    FromImportOneAs,
+    FromImportStar,
+    Import,
+    ImportAs,
+    detect_import,
+)
+from reconfig.reconfig import Loader, ResolveCache, resolve_inner_path
+
+
+def import_names(imp: BaseImport) -> tuple[str, ...] | None:
+    """The keys an import adds to its table, or None for a star import,
+    whose keys are only known once the imported file is loaded."""
+    match imp:
+        case Import():
+            if not imp.inside_address:
+                return (Path(imp.path_string).stem,)
+            return (imp.inside_address[-1],)
+        case ImportAs(as_name=as_name) | FromImportOneAs(as_name=as_name):
+            return (as_name,)
+        case FromImportOne(import_name=import_name):
+            return (import_name,)
+        case FromImportMany(import_names=names):
+            return names
+        case FromImportStar():
+            return None
+    raise ValueError(f"Unsupported import type: {imp}")
+
+
+@dataclass
+class LazyContext:
+    """State shared by all lazy tables of one `resolve_config_lazy` call."""
+
+    loader: Loader
+    cache: ResolveCache = field(default_factory=ResolveCache)
+    files: dict[Path, "LazyTable"] = field(default_factory=dict)
+    # the imports between files that were followed so far, both ways
+    imports: dict[Path, set[Path]] = field(default_factory=dict)
+    importers: dict[Path, set[Path]] = field(default_factory=dict)
+
+    def file_table(self, path: Path) -> "LazyTable":
+        # a table lists its keys when it is created, which needs the files
+        # it star-imports; create those first, deepest first, from an
+        # explicit stack so that a long chain of star imports cannot hit
+        # the recursion limit
+        todo = [(path, (path,))]
+        while todo:
+            top, top_chain = todo[-1]
+            if top in self.files:
+                todo.pop()
+                continue
+            data = self.cache.load(top, self.loader)
+            pending = [
+                (child, top_chain + (child,))
+                for child in self._star_sources(top, data)
+                if child not in self.files and child not in top_chain
+            ]
+            if pending:
+                todo.extend(reversed(pending))
+                continue
+            todo.pop()
+            self.files[top] = LazyTable(self, top, data)
+        return self.files[path]
+
+    def link(self, parent: Path, child: Path) -> None:
+        """Record that `parent` imports `child`, and raise if that closes a
+        cycle among the imports followed so far.
+
+        Each file has one table however many files import it, so the chain
+        a table was first reached by says nothing about the others; the
+        cycle check runs on the import graph instead.
+        """
+        if child in self.imports.get(parent, ()):
+            return
+        # a cycle back to `parent` needs an import of `parent`
+        if parent == child or parent in self.importers:
+            cycle = self._import_path(child, parent)
+            if cycle is not None:
+                raise ValueError(
+                    f"Circular import detected: {' -> '.join(str(p) for p in [parent, *cycle])}"
+                )
+        self.imports.setdefault(parent, set()).add(child)
+        self.importers.setdefault(child, set()).add(parent)
+
+    def _import_path(self, start: Path, goal: Path) -> list[Path] | None:
+        """The files along a chain of imports from `start` to `goal`."""
+        came_from: dict[Path, Path | None] = {start: None}
+        todo = [start]
+        while todo:
+            path = todo.pop()
+            if path == goal:
+                chain = []
+                while path is not None:
+                    chain.append(path)
+                    path = came_from[path]
+                return chain[::-1]
+            for child in self.imports.get(path, ()):
+                if child not in came_from:
+                    came_from[child] = path
+                    todo.append(child)
+        return None
+
+    def check(self) -> None:
+        """Read every value of every loaded file, following their imports,
+        so that each error `resolve` raises for them is raised here too."""
+        seen: set[int] = set()
+        todo: list[Any] = list(self.files.values())
+        while todo:
+            value = todo.pop()
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            if isinstance(value, Mapping):
+                todo.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                todo.extend(value)
+            if not todo:
+                # files loaded by the imports read above
+                todo = [t for t in self.files.values() if id(t) not in seen]
+
+    def _star_sources(self, path: Path, data: dict) -> list[Path]:
+        """The files that the top-level star imports of `path` load."""
+        sources = []
+        for imp in self.cache.compiled_of(path).get(id(data), []):
+            if not isinstance(imp, BaseImport):
+                imp = detect_import(imp)
+            if isinstance(imp, FromImportStar):
+                sources.append(self.cache.resolve_path(path.parent, imp.path_string))
+        return sources
+
+
+class LazyTable(Mapping):
+    """Read-only view of a resolved table that loads imports on first access.
+
+    The keys of a table are known without loading anything: its own keys
+    plus the names that `Import`, `ImportAs` and the `FromImport*` variants
+    state. Only star imports (`import = "*"`) have to be loaded when the
+    table is first created, since their keys come from the imported file.
+    Import conflicts are checked at that point, in the same order and with
+    the same message as `resolve`; missing names and circular imports raise
+    when the key that needs them is accessed. `to_dict` checks everything.
+
+    Nested tables are `LazyTable`s as well, unless nothing below them is
+    imported, in which case the loaded dict is returned as-is. Those dicts,
+    like arrays, are shared with other imports of the same file and must
+    not be mutated; use `to_dict` to get a private, fully resolved copy.
+    """
+
+    __slots__ = ("_ctx", "_path", "_data", "_keys", "_values")
+
+    def __init__(self, ctx: LazyContext, path: Path, data: dict):
+        self._ctx = ctx
+        self._path = path
+        self._data = data
+        self._values: dict[str, Any] = {}
+        self._keys = self._collect_keys()
+
+    def _collect_keys(self) -> dict[str, BaseImport | None]:
+        keys: dict[str, BaseImport | None] = {
+            key: None for key in self._data if key != "imports"
+        }
+        compiled = self._ctx.cache.compiled_of(self._path)
+        for imp in compiled.get(id(self._data), []):
+            if not isinstance(imp, BaseImport):
+                imp = detect_import(imp)
+            names = import_names(imp)
+            if names is None:
+                names = tuple(self._source(imp))
+            if any(name in keys for name in names):
+                raise ValueError(
+                    f"Import conflict: keys {set(names) & set(keys)} already exist in the output data."
+                )
+            for name in names:
+                keys[name] = imp
+        return keys
+
+    def _source(self, imp: BaseImport) -> Any:
+        """Load the file `imp` refers to and return the addressed value."""
+        ch_abs_fn = self._ctx.cache.resolve_path(self._path.parent, imp.path_string)
+        self._ctx.link(self._path, ch_abs_fn)
+        table = self._ctx.file_table(ch_abs_fn)
+        return resolve_inner_path(table, imp.inside_address)
+
+    def __getitem__(self, key: str) -> Any:
+        # a `from` import takes its value from a key of another table; follow
+        # those in a loop, so that a long chain of them cannot hit the
+        # recursion limit, and cache the value in every table on the way
+        table, name = self, key
+        on_the_way = []
+        while name not in table._values:
+            imp = table._keys[name]
+            match imp:
+                case None:
+                    value = table._data[name]
+                    compiled = table._ctx.cache.compiled_of(table._path)
+                    if isinstance(value, dict) and id(value) in compiled:
+                        value = LazyTable(table._ctx, table._path, value)
+                    break
+                case Import() | ImportAs():
+                    value = table._source(imp)
+                    break
+                case (
+                    FromImportOne(import_name=import_name)
+                    | FromImportOneAs(import_name=import_name)
+                ):
+                    source = table._source(imp)
+                case _:
+                    source, import_name = table._source(imp), name
+            on_the_way.append((table, name))
+            if not isinstance(source, LazyTable):
+                value = source[import_name]
+                break
+            table, name = source, import_name
+        else:
+            value = table._values[name]
+
+        table._values[name] = value
+        for table, name in on_the_way:
+            table._values[name] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __repr__(self) -> str:
+        return f"LazyTable({self._path}, keys={list(self._keys)})"
+
+    def to_dict(self) -> dict:
+        """Load everything below this table and return it as plain dicts.
+
+        Every file loaded so far is then read in full, as `resolve` reads
+        them, so conflicts, missing names and circular imports in the parts
+        of them that nothing below this table uses raise here as well.
+        """
+        result = materialize(self)
+        self._ctx.check()
+        return result
+
+
+def materialize(value: Any) -> Any:
+    """Copy `value` with every mapping turned into a dict and every list or
+    tuple into a list."""
+    if not isinstance(value, (Mapping, list, tuple)):
+        return value
+
+    root = {} if isinstance(value, Mapping) else []
+    todo = [(value, root)]
+    while todo:
+        src, dst = todo.pop()
+        items = src.items() if isinstance(src, Mapping) else enumerate(src)
+        for key, val in items:
+            if isinstance(val, (Mapping, list, tuple)):
+                new = {} if isinstance(val, Mapping) else []
+                todo.append((val, new))
+                val = new
+            if isinstance(dst, dict):
+                dst[key] = val
+            else:
+                dst.append(val)
+    return root
+
+
+def select_paths(table: Mapping, select: Iterable[str]) -> dict:
+    """Resolve only the dotted key paths in `select` from a (lazy) table.
+
+    The result holds just the selected values, at their original position:
+    selecting "services.payments.db" gives {"services": {"payments": {"db":
+    ...}}}. Since `table` is lazy, only the files those values come from are
+    loaded, plus the star imports of the tables along the way.
+    """
+    output: dict = {}
+    for key_path in select:
+        *parents, last = key_path.split(".")
+        value = table
+        target = output
+        for key in parents:
+            if not isinstance(value, Mapping) or key not in value:
+                raise KeyError(f"Selected key '{key_path}' not found.")
+            value = value[key]
+            target = target.setdefault(key, {})
+        if not isinstance(value, Mapping) or last not in value:
+            raise KeyError(f"Selected key '{key_path}' not found.")
+        target[last] = materialize(value[last])
+    return output
+
+
+def resolve_config_lazy(
+    root_path: Path, loader: Loader, trust_absolute_paths: bool = False
+) -> LazyTable:
+    root_path = root_path.resolve()
+    ctx = LazyContext(
+        loader=loader, cache=ResolveCache(trust_absolute_paths=trust_absolute_paths)
+    )
+    return ctx.file_table(root_path)
@@ -0,0 +1,217 @@
+import datetime
+import functools
+import json
+import os
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+
+type Loader = Callable[[Path], dict]
+type Parser = Callable[[bytes], Any]
+type TomlParser = Callable[[str], dict]
+type TomlBackendFactory = Callable[[], TomlParser]
+
+# name -> factory, in order of preference. A factory imports its parser and
+# raises ImportError if it is not installed. pytomlpp is left out on purpose:
+# it returns keys in sorted order, which changes the order of the output.
+TOML_BACKENDS: dict[str, TomlBackendFactory] = {}
+
+TOML_BACKEND_ENV_VAR = "RECONFIG_TOML_BACKEND"
+
+
+def register_toml_backend(
+    name: str, factory: TomlBackendFactory, preferred: bool = False
+) -> None:
+    """Add a TOML backend; `preferred` puts it before all registered ones.
+
+    A backend must give the same output as `tomllib` for every document and
+    raise a `ValueError` for every invalid one (see test_toml_backends.py).
+    """
+    if preferred:
+        others = {k: v for k, v in TOML_BACKENDS.items() if k != name}
+        TOML_BACKENDS.clear()
+        TOML_BACKENDS[name] = factory
+        TOML_BACKENDS.update(others)
+    else:
+        TOML_BACKENDS[name] = factory
+    toml_parser.cache_clear()
+
+
+def available_toml_backends() -> list[str]:
+    """Names of the registered backends that are installed, best first."""
+    available = []
+    for name, factory in TOML_BACKENDS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+@functools.cache
+def toml_parser(name: str | None = None) -> TomlParser:
+    """Return the parser of backend `name`.
+
+    Without a name the backend set in the RECONFIG_TOML_BACKEND environment
+    variable is used, or else the first installed one. `tomllib` is always
+    available as the last resort.
+    """
+    name = name or os.environ.get(TOML_BACKEND_ENV_VAR)
+    if name is not None:
+        if name not in TOML_BACKENDS:
+            raise ValueError(
+                f"Unknown TOML backend '{name}', expected one of {list(TOML_BACKENDS)}."
+            )
+        return TOML_BACKENDS[name]()
+
+    for factory in TOML_BACKENDS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    raise ImportError("No TOML backend is installed.")
+
+
+# an offset date-time or time, e.g. 07:32:00Z or 00:32:00.999-07:00
+_OFFSET_TIME = re.compile(r"\d:\d\d(?::\d\d(?:\.\d+)?)?(?:[Zz]|[+-]\d\d:\d\d)")
+
+
+def _fixed_offsets(data: dict) -> dict:
+    """Replace the tzinfo of aware datetimes by `datetime.timezone`, in place."""
+    todo: list[dict | list] = [data]
+    while todo:
+        container = todo.pop()
+        items = (
+            container.items() if isinstance(container, dict) else enumerate(container)
+        )
+        for key, val in items:
+            if isinstance(val, (dict, list)):
+                todo.append(val)
+            elif isinstance(val, datetime.datetime) and val.tzinfo is not None:
+                tz = datetime.timezone(val.utcoffset())
+                container[key] = val.replace(tzinfo=tz)
+    return data
+
+
+def _rtoml() -> TomlParser:
+    import rtoml
+
+    def loads(text: str) -> dict:
+        # rtoml keeps CRLF line breaks inside multi-line strings, where
+        # tomllib reads a plain newline; TOML allows a CR nowhere else
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")
+        # rtoml's own tzinfo and error types cannot be pickled, so neither
+        # could the disk cache or a process pool send them
+        try:
+            data = rtoml.loads(text)
+        except rtoml.TomlParsingError as e:
+            error = ValueError(str(e))
+        else:
+            return _fixed_offsets(data) if _OFFSET_TIME.search(text) else data
+        # rtoml rejects some documents tomllib reads, e.g. a float that
+        # overflows to inf; installing rtoml must not break those configs
+        import tomllib
+
+        try:
+            return tomllib.loads(text)
+        except tomllib.TOMLDecodeError:
+            raise error from None
+
+    return loads
+
+
+def _tomli() -> TomlParser:
+    import tomli
+
+    return tomli.loads
+
+
+def _tomllib() -> TomlParser:
+    import tomllib
+
+    return tomllib.loads
+
+
+register_toml_backend("rtoml", _rtoml)
+register_toml_backend("tomli", _tomli)
+register_toml_backend("tomllib", _tomllib)
+
+
+def read_config_bytes(path: Path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def parse_toml(raw: bytes) -> dict:
+    """Parse TOML with the preferred installed backend."""
+    return toml_parser()(raw.decode())
+
+
+def parse_json(raw: bytes) -> Any:
+    return json.loads(raw)
+
+
+def parse_yaml(raw: bytes) -> Any:
+    """Parse YAML with PyYAML, building only plain data (`safe_load`), with
+    the C loader if available. An empty document is an empty table."""
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError("PyYAML is required to load YAML files.") from e
+
+    yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        data = yaml.load(raw, Loader=yaml_loader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML: {e}") from e
+    return {} if data is None else data
+
+
+# lower-case suffix -> parser; files with any other suffix are read as TOML
+FORMAT_PARSERS: dict[str, Parser] = {
+    ".toml": parse_toml,
+    ".json": parse_json,
+    ".yaml": parse_yaml,
+    ".yml": parse_yaml,
+}
+
+
+def register_format(suffix: str, parser: Parser) -> None:
+    """Parse the content of files ending in `suffix` (e.g. ".ini") with `parser`."""
+    FORMAT_PARSERS[suffix.lower()] = parser
+
+
+def parse_config_bytes(path: Path, raw: bytes) -> dict:
+    """Parse the content `raw` of `path` with the parser for its suffix."""
+    data = FORMAT_PARSERS.get(path.suffix.lower(), parse_toml)(raw)
+    if not isinstance(data, dict):
+        raise ValueError(
+            f"Expected a table at the top level of {path}, got {type(data).__name__}."
+        )
+    return data
+
+
+def load_config_dict(path: Path) -> dict:
+    """Load a config file with the parser registered for its suffix."""
+    return parse_config_bytes(path, read_config_bytes(path))
+
+
+def load_toml_dict(path: Path) -> dict:
+    """Load a TOML file with the preferred installed backend."""
+    return parse_toml(read_config_bytes(path))
+
+
+def toml_loader(backend: str) -> Loader:
+    """Return a loader that parses TOML with the named backend."""
+    parse = toml_parser(backend)
+
+    def load(path: Path) -> dict:
+        return parse(read_config_bytes(path).decode())
+
+    # a name per backend, so that disk cache entries of backends stay apart
+    load.__qualname__ = f"toml_loader({backend!r})"
+    return load
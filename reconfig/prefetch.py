@@ -0,0 +1,98 @@
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from pathlib import Path
+
+from reconfig.import_types import BaseImport
+from reconfig.reconfig import Loader, ResolveCache
+
+
+def child_paths(path: Path, cache: ResolveCache) -> list[Path]:
+    """Absolute paths of the files imported anywhere in the loaded `path`.
+
+    Invalid import definitions are skipped here; the resolve pass reports them.
+    """
+    return [
+        cache.resolve_path(path.parent, imp.path_string)
+        for imports in cache.compiled_of(path).values()
+        for imp in imports
+        if isinstance(imp, BaseImport)
+    ]
+
+
+def load_batch(loader: Loader, paths: list[Path]) -> list[dict | None]:
+    """Load `paths` in order, with None for each file whose load raised."""
+    results = []
+    for path in paths:
+        try:
+            results.append(loader(path))
+        except Exception:
+            results.append(None)
+    return results
+
+
+def prefetch(
+    root_paths: Iterable[Path],
+    loader: Loader,
+    cache: ResolveCache,
+    executor: Executor,
+    batch_size: int = 1,
+) -> None:
+    """Load every file reachable from `root_paths` into `cache.loaded`.
+
+    Files are loaded concurrently on `executor` as soon as their importer has
+    been loaded. Load errors are swallowed: the file is simply left out of the
+    cache, so the serial resolve pass that follows loads it again and raises
+    the same error at the same point as it would without prefetching.
+
+    The new imports of each file are submitted in tasks of up to
+    `batch_size` files, split evenly, which saves round trips on a process
+    pool.
+    """
+    seen = set()
+    pending: dict[Future, list[Path]] = {}
+
+    def schedule(paths: Iterable[Path]) -> None:
+        new = []
+        for path in paths:
+            if path in seen:
+                continue
+            seen.add(path)
+            if path in cache.loaded:
+                schedule(child_paths(path, cache))
+            else:
+                new.append(path)
+        if not new:
+            return
+        size = -(-len(new) // -(-len(new) // batch_size))
+        for i in range(0, len(new), size):
+            batch = new[i : i + size]
+            pending[executor.submit(load_batch, loader, batch)] = batch
+
+    schedule(root_paths)
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            paths = pending.pop(future)
+            try:
+                results = future.result()
+            except Exception:
+                continue
+            for path, data in zip(paths, results):
+                if data is not None:
+                    cache.loaded[path] = data
+                    schedule(child_paths(path, cache))
+
+
+def preloaded_loader(loaded: dict[Path, dict], loader: Loader) -> Loader:
+    """Serve each file from `loaded`, e.g. filled by `prefetch` on a process
+    pool, and fall back to `loader` for files that are not in it.
+
+    Each entry is handed out once, so a file loaded again after an eviction
+    is read anew.
+    """
+
+    def load(path: Path) -> dict:
+        data = loaded.pop(path, None)
+        return loader(path) if data is None else data
+
+    return load
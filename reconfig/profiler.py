@@ -0,0 +1,172 @@
+import json
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from reconfig.import_types import BaseImport
+from reconfig.loaders import (
+    Loader,
+    load_config_dict,
+    parse_config_bytes,
+    read_config_bytes,
+)
+
+
+@dataclass
+class FileProfile:
+    """What one file cost during a run. Times are in seconds.
+
+    `load_time` is the time spent reading the file; for a loader other than
+    the default one it is the whole loader call, and `parse_time` stays 0.
+    `resolve_time` counts only the merging done for this file, not the
+    loading and resolving of the files it imports.
+    """
+
+    path: Path
+    load_time: float = 0.0
+    parse_time: float = 0.0
+    resolve_time: float = 0.0
+    bytes_read: int = 0
+    imports: int = 0
+    import_types: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def total_time(self) -> float:
+        return self.load_time + self.parse_time + self.resolve_time
+
+
+@dataclass(frozen=True, slots=True)
+class TraceEvent:
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread: int
+
+
+class Profiler:
+    """Records per-file timings of a run; pass it as `resolve_config(...,
+    profiler=Profiler())` and read `files`, `table()` or `chrome_trace()`.
+
+    A file imported several times is resolved once; `imports` counts every
+    import of it, with the import types in `import_types`.
+    """
+
+    def __init__(self) -> None:
+        self.files: dict[Path, FileProfile] = {}
+        self.events: list[TraceEvent] = []
+        self._lock = threading.Lock()
+        # open resolve spans: [path, start, time spent in nested spans, thread]
+        self._spans: list[list] = []
+
+    def file(self, path: Path) -> FileProfile:
+        if path not in self.files:
+            self.files[path] = FileProfile(path)
+        return self.files[path]
+
+    def _record(self, path: Path, category: str, start: float, end: float) -> None:
+        with self._lock:
+            event = TraceEvent(
+                str(path), category, start, end - start, threading.get_ident()
+            )
+            self.events.append(event)
+            if self._spans and threading.get_ident() == self._spans[-1][3]:
+                self._spans[-1][2] += end - start
+
+    def loader(self, loader: Loader) -> Loader:
+        """Wrap `loader` so that every file it loads is timed."""
+
+        def load(path: Path) -> dict:
+            if loader is not load_config_dict:
+                start = time.perf_counter()
+                data = loader(path)
+                end = time.perf_counter()
+                self._record(path, "load", start, end)
+                with self._lock:
+                    profile = self.file(path)
+                    profile.load_time += end - start
+                    try:
+                        profile.bytes_read += path.stat().st_size
+                    except OSError:
+                        pass
+                return data
+
+            start = time.perf_counter()
+            raw = read_config_bytes(path)
+            read = time.perf_counter()
+            data = parse_config_bytes(path, raw)
+            end = time.perf_counter()
+            self._record(path, "load", start, read)
+            self._record(path, "parse", read, end)
+            with self._lock:
+                profile = self.file(path)
+                profile.load_time += read - start
+                profile.parse_time += end - read
+                profile.bytes_read += len(raw)
+            return data
+
+        return load
+
+    def imported(self, path: Path, imp: BaseImport) -> None:
+        profile = self.file(path)
+        profile.imports += 1
+        profile.import_types[type(imp).__name__] += 1
+
+    def resolve_started(self, path: Path) -> None:
+        self._spans.append([path, time.perf_counter(), 0.0, threading.get_ident()])
+
+    def resolve_finished(self, path: Path) -> None:
+        end = time.perf_counter()
+        _, start, nested, _ = self._spans.pop()
+        self.file(path).resolve_time += end - start - nested
+        self._record(path, "resolve", start, end)
+
+    def table(self, sort_by: str = "total_time", limit: int | None = None) -> str:
+        """The files as a text table, the most expensive first.
+
+        `sort_by` is any numeric `FileProfile` attribute, e.g. "parse_time".
+        """
+        profiles = sorted(
+            self.files.values(), key=lambda p: getattr(p, sort_by), reverse=True
+        )[:limit]
+        lines = [
+            f"{'total ms':>9} {'load ms':>9} {'parse ms':>9} {'resolve ms':>10} "
+            f"{'bytes':>10} {'imports':>7}  path [import types]"
+        ]
+        for p in profiles:
+            types = ", ".join(f"{n} x{c}" for n, c in p.import_types.most_common())
+            lines.append(
+                f"{p.total_time * 1000:9.3f} {p.load_time * 1000:9.3f} "
+                f"{p.parse_time * 1000:9.3f} {p.resolve_time * 1000:10.3f} "
+                f"{p.bytes_read:10d} {p.imports:7d}  {p.path}"
+                + (f" [{types}]" if types else "")
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """The events in Chrome's trace event format, for chrome://tracing
+        or Perfetto. Resolve spans nest like the imports."""
+        origin = min((e.start for e in self.events), default=0.0)
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": e.name,
+                    "cat": e.category,
+                    "ph": "X",
+                    "ts": (e.start - origin) * 1e6,
+                    "dur": e.duration * 1e6,
+                    "pid": pid,
+                    "tid": e.thread,
+                }
+                for e in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write_chrome_trace(self, path: Path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
@@ -0,0 +1,100 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from reconfig.import_types import (
+    BaseImport,
+    FromImportMany,
+    FromImportOne,
+    FromImportOneAs,
+    FromImportStar,
+)
+
+# A file's index is a trie over the keys of its resolved output. Tables
+# whose subtree holds imports are dicts of their keys; a key that came in
+# through an import is a link:
+#
+#     (imported file, import, index of the imported file)
+#
+# Keys that are neither are written in the file itself and are not stored.
+# All keys of one import share its link, and the link points to the whole
+# index of the imported file, which is shared by every importer, so the
+# index grows with the number of imports, not with the size of the output.
+type Node = dict[str, "Node"] | tuple[Path, BaseImport, "Node | None"]
+
+
+@dataclass(frozen=True, slots=True)
+class Origin:
+    """Where a resolved value is written.
+
+    `path` is the file the value is written in and `key_path` its keys
+    inside that file. `imp` is the import that brought it in, written in
+    the table `import_table` of `importer`; all three are None for values
+    of the root file.
+    """
+
+    path: Path
+    key_path: tuple[str, ...]
+    imp: BaseImport | None = None
+    importer: Path | None = None
+    import_table: tuple[str, ...] | None = None
+
+
+@dataclass
+class Provenance:
+    """Records which file and import every resolved value comes from.
+
+    Pass it as `resolve_config(root, provenance=...)`; afterwards `where`
+    answers for any key of the result in time linear in its depth.
+    """
+
+    root: Path | None = None
+    files: dict[Path, Node] = field(default_factory=dict)
+
+    def where(self, key_path: str | Sequence[str]) -> Origin:
+        """Return the origin of the value at `key_path` of the last result.
+
+        `key_path` is a dotted string or a sequence of keys. It is not
+        checked against the result; keys past the last import are assumed
+        to be written in the file that import points to.
+        """
+        if self.root is None:
+            raise ValueError("Nothing has been resolved with this provenance yet.")
+        if isinstance(key_path, str):
+            key_path = key_path.split(".")
+
+        source, position = self.root, ()
+        imp = importer = import_table = None
+        node: Node | None = self.files[self.root]
+        todo = list(reversed(key_path))
+        while todo:
+            key = todo.pop()
+            position += (key,)
+            node = node.get(key) if isinstance(node, dict) else None
+            if isinstance(node, tuple):
+                importer, import_table = source, position[:-1]
+                source, imp, node = node
+                position = ()
+                # walk the address in the imported file, which may itself
+                # lead through imports
+                todo.extend(reversed(import_address(imp, key)))
+        return Origin(source, position, imp, importer, import_table)
+
+
+def import_address(imp: BaseImport, key: str) -> tuple[str, ...]:
+    """The keys in the imported file of the value `imp` adds as `key`."""
+    match imp:
+        case FromImportOne(import_name=name) | FromImportOneAs(import_name=name):
+            return imp.inside_address + (name,)
+        case FromImportMany() | FromImportStar():
+            return imp.inside_address + (key,)
+    return imp.inside_address
+
+
+def link_imports(
+    node: dict, imp: BaseImport, extender: dict, source: Path, index: Node | None
+) -> None:
+    """Record in `node` that the keys of `extender` came from `source`."""
+    link = (source, imp, index)
+    for key in extender:
+        node[key] = link
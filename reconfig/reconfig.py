@@ -1,8 +1,13 @@
+import os
+from array import array
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any
 
 from reconfig.import_types import (
     FromImportMany,
+    compile_imports,
     detect_import,
     BaseImport,
     Import,
@@ -11,38 +16,235 @@ from reconfig.import_types import (
     FromImportStar,
     FromImportOneAs,
 )
+from reconfig.loaders import (
+    Loader,
+    load_config_dict,
+    load_toml_dict,
+    toml_loader,
+)
+from reconfig.profiler import Profiler
+from reconfig.provenance import Provenance, link_imports
+
+__all__ = [
+    # re-exported from reconfig.loaders, where they moved
+    "Loader",
+    "load_config_dict",
+    "load_toml_dict",
+    "toml_loader",
+    "ImportEdge",
+    "ResolveCache",
+    "copy_tree",
+    "numeric_array",
+    "compact_data",
+    "compacting_loader",
+    "resolve_path",
+    "resolve_inner_path",
+    "build_extender",
+    "ResolveFrame",
+    "start_table",
+    "new_frame",
+    "extend_output",
+    "resolve",
+]
+
+
+@dataclass
+class ImportEdge:
+    parent: Path
+    imp: BaseImport
+    child: Path
+
+
+@dataclass
+class ResolveCache:
+    """Memo of loader output and resolved data for one resolution run.
+
+    Both maps are keyed by absolute path. Resolved entries are handed out
+    as-is on first use and copied on every later use (see `copy_tree`), so
+    a file imported from several places never aliases between them. With
+    `copy_hits=False` later uses share the entry too, and the caller is
+    responsible for copying the final result.
+
+    `edges` maps each resolved file to the imports it made, in order.
+    `compiled` holds the result of `compile_imports` for loaded files; it
+    must be dropped together with the `loaded` entry.
+
+    `finalize`, if set, is applied to the resolved output of every file
+    when it is done, e.g. `freeze`; its result is what gets cached, merged
+    into the importers and returned. Use it with `copy_hits=False`.
+
+    With `provenance`, the index of every resolved file is stored in it
+    (see `reconfig.provenance`).
+
+    `paths` memoizes `resolve_path` by (base path, import path string), so
+    a file imported many times is canonicalized once. With
+    `trust_absolute_paths` absolute import paths are only normalized
+    lexically, without touching the file system (see `resolve_path`).
+    """
+
+    loaded: dict[Path, dict] = field(default_factory=dict)
+    resolved: dict[Path, dict] = field(default_factory=dict)
+    edges: dict[Path, list[ImportEdge]] = field(default_factory=dict)
+    compiled: dict[Path, dict[int, list[BaseImport | dict]]] = field(
+        default_factory=dict
+    )
+    paths: dict[tuple[Path, str], Path] = field(default_factory=dict)
+    copy_hits: bool = True
+    trust_absolute_paths: bool = False
+    profiler: Profiler | None = None
+    finalize: Callable[[dict], Any] | None = None
+    provenance: Provenance | None = None
+
+    def load(self, path: Path, loader: Loader) -> dict:
+        if path not in self.loaded:
+            self.loaded[path] = loader(path)
+        return self.loaded[path]
+
+    def resolve_path(self, base_path: Path, path_str_to_resolve: str) -> Path:
+        key = (base_path, path_str_to_resolve)
+        if key not in self.paths:
+            self.paths[key] = resolve_path(
+                base_path, path_str_to_resolve, self.trust_absolute_paths
+            )
+        return self.paths[key]
+
+    def compiled_of(self, path: Path) -> dict[int, list[BaseImport | dict]]:
+        if path not in self.compiled:
+            self.compiled[path] = compile_imports(self.loaded[path])
+        return self.compiled[path]
+
+    def evict(self, path: Path) -> None:
+        """Forget the loaded data of `path` so that it is loaded again."""
+        self.loaded.pop(path, None)
+        self.compiled.pop(path, None)
 
 
-type Loader = Callable[[Path], dict]
+def copy_tree(value: Any) -> Any:
+    """Copy the dicts, lists and arrays of `value`; other leaves are shared."""
+    if type(value) is array:
+        return value[:]
+    if not isinstance(value, (dict, list)):
+        return value
 
+    root = type(value)()
+    todo = [(value, root)]
+    while todo:
+        src, dst = todo.pop()
+        items = src.items() if isinstance(src, dict) else enumerate(src)
+        for key, val in items:
+            if isinstance(val, (dict, list)):
+                new = type(val)()
+                todo.append((val, new))
+                val = new
+            elif type(val) is array:
+                val = val[:]
+            if isinstance(dst, dict):
+                dst[key] = val
+            else:
+                dst.append(val)
+    return root
+
+
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+
+def numeric_array(items: list) -> array | None:
+    """`items` as an array of int64 or float64, if it has only one of those."""
+    if not items:
+        return None
+    first = type(items[0])
+    if first is int:
+        if all(type(x) is int and INT64_MIN <= x <= INT64_MAX for x in items):
+            return array("q", items)
+    elif first is float:
+        if all(type(x) is float for x in items):
+            return array("d", items)
+    return None
+
+
+def compact_data(
+    data: dict,
+    strings: dict[str, str] | None,
+    arrays: bool = False,
+    max_string_length: int = 64,
+) -> dict:
+    """Shrink loaded `data` in place.
+
+    Keys, and string values of at most `max_string_length` characters, are
+    replaced by the equal string already in `strings`, so each distinct
+    one is stored once however many tables repeat it. With `arrays`, lists
+    of only ints or only floats become `array.array`s of int64 or float64.
+    """
+    todo: list[dict | list] = [data]
+    while todo:
+        container = todo.pop()
+        if isinstance(container, dict):
+            items = list(container.items())
+            container.clear()
+        else:
+            items = list(enumerate(container))
+        for key, val in items:
+            if isinstance(val, str):
+                if strings is not None and len(val) <= max_string_length:
+                    val = strings.setdefault(val, val)
+            elif isinstance(val, list):
+                compacted = numeric_array(val) if arrays else None
+                if compacted is None:
+                    todo.append(val)
+                else:
+                    val = compacted
+            elif isinstance(val, dict):
+                todo.append(val)
+            if strings is not None and isinstance(container, dict):
+                key = strings.setdefault(key, key)
+            container[key] = val
+    return data
 
-def load_toml_dict(path: Path) -> dict:
-    import tomllib
 
-    with open(path, "rb") as f:
-        toml_dict = tomllib.load(f)
+def compacting_loader(
+    loader: Loader, intern_strings: bool = True, compact_arrays: bool = False
+) -> Loader:
+    """Wrap `loader` so that every file it loads goes through `compact_data`.
 
-    return toml_dict
+    All files loaded through the returned loader share one string table.
+    """
+    strings: dict[str, str] | None = {} if intern_strings else None
 
+    def load(path: Path) -> dict:
+        return compact_data(loader(path), strings, compact_arrays)
 
-def resolve_path(base_path: Path, path_str_to_resolve: str) -> Path:
+    return load
+
+
+def resolve_path(
+    base_path: Path, path_str_to_resolve: str, trust_absolute: bool = False
+) -> Path:
+    """Return the absolute path of an import, relative to `base_path`.
+
+    Symlinks are resolved, so a file reached through a link is identified
+    by its target, and its own relative imports are resolved relative to
+    the target's directory. With `trust_absolute`, absolute paths are only
+    normalized lexically (`..` and `.` removed) and links in them are kept,
+    so relative imports inside such a file are resolved relative to the
+    directory the link lives in.
+    """
     path_to_resolve = Path(path_str_to_resolve)
     if path_to_resolve.is_absolute():
+        if trust_absolute:
+            return Path(os.path.normpath(path_to_resolve))
         return path_to_resolve.resolve()
     else:
         return (base_path / path_to_resolve).resolve()
 
 
-def resolve_inner_path(data: dict, inside_address: list[str]) -> Any:
-    if inside_address == []:
-        return data
-
-    first, *rest = inside_address
-    if first not in data:
-        raise KeyError(
-            f"Key '{first}' not found in data during inside address resolution."
-        )
-    return resolve_inner_path(data[first], rest)
+def resolve_inner_path(data: dict, inside_address: Sequence[str]) -> Any:
+    for key in inside_address:
+        if key not in data:
+            raise KeyError(
+                f"Key '{key}' not found in data during inside address resolution."
+            )
+        data = data[key]
+    return data
 
 
 def build_extender(imp: BaseImport, file_imported_data: dict) -> dict:
@@ -69,58 +271,222 @@ def build_extender(imp: BaseImport, file_imported_data: dict) -> dict:
     raise ValueError(f"Unsupported import type: {imp}")
 
 
+@dataclass(slots=True)
+class ResolveFrame:
+    """Resolution state of one file on the explicit stack of `resolve`.
+
+    `tables` holds the nested tables of the file still to be resolved, as
+    (data, output of the parent table, key) triples. `output` is the
+    resolved top table, `table_output` the table whose imports are being
+    merged right now. `compiled` is the `compile_imports` result of the
+    file; nested tables whose id is not in it are left in the output
+    untouched. `imp` is the import that brought the file
+    in; it is None for the root. When provenance is recorded, `nodes` maps
+    the id of each output table to its node in the index of the file.
+    """
+
+    base_path: Path
+    path: Path
+    compiled: dict[int, list[BaseImport | dict]]
+    output: dict
+    tables: list[tuple[dict, dict, str]]
+    table_output: dict
+    imports: list[BaseImport | dict]
+    import_pos: int = 0
+    imp: BaseImport | None = None
+    nodes: dict[int, dict] | None = None
+
+
+def start_table(
+    frame: ResolveFrame,
+    initial_data: dict,
+    delete_imports_from_result: bool = True,
+) -> dict:
+    """Make `initial_data` the current table of `frame` and queue its children."""
+    output_data = initial_data.copy()
+    if delete_imports_from_result and "imports" in output_data:
+        del output_data["imports"]
+
+    frame.table_output = output_data
+    frame.imports = frame.compiled.get(id(initial_data), [])
+    frame.import_pos = 0
+
+    # queue the child environments (dicts that are not imports) so that they
+    # are resolved in order, after the imports of this table; the ones
+    # without imports below them are already final in the shallow copy
+    compiled = frame.compiled
+    child_envs = [
+        (val, output_data, name)
+        for name, val in initial_data.items()
+        if isinstance(val, dict) and id(val) in compiled
+    ]
+    child_envs.reverse()
+    frame.tables.extend(child_envs)
+    return output_data
+
+
+def new_frame(
+    base_path: Path,
+    initial_data: dict,
+    path: Path,
+    delete_imports_from_result: bool = True,
+    compiled: dict[int, list[BaseImport | dict]] | None = None,
+) -> ResolveFrame:
+    if compiled is None:
+        compiled = compile_imports(initial_data)
+    frame = ResolveFrame(base_path, path, compiled, {}, [], {}, [])
+    frame.output = start_table(frame, initial_data, delete_imports_from_result)
+    return frame
+
+
+def extend_output(output_data: dict, ch_extender: dict) -> None:
+    # check key by key; building sets of the whole output on every import
+    # is quadratic in the number of imports of a table
+    if any(key in output_data for key in ch_extender):
+        raise ValueError(
+            f"Import conflict: keys {set(ch_extender) & set(output_data)} already exist in the output data."
+        )
+
+    output_data.update(ch_extender)
+
+
 def resolve(
     base_path: Path,
     initial_data: dict,
     import_path_stack: list[Path],
     loader: Loader,
     delete_imports_from_result: bool = True,
+    cache: ResolveCache | None = None,
 ) -> dict:
-    # grab the child environments: dicts that are not imports
-    child_envs = {
-        name: val for name, val in initial_data.items() if isinstance(val, dict)
-    }
+    """Resolve all imports in `initial_data` and its nested tables.
 
-    # grab the list of child imports
-    child_imports_list = initial_data.get("imports", [])
+    Each table first merges its imports in order, then resolves its nested
+    tables in order. Imported files are kept on an explicit stack and the
+    tables of a file on a work list, rather than on the Python call stack,
+    so neither deep nesting nor long import chains hit the recursion limit.
 
-    output_data = initial_data.copy()
-    if delete_imports_from_result and "imports" in output_data:
-        del output_data["imports"]
+    The chain of files being imported is kept both as a list, pushed and
+    popped in place, and as a set for constant time circular import checks.
+    """
+    import_chain = list(import_path_stack)
+    on_chain = set(import_chain)
+    profiler = cache.profiler if cache is not None else None
+    provenance = cache.provenance if cache is not None else None
+    if profiler is not None:
+        profiler.resolve_started(import_chain[-1])
+    compiled = None
+    if cache is not None and cache.loaded.get(import_chain[-1]) is initial_data:
+        compiled = cache.compiled_of(import_chain[-1])
+    stack = [
+        new_frame(
+            base_path,
+            initial_data,
+            import_chain[-1],
+            delete_imports_from_result,
+            compiled,
+        )
+    ]
+    if provenance is not None:
+        stack[0].nodes = {id(stack[0].output): {}}
 
-    # resolve the child imports
-    for ch_imp_dict in child_imports_list:
-        ch_imp = detect_import(ch_imp_dict)
-        ch_abs_fn = resolve_path(base_path, ch_imp.path_string)
-        if ch_abs_fn in import_path_stack:
-            raise ValueError(
-                f"Circular import detected: {' -> '.join(str(p) for p in import_path_stack + [ch_abs_fn])}"
-            )
+    while True:
+        frame = stack[-1]
 
-        ch_base_path = ch_abs_fn.parent
-        ch_initial_data = loader(ch_abs_fn)
-        ch_resolved_data = resolve(
-            base_path=ch_base_path,
-            initial_data=ch_initial_data,
-            import_path_stack=import_path_stack + [ch_abs_fn],
-            loader=loader,
-        )
-        ch_extender = build_extender(ch_imp, ch_resolved_data)
+        # resolve the child imports of the current table
+        imports = frame.imports
+        while frame.import_pos < len(imports):
+            ch_imp = imports[frame.import_pos]
+            frame.import_pos += 1
+            if not isinstance(ch_imp, BaseImport):
+                # rejected by compile_imports; raise here to keep error order
+                ch_imp = detect_import(ch_imp)
+            if cache is not None:
+                ch_abs_fn = cache.resolve_path(frame.base_path, ch_imp.path_string)
+            else:
+                ch_abs_fn = resolve_path(frame.base_path, ch_imp.path_string)
+            if ch_abs_fn in on_chain:
+                raise ValueError(
+                    f"Circular import detected: {' -> '.join(str(p) for p in import_chain + [ch_abs_fn])}"
+                )
 
-        if set(ch_extender) & set(output_data):
-            raise ValueError(
-                f"Import conflict: keys {set(ch_extender) & set(output_data)} already exist in the output data."
-            )
+            if cache is not None:
+                cache.edges.setdefault(frame.path, []).append(
+                    ImportEdge(parent=frame.path, imp=ch_imp, child=ch_abs_fn)
+                )
+                if profiler is not None:
+                    profiler.imported(ch_abs_fn, ch_imp)
 
-        output_data.update(ch_extender)
+            if cache is not None and ch_abs_fn in cache.resolved:
+                # already resolved: hand out a copy, never the original
+                ch_extender = build_extender(ch_imp, cache.resolved[ch_abs_fn])
+                if cache.copy_hits:
+                    ch_extender = copy_tree(ch_extender)
+                extend_output(frame.table_output, ch_extender)
+                if provenance is not None:
+                    link_imports(
+                        frame.nodes[id(frame.table_output)],
+                        ch_imp,
+                        ch_extender,
+                        ch_abs_fn,
+                        provenance.files.get(ch_abs_fn),
+                    )
+                continue
 
-    # resolve the child environments
-    for name, ch_data in child_envs.items():
-        output_data[name] = resolve(
-            base_path=base_path,
-            initial_data=ch_data,
-            import_path_stack=import_path_stack,
-            loader=loader,
-        )
+            if cache is not None:
+                cache.edges[ch_abs_fn] = []
+                ch_initial_data = cache.load(ch_abs_fn, loader)
+                if profiler is not None:
+                    profiler.resolve_started(ch_abs_fn)
+                ch_compiled = cache.compiled_of(ch_abs_fn)
+            else:
+                ch_initial_data = loader(ch_abs_fn)
+                ch_compiled = None
+            child = new_frame(
+                ch_abs_fn.parent,
+                ch_initial_data,
+                ch_abs_fn,
+                compiled=ch_compiled,
+            )
+            child.imp = ch_imp
+            if provenance is not None:
+                child.nodes = {id(child.output): {}}
+            import_chain.append(ch_abs_fn)
+            on_chain.add(ch_abs_fn)
+            stack.append(child)
+            break
+        else:
+            # resolve the next child environment of this file
+            if frame.tables:
+                ch_data, parent_output, name = frame.tables.pop()
+                parent_output[name] = start_table(frame, ch_data)
+                if frame.nodes is not None:
+                    node = frame.nodes[id(parent_output)].setdefault(name, {})
+                    frame.nodes[id(parent_output[name])] = node
+                continue
 
-    return output_data
+            # this file is done: merge it into the importing table
+            stack.pop()
+            if provenance is not None:
+                provenance.files[frame.path] = frame.nodes[id(frame.output)]
+                if not stack:
+                    provenance.root = frame.path
+            if cache is not None and cache.finalize is not None:
+                frame.output = cache.finalize(frame.output)
+            if profiler is not None:
+                profiler.resolve_finished(frame.path)
+            if not stack:
+                return frame.output
+            on_chain.discard(import_chain.pop())
+            parent = stack[-1]
+            if cache is not None:
+                cache.resolved[frame.path] = frame.output
+            ch_extender = build_extender(frame.imp, frame.output)
+            extend_output(parent.table_output, ch_extender)
+            if provenance is not None:
+                link_imports(
+                    parent.nodes[id(parent.table_output)],
+                    frame.imp,
+                    ch_extender,
+                    frame.path,
+                    provenance.files[frame.path],
+                )
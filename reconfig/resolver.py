@@ -0,0 +1,113 @@
+import functools
+from collections.abc import Iterable
+from pathlib import Path
+
+from reconfig.frozen import FrozenTable, freeze
+from reconfig.import_graph import ImportGraph
+from reconfig.loaders import load_config_dict
+from reconfig.reconfig import (
+    ImportEdge,
+    Loader,
+    ResolveCache,
+    copy_tree,
+    resolve,
+)
+
+
+class Resolver:
+    """Stateful resolver for one root file that supports incremental updates.
+
+    The resolver keeps the loaded and resolved data of every file in the
+    import graph together with the import edges between them. `update`
+    drops only the changed files and the files that (transitively) import
+    them, and resolves the root again on top of the remaining cache.
+    """
+
+    def __init__(
+        self, root_path: Path, loader: Loader = load_config_dict, frozen: bool = False
+    ):
+        self.root_path = root_path.resolve()
+        self.loader = loader
+        self.frozen = frozen
+        self.cache = ResolveCache(copy_hits=False)
+        # the last result before it was copied; it shares the tables of
+        # unchanged files with the result before it, and is never mutated
+        self.shared: dict | FrozenTable | None = None
+
+    @property
+    def edges(self) -> list[ImportEdge]:
+        """Import edges reachable from the root, in resolution order."""
+        seen = {self.root_path}
+        todo = [self.root_path]
+        edges = []
+        while todo:
+            parent = todo.pop(0)
+            for edge in self.cache.edges.get(parent, []):
+                edges.append(edge)
+                if edge.child not in seen:
+                    seen.add(edge.child)
+                    todo.append(edge.child)
+        return edges
+
+    @property
+    def files(self) -> set[Path]:
+        """Absolute paths of the root and every file reachable through imports."""
+        return set(self.graph().files)
+
+    def graph(self) -> ImportGraph:
+        """The import graph of the last resolution, from the cached edges."""
+        return ImportGraph(self.root_path, self.edges)
+
+    def importers(self) -> dict[Path, set[Path]]:
+        """Map each file to the set of files that import it directly."""
+        return self.graph().importers()
+
+    def affected(self, changed: Iterable[Path]) -> set[Path]:
+        """The changed files plus every file that transitively imports one."""
+        return self.graph().affected(changed)
+
+    def resolve(self) -> dict | FrozenTable:
+        """Resolve the root; with `frozen`, return frozen output.
+
+        Frozen output is not copied: the tables of files that did not change
+        since the last call are the very same objects, which `diff` uses to
+        skip them. Plain output is copied as a whole, so it costs time in
+        proportion to the size of the config, however small the change.
+
+        If resolution raises, the import edges recorded before are kept
+        (together with any new ones), so `files` and `affected` still reach
+        every file and a later `update` drops everything it should.
+        """
+        previous = {path: list(edges) for path, edges in self.cache.edges.items()}
+        self.cache.edges[self.root_path] = []
+        if self.frozen:
+            self.cache.finalize = functools.partial(freeze, interned={})
+        try:
+            initial_data = self.cache.load(self.root_path, self.loader)
+            result = resolve(
+                base_path=self.root_path.parent,
+                initial_data=initial_data,
+                import_path_stack=[self.root_path],
+                loader=self.loader,
+                cache=self.cache,
+            )
+        except Exception:
+            for path, edges in previous.items():
+                partial = self.cache.edges.get(path, [])
+                self.cache.edges[path] = edges + [e for e in partial if e not in edges]
+            raise
+        self.shared = result
+        return result if self.frozen else copy_tree(result)
+
+    def update(self, changed: Iterable[Path]) -> dict | FrozenTable:
+        """Re-resolve after `changed` files were modified on disk.
+
+        Only the changed files are loaded again; their importers are
+        re-resolved from the cached loader output, everything else is reused.
+        """
+        changed = {Path(p).resolve() for p in changed}
+        for path in self.affected(changed):
+            self.cache.resolved.pop(path, None)
+        for path in changed:
+            self.cache.evict(path)
+        return self.resolve()
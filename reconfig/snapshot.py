@@ -0,0 +1,285 @@
+"""Binary snapshots of resolved configs that are read through `mmap`.
+
+Layout, all integers little-endian:
+
+    header   magic, offset of the string index, number of strings
+    tables   u32 count, then per key: u32 key string, value slot; then
+             u32 entry numbers in order of the UTF-8 keys, for lookups
+    arrays   u32 count, then one value slot per item
+    strings  per string: u64 offset, u32 length; then the UTF-8 bytes
+
+A value slot is a one-byte tag and eight bytes of payload: the number
+itself, a string id, or the offset of a table or array. Every distinct
+string is stored once. Opening a snapshot maps the file and reads the
+header; tables and strings are decoded when they are accessed, so worker
+processes that open the same snapshot share its pages through the page
+cache.
+"""
+
+import datetime
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from reconfig.lazy import materialize
+
+MAGIC = b"RCSNAP01"
+
+HEADER = struct.Struct("<8sQQ")
+COUNT = struct.Struct("<I")
+U32 = COUNT
+SLOT = struct.Struct("<B8s")
+ENTRY = struct.Struct("<IB8s")
+STRING = struct.Struct("<QI")
+I64 = struct.Struct("<q")
+U64 = struct.Struct("<Q")
+F64 = struct.Struct("<d")
+
+(
+    NONE,
+    FALSE,
+    TRUE,
+    INT,
+    BIG_INT,
+    FLOAT,
+    STR,
+    TABLE,
+    ARRAY,
+    DATETIME,
+    DATE,
+    TIME,
+) = range(12)
+
+_ISO_TYPES = {
+    DATETIME: datetime.datetime,
+    DATE: datetime.date,
+    TIME: datetime.time,
+}
+_NO_PAYLOAD = bytes(8)
+
+
+def _encode(data: Mapping) -> bytes:
+    if not isinstance(data, Mapping):
+        raise TypeError(f"A snapshot stores a table, got {type(data).__name__}.")
+    strings: dict[str, int] = {}
+    out = bytearray(HEADER.size)
+
+    def string_id(s: str) -> int:
+        if s not in strings:
+            strings[s] = len(strings)
+        return strings[s]
+
+    # containers get their space when they are found and are filled later
+    todo: list[tuple[Mapping | list | tuple | array, int]] = []
+
+    def allocate(value: Mapping | list | tuple | array) -> int:
+        offset = len(out)
+        size = ENTRY.size + U32.size if isinstance(value, Mapping) else SLOT.size
+        out.extend(COUNT.pack(len(value)))
+        out.extend(bytes(size * len(value)))
+        todo.append((value, offset))
+        return offset
+
+    def slot(value: Any) -> tuple[int, bytes]:
+        match value:
+            case None:
+                return NONE, _NO_PAYLOAD
+            case bool():
+                return (TRUE if value else FALSE), _NO_PAYLOAD
+            case int() if -(2**63) <= value < 2**63:
+                return INT, I64.pack(value)
+            case int():
+                return BIG_INT, U64.pack(string_id(str(value)))
+            case float():
+                return FLOAT, F64.pack(value)
+            case str():
+                return STR, U64.pack(string_id(value))
+            case Mapping():
+                return TABLE, U64.pack(allocate(value))
+            case list() | tuple() | array():
+                return ARRAY, U64.pack(allocate(value))
+            case datetime.datetime():
+                return DATETIME, U64.pack(string_id(value.isoformat()))
+            case datetime.date():
+                return DATE, U64.pack(string_id(value.isoformat()))
+            case datetime.time():
+                return TIME, U64.pack(string_id(value.isoformat()))
+        raise TypeError(f"Cannot store {type(value).__name__} in a snapshot.")
+
+    allocate(data)
+    while todo:
+        value, offset = todo.pop()
+        position = offset + COUNT.size
+        if isinstance(value, Mapping):
+            for key, item in value.items():
+                tag, payload = slot(item)
+                ENTRY.pack_into(out, position, string_id(key), tag, payload)
+                position += ENTRY.size
+            order = sorted(
+                range(len(value)), key=[k.encode() for k in value].__getitem__
+            )
+            struct.pack_into(f"<{len(order)}I", out, position, *order)
+        else:
+            for item in value:
+                SLOT.pack_into(out, position, *slot(item))
+                position += SLOT.size
+
+    index_offset = len(out)
+    blob_offset = index_offset + STRING.size * len(strings)
+    encoded = [s.encode() for s in strings]
+    for raw in encoded:
+        out.extend(STRING.pack(blob_offset, len(raw)))
+        blob_offset += len(raw)
+    for raw in encoded:
+        out.extend(raw)
+
+    HEADER.pack_into(out, 0, MAGIC, index_offset, len(strings))
+    return bytes(out)
+
+
+def write_snapshot(data: Mapping, path: Path) -> None:
+    """Write the resolved config `data` to `path` as a snapshot.
+
+    `data` may also be frozen or lazy output; tuples are stored as arrays.
+
+    The file is replaced atomically, so processes that still have the old
+    snapshot open keep reading the old content.
+    """
+    encoded = _encode(data)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class _Snapshot:
+    """The mapped file and the strings decoded from it so far."""
+
+    __slots__ = ("buf", "index_offset", "strings")
+
+    def __init__(self, buf: mmap.mmap):
+        if len(buf) < HEADER.size:
+            raise ValueError("Not a reconfig snapshot: file is too short.")
+        magic, index_offset, count = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a reconfig snapshot: bad magic {magic!r}.")
+        self.buf = buf
+        self.index_offset = index_offset
+        self.strings: list[str | None] = [None] * count
+
+    def string(self, i: int) -> str:
+        s = self.strings[i]
+        if s is None:
+            offset, length = STRING.unpack_from(
+                self.buf, self.index_offset + i * STRING.size
+            )
+            s = self.strings[i] = str(self.buf[offset : offset + length], "utf-8")
+        return s
+
+    def raw_string(self, i: int) -> bytes:
+        offset, length = STRING.unpack_from(
+            self.buf, self.index_offset + i * STRING.size
+        )
+        return self.buf[offset : offset + length]
+
+    def value(self, tag: int, payload: bytes) -> Any:
+        if tag == STR:
+            return self.string(U64.unpack(payload)[0])
+        if tag == INT:
+            return I64.unpack(payload)[0]
+        if tag == TABLE:
+            return SnapshotTable(self, U64.unpack(payload)[0])
+        if tag == ARRAY:
+            return self.array(U64.unpack(payload)[0])
+        if tag == FLOAT:
+            return F64.unpack(payload)[0]
+        if tag in (NONE, FALSE, TRUE):
+            return (None, False, True)[tag]
+        if tag == BIG_INT:
+            return int(self.string(U64.unpack(payload)[0]))
+        return _ISO_TYPES[tag].fromisoformat(self.string(U64.unpack(payload)[0]))
+
+    def array(self, offset: int) -> list:
+        (count,) = COUNT.unpack_from(self.buf, offset)
+        return [
+            self.value(*SLOT.unpack_from(self.buf, offset + COUNT.size + i * SLOT.size))
+            for i in range(count)
+        ]
+
+
+class SnapshotTable(Mapping):
+    """Read-only table of a snapshot, decoded on access.
+
+    Arrays are decoded into lists when they are read; tables inside them
+    stay `SnapshotTable`s. Use `to_dict` for a plain copy of everything
+    below the table.
+    """
+
+    __slots__ = ("_snapshot", "_offset")
+
+    def __init__(self, snapshot: _Snapshot, offset: int):
+        self._snapshot = snapshot
+        self._offset = offset
+
+    def _entry(self, i: int) -> tuple[int, int, bytes]:
+        position = self._offset + COUNT.size + i * ENTRY.size
+        return ENTRY.unpack_from(self._snapshot.buf, position)
+
+    def __len__(self) -> int:
+        return COUNT.unpack_from(self._snapshot.buf, self._offset)[0]
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self._snapshot.string(self._entry(i)[0])
+
+    def _find(self, key: str) -> int | None:
+        """Binary search of the key order; no other key is decoded."""
+        snapshot = self._snapshot
+        raw = key.encode()
+        count = len(self)
+        order = self._offset + COUNT.size + count * ENTRY.size
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            (i,) = U32.unpack_from(snapshot.buf, order + mid * U32.size)
+            if snapshot.raw_string(self._entry(i)[0]) < raw:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < count:
+            (i,) = U32.unpack_from(snapshot.buf, order + lo * U32.size)
+            if snapshot.raw_string(self._entry(i)[0]) == raw:
+                return i
+        return None
+
+    def __getitem__(self, key: str) -> Any:
+        i = self._find(key) if isinstance(key, str) else None
+        if i is None:
+            raise KeyError(key)
+        _, tag, payload = self._entry(i)
+        return self._snapshot.value(tag, payload)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __repr__(self) -> str:
+        return f"SnapshotTable(keys={list(self)})"
+
+    def to_dict(self) -> dict:
+        return materialize(self)
+
+
+def open_snapshot(path: Path) -> SnapshotTable:
+    """Map the snapshot at `path` and return its root table."""
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return SnapshotTable(_Snapshot(buf), HEADER.size)
@@ -0,0 +1,175 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from reconfig.diff import Change, diff
+from reconfig.disk_cache import StatFingerprint, stat_fingerprint
+from reconfig.loaders import Loader, load_config_dict
+from reconfig.reconfig import copy_tree
+from reconfig.resolver import Resolver
+
+
+logger = logging.getLogger(__name__)
+
+type Subscriber = Callable[[dict, set[str]], None]
+type ChangeSubscriber = Callable[[dict, list[Change]], None]
+type ErrorHandler = Callable[[Exception], None]
+
+
+def _fingerprint_or_none(path: Path) -> StatFingerprint | None:
+    try:
+        return stat_fingerprint(path)
+    except OSError:
+        return None
+
+
+class ConfigWatcher:
+    """Polls the files reachable from a root config and reloads on change.
+
+    Every `interval` seconds each watched file is stat'ed. Changes are
+    collected until no new change has been seen for `debounce` seconds, and
+    are then applied with a single `Resolver.update`. Subscribers receive
+    the new config and the set of top-level keys whose value changed; they
+    are not called when a reload leaves the config unchanged. Subscribers
+    added with `subscribe_changes` receive the list of `Change`s instead.
+
+    Changes are found on the resolver's uncopied results, which share the
+    tables of unchanged files between reloads, so finding them only walks
+    the files that changed. With `frozen`, configs are `FrozenTable`s and
+    are not copied either.
+
+    Errors go to `on_error`. Without it, they are raised from `poll`, and
+    logged to the `reconfig.watch` logger when polling in the background.
+
+    The watched set is exactly the root plus every file reached through
+    `imports`, and it is refreshed after each reload. Polling is used on
+    every platform so the watcher needs nothing beyond the stdlib.
+    """
+
+    def __init__(
+        self,
+        root_path: Path,
+        loader: Loader = load_config_dict,
+        interval: float = 1.0,
+        debounce: float = 0.25,
+        on_error: ErrorHandler | None = None,
+        frozen: bool = False,
+    ):
+        self.resolver = Resolver(root_path, loader, frozen=frozen)
+        self.interval = interval
+        self.debounce = debounce
+        self.on_error = on_error
+        self.config = self.resolver.resolve()
+        self._shared = self.resolver.shared
+
+        self._fingerprints = {p: _fingerprint_or_none(p) for p in self.resolver.files}
+        self._subscribers: list[Subscriber] = []
+        self._change_subscribers: list[ChangeSubscriber] = []
+        self._pending: set[Path] = set()
+        self._last_change = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def watched_files(self) -> set[Path]:
+        return set(self._fingerprints)
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Register `callback` and return a function that unregisters it."""
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def subscribe_changes(self, callback: ChangeSubscriber) -> Callable[[], None]:
+        """Like `subscribe`, but `callback` gets the list of changed values."""
+        self._change_subscribers.append(callback)
+        return lambda: self._change_subscribers.remove(callback)
+
+    def poll(self, now: float | None = None) -> bool:
+        """Run one polling step; return True if a reload happened."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            for path, fingerprint in self._fingerprints.items():
+                current = _fingerprint_or_none(path)
+                if current != fingerprint:
+                    self._fingerprints[path] = current
+                    self._pending.add(path)
+                    self._last_change = now
+
+            if not self._pending or now - self._last_change < self.debounce:
+                return False
+            self._reload()
+            return True
+
+    def _reload(self) -> None:
+        changed, self._pending = self._pending, set()
+        try:
+            new_config = self.resolver.update(changed)
+        except Exception as e:
+            # keep the last good config and keep watching the failing files
+            self._report(e)
+            return
+        finally:
+            for path in self.resolver.files - self._fingerprints.keys():
+                self._fingerprints[path] = _fingerprint_or_none(path)
+
+        self._fingerprints = {p: self._fingerprints[p] for p in self.resolver.files}
+        changes = list(diff(self._shared, self.resolver.shared))
+        if not self.resolver.frozen:
+            # the shared trees belong to the resolver's cache
+            changes = [
+                Change(c.path, copy_tree(c.old), copy_tree(c.new)) for c in changes
+            ]
+        self.config = new_config
+        self._shared = self.resolver.shared
+        if not changes:
+            return
+        changed_keys = {change.path[0] for change in changes}
+        for callback in list(self._subscribers):
+            try:
+                callback(new_config, changed_keys)
+            except Exception as e:
+                self._report(e)
+        for callback in list(self._change_subscribers):
+            try:
+                callback(new_config, changes)
+            except Exception as e:
+                self._report(e)
+
+    def _report(self, error: Exception) -> None:
+        if self.on_error is None:
+            raise error
+        self.on_error(error)
+
+    def start(self) -> None:
+        """Start polling in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                # only raised without an on_error handler; log it rather than
+                # let the thread die or fail silently
+                logger.exception("Reloading %s failed", self.resolver.root_path)
+
+    def __enter__(self) -> "ConfigWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
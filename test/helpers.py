@@ -0,0 +1,17 @@
+from collections import Counter
+from pathlib import Path
+from reconfig import load_toml_dict
+
+
+TEST_ROOTS = sorted(Path("./test/test_configs").glob("*/root*.toml"))
+ERROR_ROOTS = sorted(Path("./test/error_configs").glob("*/root*.toml"))
+
+
+def counting_loader(counter: Counter, by_name: bool = False):
+    """`load_toml_dict` that counts its calls per path, or per file name."""
+
+    def loader(path: Path) -> dict:
+        counter[path.name if by_name else path] += 1
+        return load_toml_dict(path)
+
+    return loader
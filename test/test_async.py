@@ -0,0 +1,73 @@
+import asyncio
+from collections import Counter
+from pathlib import Path
+from reconfig import resolve_config, resolve_config_async
+from reconfig.async_reconfig import load_toml_dict_async
+import pytest
+from test.helpers import ERROR_ROOTS, TEST_ROOTS
+
+
+@pytest.mark.parametrize("root", TEST_ROOTS, ids=str)
+def test_async_matches_sync(root):
+    assert asyncio.run(resolve_config_async(root)) == resolve_config(root)
+
+
+@pytest.mark.parametrize("root", ERROR_ROOTS, ids=str)
+def test_async_errors_match_sync(root):
+    with pytest.raises(ValueError) as sync_error:
+        resolve_config(root)
+    with pytest.raises(ValueError) as async_error:
+        asyncio.run(resolve_config_async(root))
+
+    assert str(async_error.value) == str(sync_error.value)
+
+
+def test_in_flight_loads_are_shared():
+    """Sibling imports of the same file wait on a single load."""
+    root = Path("./test/test_configs/conf_integration/root.toml")
+    counter = Counter()
+
+    async def loader(path: Path) -> dict:
+        counter[path] += 1
+        await asyncio.sleep(0.01)
+        return await load_toml_dict_async(path)
+
+    result = asyncio.run(resolve_config_async(root, loader=loader))
+
+    assert result == resolve_config(root)
+    assert set(counter.values()) == {1}
+
+
+def test_siblings_are_loaded_together(tmp_path):
+    names = [f"frag_{i}" for i in range(8)]
+    for name in names:
+        (tmp_path / f"{name}.toml").write_text(f'{name}_var = "{name}"\n')
+    root = tmp_path / "root.toml"
+    root.write_text(
+        "imports = [" + ", ".join(f'{{import = "{n}.toml"}}' for n in names) + "]\n"
+    )
+
+    active = 0
+    peak = 0
+
+    async def loader(path: Path) -> dict:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return await load_toml_dict_async(path)
+
+    result = asyncio.run(resolve_config_async(root, loader=loader))
+
+    assert list(result) == names
+    assert peak == len(names)
+
+
+def test_async_results_do_not_alias():
+    root = Path("./test/test_configs/conf_integration/root.toml")
+    result = asyncio.run(resolve_config_async(root))
+
+    result["section"]["a_renamed"]["var_a"] = "x"
+
+    assert result["recursive"]["a"]["var_a"] == "val_a"
@@ -0,0 +1,155 @@
+import threading
+from collections import Counter
+from pathlib import Path
+from reconfig import FrozenTable, load_config_dict, resolve_config, resolve_many
+import pytest
+from test.helpers import ERROR_ROOTS
+
+
+ROOTS = sorted(Path("./test/test_configs").glob("*/root*.toml"))
+
+
+def expected(root: Path):
+    try:
+        return resolve_config(root)
+    except Exception as e:
+        return e
+
+
+def assert_same(results: dict, roots: list[Path]) -> None:
+    assert list(results) == roots
+    for root in roots:
+        want = expected(root)
+        if isinstance(want, Exception):
+            assert type(results[root]) is type(want)
+            assert str(results[root]) == str(want)
+        else:
+            assert results[root] == want
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"max_workers": 4}, {"processes": 2}, {"processes": 2, "max_workers": 2}],
+    ids=str,
+)
+def test_matches_resolve_config(options):
+    roots = ROOTS + ERROR_ROOTS
+    assert_same(resolve_many(roots, **options), roots)
+
+
+def write_services(tmp_path: Path, count: int) -> list[Path]:
+    common = tmp_path / "common"
+    common.mkdir()
+    (common / "db.toml").write_text('host = "db"\nport = 5432\n')
+    (common / "logging.toml").write_text(
+        'level = "info"\nimports = [{import = "db.toml", as = "sink"}]\n'
+    )
+    roots = []
+    for i in range(count):
+        service = tmp_path / f"service_{i}"
+        service.mkdir()
+        root = service / "root.toml"
+        root.write_text(
+            f'name = "service_{i}"\n'
+            "imports = [\n"
+            '  {import = "../common/db.toml"},\n'
+            '  {from = "../common/logging.toml", import = "*"},\n'
+            "]\n"
+        )
+        roots.append(root)
+    return roots
+
+
+def test_shared_files_are_loaded_once(tmp_path):
+    roots = write_services(tmp_path, 5)
+    calls: Counter[Path] = Counter()
+
+    def loader(path: Path) -> dict:
+        calls[path] += 1
+        return load_config_dict(path)
+
+    results = resolve_many(roots, loader=loader)
+
+    assert_same(results, roots)
+    assert set(calls.values()) == {1}
+    assert len(calls) == 7
+
+
+def test_results_do_not_alias(tmp_path):
+    roots = write_services(tmp_path, 3)
+    results = resolve_many(roots)
+
+    results[roots[0]]["db"]["port"] = 1
+    results[roots[1]]["sink"]["host"] = "other"
+
+    assert results[roots[2]]["db"] == {"host": "db", "port": 5432}
+    assert results[roots[2]]["sink"] == {"host": "db", "port": 5432}
+
+
+@pytest.mark.parametrize("order", [1, -1])
+def test_roots_that_import_each_other_do_not_alias(tmp_path, order):
+    (tmp_path / "a.toml").write_text("[t]\nx = 1\n")
+    (tmp_path / "b.toml").write_text('imports = [{import = "a.toml"}]\n')
+    a, b = tmp_path / "a.toml", tmp_path / "b.toml"
+    results = resolve_many([a, b][::order])
+
+    results[a]["t"]["x"] = 99
+
+    assert results[b] == {"a": {"t": {"x": 1}}}
+    results[b]["a"]["t"]["x"] = 7
+    assert results[a] == {"t": {"x": 99}}
+
+
+def test_frozen_results_share_common_files(tmp_path):
+    roots = write_services(tmp_path, 3)
+    results = resolve_many(roots, frozen=True)
+
+    assert all(type(r) is FrozenTable for r in results.values())
+    first, second, _ = results.values()
+    assert first["db"] is second["db"] is second["sink"]
+    assert_same(resolve_many(roots, frozen=True, processes=2), roots)
+
+
+def test_failing_roots_do_not_stop_the_batch(tmp_path):
+    roots = write_services(tmp_path, 3)
+    roots[1].write_text('imports = [{import = "../common/missing.toml"}]\n')
+    broken = tmp_path / "broken.toml"
+    broken.write_text("imports = [{import = 'broken.toml'}]\n")
+
+    results = resolve_many(roots + [broken])
+
+    assert isinstance(results[roots[1]], FileNotFoundError)
+    assert isinstance(results[broken], ValueError)
+    assert "Circular import" in str(results[broken])
+    assert results[roots[0]]["name"] == "service_0"
+    assert results[roots[2]]["name"] == "service_2"
+
+
+class UnpicklableError(Exception):
+    def __init__(self, path: Path):
+        super().__init__(f"cannot load {path.name}")
+        self.lock = threading.Lock()
+
+
+def unpicklable_error_loader(path: Path) -> dict:
+    if path.name == "bad.toml":
+        raise UnpicklableError(path)
+    return load_config_dict(path)
+
+
+def test_errors_are_per_root_in_processes(tmp_path):
+    good, missing = write_services(tmp_path, 2)
+    missing.write_text('imports = [{import = "../common/missing.toml"}]\n')
+    syntax = tmp_path / "syntax.toml"
+    syntax.write_text("key = \n")
+    bad = tmp_path / "bad.toml"
+    bad.write_text("")
+    roots = [good, syntax, bad, missing]
+
+    results = resolve_many(roots, loader=unpicklable_error_loader, processes=1)
+
+    assert results[good]["name"] == "service_0"
+    assert isinstance(results[syntax], ValueError)
+    assert isinstance(results[missing], FileNotFoundError)
+    assert type(results[bad]) is Exception
+    assert str(results[bad]) == "test.test_batch.UnpicklableError: cannot load bad.toml"
@@ -0,0 +1,36 @@
+from collections import Counter
+from pathlib import Path
+from reconfig import resolve_config
+import pytest
+from test.helpers import counting_loader
+
+
+def test_diamond_imports_loaded_once():
+    """Files imported from several places are loaded only once per run."""
+    root = Path("./test/test_configs/conf_integration/root.toml")
+    counter = Counter()
+    resolve_config(root, loader=counting_loader(counter))
+
+    assert len(counter) == 5
+    assert set(counter.values()) == {1}
+
+
+def test_cached_results_do_not_alias():
+    """Mutating one import of a shared file leaves the other imports intact."""
+    root = Path("./test/test_configs/conf_integration/root.toml")
+    result = resolve_config(root)
+
+    result["section"]["a_renamed"]["section_a"]["sub_section_a"]["sub_sec_var"] = "x"
+
+    assert result["recursive"]["a"]["section_a"]["sub_section_a"] == {
+        "sub_sec_var": "sub_sec_value"
+    }
+    assert result["section"]["sub_sec_var"] == "sub_sec_value"
+
+
+def test_circular_import_detection_with_cache():
+    """Circular imports are still detected when shared files are cached."""
+    root = Path("./test/error_configs/conf_circular_import/root.toml")
+
+    with pytest.raises(ValueError, match="Circular import detected"):
+        resolve_config(root)
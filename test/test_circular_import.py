@@ -11,3 +11,31 @@ def test_circular_import_detection():
     # This should raise an error (either RecursionError or a custom circular import error)
     with pytest.raises(ValueError):
         resolve_config(root)
+
+
+def test_circular_import_message_lists_chain():
+    """The error message shows the full import chain up to the repeated file."""
+    root = Path("./test/error_configs/conf_circular_import/root.toml")
+    folder = root.parent.resolve()
+    chain = [folder / name for name in ["root.toml", "a.toml", "b.toml", "a.toml"]]
+
+    with pytest.raises(ValueError) as error:
+        resolve_config(root)
+
+    assert str(error.value) == "Circular import detected: " + " -> ".join(
+        str(p) for p in chain
+    )
+
+
+def test_diamond_is_not_circular(tmp_path):
+    """Importing the same file along two branches is not a cycle."""
+    (tmp_path / "root.toml").write_text(
+        'imports = [{import = "a.toml"}, {import = "b.toml"}]\n'
+    )
+    (tmp_path / "a.toml").write_text('imports = [{import = "c.toml"}]\n')
+    (tmp_path / "b.toml").write_text('imports = [{import = "c.toml"}]\n')
+    (tmp_path / "c.toml").write_text('var = "value"\n')
+
+    result = resolve_config(tmp_path / "root.toml")
+
+    assert result == {"a": {"c": {"var": "value"}}, "b": {"c": {"var": "value"}}}
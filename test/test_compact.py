@@ -0,0 +1,112 @@
+from array import array
+from pathlib import Path
+from reconfig import freeze, resolve_config
+from reconfig.reconfig import compact_data, copy_tree
+from reconfig.snapshot import open_snapshot, write_snapshot
+
+
+ROOT = Path("./test/test_configs/conf_integration/root.toml")
+
+
+def write_services(tmp_path: Path, count: int) -> Path:
+    imports = []
+    for i in range(count):
+        (tmp_path / f"service_{i}.toml").write_text(
+            f'host = "db.internal"\nport = 5432\nweights = [1, 2, 3]\nname = "s{i}"\n'
+        )
+        imports.append(f'{{import = "service_{i}.toml"}}')
+    root = tmp_path / "root.toml"
+    root.write_text(f"imports = [{', '.join(imports)}]\n")
+    return root
+
+
+def test_interned_result_equals_plain_result():
+    assert resolve_config(ROOT, intern_strings=True) == resolve_config(ROOT)
+
+
+def test_keys_and_values_are_shared_across_files(tmp_path):
+    root = write_services(tmp_path, 3)
+
+    result = resolve_config(root, intern_strings=True)
+
+    first, second = result["service_0"], result["service_1"]
+    assert first["host"] is second["host"]
+    first_keys = {k: k for k in first}
+    assert all(first_keys[k] is k for k in second)
+
+
+def test_long_strings_are_not_interned():
+    def fresh(n: int) -> str:
+        return "".join(["x"] * n)
+
+    data = compact_data({"a": fresh(100), "b": fresh(100)}, {}, max_string_length=64)
+    assert data["a"] is not data["b"]
+
+    data = compact_data({"a": fresh(10), "b": fresh(10)}, {}, max_string_length=64)
+    assert data["a"] is data["b"]
+
+
+def test_compact_arrays():
+    data = compact_data(
+        {
+            "ints": [1, 2, 3],
+            "floats": [1.5, 2.5],
+            "mixed": [1, 2.5],
+            "bools": [True, False],
+            "big": [2**64],
+            "empty": [],
+            "nested": [[1, 2], {"deep": [0.5]}],
+        },
+        None,
+        arrays=True,
+    )
+
+    assert data["ints"] == array("q", [1, 2, 3])
+    assert data["floats"] == array("d", [1.5, 2.5])
+    assert data["mixed"] == [1, 2.5]
+    assert data["bools"] == [True, False]
+    assert data["big"] == [2**64]
+    assert data["empty"] == []
+    assert data["nested"] == [array("q", [1, 2]), {"deep": array("d", [0.5])}]
+
+
+def test_compact_arrays_in_resolution(tmp_path):
+    root = write_services(tmp_path, 2)
+
+    result = resolve_config(root, compact_arrays=True)
+
+    assert result["service_0"]["weights"] == array("q", [1, 2, 3])
+    assert result["service_0"]["weights"] is not result["service_1"]["weights"]
+
+
+def test_arrays_are_copied_not_aliased():
+    weights = array("q", [1, 2])
+    data = {"a": weights, "b": [weights]}
+
+    copied = copy_tree(data)
+
+    assert copied == data
+    assert copied["a"] is not weights and copied["b"][0] is not weights
+
+
+def test_arrays_in_frozen_output_and_snapshots(tmp_path):
+    data = {"ints": array("q", [1, 2]), "floats": array("d", [0.5])}
+
+    assert freeze(data) == {"ints": (1, 2), "floats": (0.5,)}
+
+    path = tmp_path / "config.snap"
+    write_snapshot(data, path)
+    assert open_snapshot(path).to_dict() == {"ints": [1, 2], "floats": [0.5]}
+
+
+def test_compact_options_get_their_own_disk_cache_entry(tmp_path):
+    (tmp_path / "config").mkdir()
+    root = write_services(tmp_path / "config", 1)
+    cache_dir = tmp_path / "cache"
+
+    plain = resolve_config(root, cache_dir=cache_dir)
+    compact = resolve_config(root, cache_dir=cache_dir, compact_arrays=True)
+
+    assert plain["service_0"]["weights"] == [1, 2, 3]
+    assert compact["service_0"]["weights"] == array("q", [1, 2, 3])
+    assert len(list(cache_dir.iterdir())) == 2
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+from reconfig import resolve_config
+import pytest
+
+
+BASE = Path("/deep")
+
+
+def nested(depth: int, leaf: dict) -> dict:
+    data = leaf
+    for i in range(depth):
+        data = {f"t{i}": data}
+    return data
+
+
+def test_nesting_beyond_recursion_limit():
+    depth = 2 * sys.getrecursionlimit()
+    files = {
+        BASE / "root.toml": nested(
+            depth, {"imports": [{"import": "leaf.toml"}], "var": "value"}
+        ),
+        BASE / "leaf.toml": {"leaf_var": "leaf_value"},
+    }
+
+    result = resolve_config(BASE / "root.toml", loader=files.__getitem__)
+
+    for i in reversed(range(depth)):
+        result = result[f"t{i}"]
+    assert result == {"var": "value", "leaf": {"leaf_var": "leaf_value"}}
+
+
+def test_import_chain_beyond_recursion_limit():
+    length = 2 * sys.getrecursionlimit()
+    files = {
+        BASE / f"f{i}.toml": {"imports": [{"import": f"f{i + 1}.toml"}]}
+        for i in range(length)
+    }
+    files[BASE / f"f{length}.toml"] = {"var": "value"}
+
+    result = resolve_config(BASE / "f0.toml", loader=files.__getitem__)
+
+    for i in range(1, length + 1):
+        result = result[f"f{i}"]
+    assert result == {"var": "value"}
+
+
+def test_errors_are_raised_in_table_order():
+    """Errors surface in the same order as a depth-first walk of the tables."""
+    files = {
+        BASE / "root.toml": {
+            "first": {"inner": {"imports": [{"import": "missing_1.toml"}]}},
+            "second": {"imports": [{"import": "missing_2.toml"}]},
+        },
+    }
+
+    with pytest.raises(KeyError, match="missing_1"):
+        resolve_config(BASE / "root.toml", loader=files.__getitem__)
@@ -0,0 +1,102 @@
+import math
+from pathlib import Path
+from reconfig import Change, MISSING, Resolver, diff
+from reconfig.watch import ConfigWatcher
+
+
+def test_changes_in_order():
+    old = {
+        "a": 1,
+        "b": {"x": 1, "y": [1, 2], "z": "same"},
+        "removed": True,
+        "list": [1, 2],
+    }
+    new = {
+        "a": 2,
+        "b": {"x": 1.0, "y": [1, 3], "z": "same", "w": {}},
+        "list": [1, 2, 3],
+        "added": "x",
+    }
+
+    assert list(diff(old, new)) == [
+        Change(("a",), 1, 2),
+        Change(("b", "x"), 1, 1.0),
+        Change(("b", "y", 1), 2, 3),
+        Change(("b", "w"), MISSING, {}),
+        Change(("removed",), True, MISSING),
+        Change(("list",), [1, 2], [1, 2, 3]),
+        Change(("added",), MISSING, "x"),
+    ]
+
+
+def test_equal_configs_have_no_changes():
+    old = {"a": {"b": [1, {"c": math.nan}]}, "d": (1, 2)}
+    new = {"a": {"b": [1, {"c": math.nan}]}, "d": [1, 2]}
+
+    assert list(diff(old, new)) == []
+
+
+class Unequal:
+    def __eq__(self, other):
+        raise AssertionError("shared subtree was walked")
+
+    def __ne__(self, other):
+        raise AssertionError("shared subtree was walked")
+
+
+def test_shared_subtrees_are_skipped():
+    shared = {"deep": [{"value": Unequal()}]}
+
+    changes = list(diff({"shared": shared, "v": 1}, {"shared": shared, "v": 2}))
+
+    assert changes == [Change(("v",), 1, 2)]
+
+
+def write_files(tmp_path: Path) -> Path:
+    (tmp_path / "db.toml").write_text('host = "db1"\nport = 5432\n')
+    (tmp_path / "cache.toml").write_text('host = "cache1"\nsizes = [1, 2, 3]\n')
+    root = tmp_path / "root.toml"
+    root.write_text(
+        "imports = [\n"
+        '  {import = "db.toml"},\n'
+        '  {import = "cache.toml"},\n'
+        '  {import = "cache.toml", as = "cache_copy"},\n'
+        "]\n"
+        "[app]\n"
+        'name = "app"\n'
+    )
+    return root
+
+
+def test_frozen_resolver_shares_unchanged_files(tmp_path):
+    root = write_files(tmp_path)
+    resolver = Resolver(root, frozen=True)
+    old = resolver.resolve()
+
+    (tmp_path / "db.toml").write_text('host = "db2"\nport = 5432\n')
+    new = resolver.update([tmp_path / "db.toml"])
+
+    assert new["cache"] is old["cache"]
+    assert new["app"] is not old["app"] and new["app"] == old["app"]
+    assert list(diff(old, new)) == [Change(("db", "host"), "db1", "db2")]
+
+
+def test_watcher_reports_changes(tmp_path):
+    root = write_files(tmp_path)
+    watcher = ConfigWatcher(root, interval=0, debounce=0, frozen=True)
+    reports = []
+    keys = []
+    watcher.subscribe_changes(lambda config, changes: reports.append(changes))
+    watcher.subscribe(lambda config, changed_keys: keys.append(changed_keys))
+
+    (tmp_path / "cache.toml").write_text('host = "cache1"\nsizes = [1, 2, 4, 8]\n')
+    watcher.poll(now=100.0)
+    watcher.poll(now=200.0)
+
+    assert reports == [
+        [
+            Change(("cache", "sizes"), (1, 2, 3), (1, 2, 4, 8)),
+            Change(("cache_copy", "sizes"), (1, 2, 3), (1, 2, 4, 8)),
+        ]
+    ]
+    assert keys == [{"cache", "cache_copy"}]
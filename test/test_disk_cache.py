@@ -0,0 +1,143 @@
+import os
+from collections import Counter
+from pathlib import Path
+from reconfig import resolve_config, load_toml_dict, toml_loader
+import pytest
+from test.helpers import counting_loader
+
+
+ROOT = """
+imports = [
+    {import = "child.toml"},
+]
+"""
+
+CHILD = """
+imports = [
+    {from = "base.toml", import = "*"},
+]
+child_var = "child_value"
+"""
+
+BASE = """
+base_var = "base_value"
+"""
+
+
+def write_tree(tmp_path: Path) -> Path:
+    (tmp_path / "child.toml").write_text(CHILD)
+    (tmp_path / "base.toml").write_text(BASE)
+    root = tmp_path / "root.toml"
+    root.write_text(ROOT)
+    return root
+
+
+def test_warm_start_skips_loader(tmp_path):
+    """A second run with an unchanged tree is served from the cache."""
+    root = write_tree(tmp_path)
+    cache_dir = tmp_path / "cache"
+    counter = Counter()
+
+    cold = resolve_config(
+        root, loader=counting_loader(counter), cache_dir=cache_dir, cache_key="counting"
+    )
+    assert sum(counter.values()) == 3
+
+    warm = resolve_config(
+        root, loader=counting_loader(counter), cache_dir=cache_dir, cache_key="counting"
+    )
+    assert sum(counter.values()) == 3
+    assert (
+        warm
+        == cold
+        == {"child": {"base_var": "base_value", "child_var": "child_value"}}
+    )
+
+
+def test_changed_dependency_invalidates(tmp_path):
+    """Changing any file in the import graph forces a re-resolve."""
+    root = write_tree(tmp_path)
+    cache_dir = tmp_path / "cache"
+    resolve_config(root, cache_dir=cache_dir)
+
+    (tmp_path / "base.toml").write_text('base_var = "changed_value"\n')
+
+    result = resolve_config(root, cache_dir=cache_dir)
+    assert result["child"]["base_var"] == "changed_value"
+
+
+def test_touched_dependency_with_same_content_is_a_hit(tmp_path):
+    """A new mtime with identical content does not invalidate the entry."""
+    root = write_tree(tmp_path)
+    cache_dir = tmp_path / "cache"
+    counter = Counter()
+    resolve_config(
+        root, loader=counting_loader(counter), cache_dir=cache_dir, cache_key="counting"
+    )
+
+    base = tmp_path / "base.toml"
+    st = base.stat()
+    os.utime(base, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    resolve_config(
+        root, loader=counting_loader(counter), cache_dir=cache_dir, cache_key="counting"
+    )
+    assert sum(counter.values()) == 3
+
+
+def test_cached_result_is_not_shared(tmp_path):
+    """Each warm start returns a fresh dict."""
+    root = write_tree(tmp_path)
+    cache_dir = tmp_path / "cache"
+    resolve_config(root, cache_dir=cache_dir)
+
+    first = resolve_config(root, cache_dir=cache_dir)
+    first["child"]["base_var"] = "mutated"
+
+    second = resolve_config(root, cache_dir=cache_dir)
+    assert second["child"]["base_var"] == "base_value"
+
+
+def test_repointed_symlink_invalidates(tmp_path):
+    (tmp_path / "v1.toml").write_text('version = "v1"\n')
+    (tmp_path / "v2.toml").write_text('version = "v2"\n')
+    current = tmp_path / "current.toml"
+    current.symlink_to("v1.toml")
+    root = tmp_path / "root.toml"
+    root.write_text('imports = [{from = "current.toml", import = "version"}]\n')
+    cache_dir = tmp_path / "cache"
+    assert resolve_config(root, cache_dir=cache_dir) == {"version": "v1"}
+
+    # atomic deploy: a new link renamed over the old one
+    (tmp_path / "next.toml").symlink_to("v2.toml")
+    os.replace(tmp_path / "next.toml", current)
+
+    assert resolve_config(root, cache_dir=cache_dir) == {"version": "v2"}
+
+
+def test_nested_loaders_need_a_cache_key(tmp_path):
+    root = write_tree(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    with pytest.raises(ValueError, match="pass cache_key"):
+        resolve_config(root, loader=lambda p: load_toml_dict(p), cache_dir=cache_dir)
+
+    first = resolve_config(
+        root, loader=lambda p: {"x": 1}, cache_dir=cache_dir, cache_key="one"
+    )
+    second = resolve_config(
+        root, loader=lambda p: {"x": 2}, cache_dir=cache_dir, cache_key="two"
+    )
+    assert (first, second) == ({"x": 1}, {"x": 2})
+
+
+def test_options_that_change_the_result_have_own_entries(tmp_path):
+    root = write_tree(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    resolve_config(root, cache_dir=cache_dir)
+    resolve_config(root, cache_dir=cache_dir, trust_absolute_paths=True)
+    resolve_config(root, cache_dir=cache_dir, loader=toml_loader("tomllib"))
+    resolve_config(root, cache_dir=cache_dir, loader=toml_loader("tomli"))
+
+    assert len(list(cache_dir.iterdir())) == 4
@@ -0,0 +1,103 @@
+import json
+from pathlib import Path
+from reconfig import resolve_config, resolve_config_async
+from reconfig.loaders import FORMAT_PARSERS, load_config_dict, register_format
+import asyncio
+import pytest
+
+
+def write_graph(tmp_path: Path) -> Path:
+    tables = tmp_path / "tables"
+    tables.mkdir()
+    (tables / "routing.json").write_text(
+        json.dumps({"routes": {"a": [1, 2], "b": [3]}, "default": "a"})
+    )
+    (tables / "limits.json").write_text(
+        json.dumps(
+            {
+                "imports": [{"import": "../base.toml::shared"}],
+                "max": {"cpu": 4, "mem": 1024},
+            }
+        )
+    )
+    (tmp_path / "base.toml").write_text('[shared]\nregion = "eu"\n')
+    root = tmp_path / "root.toml"
+    root.write_text(
+        "imports = [\n"
+        '  {import = "tables/routing.json"},\n'
+        '  {import = "tables/limits.json::max", as = "limits"},\n'
+        '  {from = "tables/limits.json", import = "shared"},\n'
+        "]\n"
+    )
+    return root
+
+
+EXPECTED = {
+    "routing": {"routes": {"a": [1, 2], "b": [3]}, "default": "a"},
+    "limits": {"cpu": 4, "mem": 1024},
+    "shared": {"region": "eu"},
+}
+
+
+def test_json_imports_next_to_toml(tmp_path):
+    """JSON files are imported by suffix, with stem naming and :: addressing."""
+    root = write_graph(tmp_path)
+
+    assert resolve_config(root) == EXPECTED
+
+
+def test_other_modes_dispatch_by_suffix(tmp_path):
+    root = write_graph(tmp_path)
+
+    assert resolve_config(root, lazy=True).to_dict() == EXPECTED
+    assert resolve_config(root, max_workers=4) == EXPECTED
+    assert asyncio.run(resolve_config_async(root)) == EXPECTED
+
+
+def test_yaml_import(tmp_path):
+    pytest.importorskip("yaml")
+    (tmp_path / "db.yaml").write_text("primary:\n  host: db1\n  port: 5432\n")
+    (tmp_path / "empty.yml").write_text("")
+    root = tmp_path / "root.toml"
+    root.write_text(
+        'imports = [{import = "db.yaml::primary"}, {import = "empty.yml"}]\n'
+    )
+
+    assert resolve_config(root) == {
+        "primary": {"host": "db1", "port": 5432},
+        "empty": {},
+    }
+
+
+def test_invalid_yaml_raises_value_error(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "bad.yaml"
+    path.write_text("a: [1, 2\n")
+
+    with pytest.raises(ValueError, match="Invalid YAML"):
+        load_config_dict(path)
+
+
+def test_top_level_must_be_a_table(tmp_path):
+    path = tmp_path / "list.json"
+    path.write_text("[1, 2, 3]")
+
+    with pytest.raises(ValueError, match="Expected a table at the top level"):
+        load_config_dict(path)
+
+
+def test_unknown_suffix_is_read_as_toml(tmp_path):
+    path = tmp_path / "settings.conf"
+    path.write_text('key = "value"\n')
+
+    assert load_config_dict(path) == {"key": "value"}
+
+
+def test_register_format(tmp_path, monkeypatch):
+    monkeypatch.setitem(FORMAT_PARSERS, ".ini", None)
+    register_format(".INI", lambda raw: {"from_ini": raw.decode()})
+    (tmp_path / "legacy.ini").write_text("legacy.ini")
+    root = tmp_path / "root.toml"
+    root.write_text('imports = [{from = "legacy.ini", import = "*"}]\n')
+
+    assert resolve_config(root) == {"from_ini": "legacy.ini"}
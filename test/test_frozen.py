@@ -0,0 +1,116 @@
+from collections.abc import Mapping
+from pathlib import Path
+from reconfig import FrozenTable, freeze, resolve_config
+import pickle
+import pytest
+
+
+ROOT = Path("./test/test_configs/conf_integration/root.toml")
+
+
+def test_frozen_result_matches_plain_result():
+    frozen = resolve_config(ROOT, frozen=True)
+
+    assert isinstance(frozen, FrozenTable)
+    assert frozen.to_dict() == resolve_config(ROOT)
+
+
+def test_frozen_result_is_immutable():
+    frozen = resolve_config(ROOT, frozen=True)
+
+    with pytest.raises(TypeError):
+        frozen["section"] = {}
+    with pytest.raises(AttributeError):
+        frozen.update({})
+    assert hash(frozen) == hash(resolve_config(ROOT, frozen=True))
+
+
+def test_imports_of_the_same_file_share_one_table():
+    frozen = resolve_config(ROOT, frozen=True)
+
+    assert frozen["section"]["a_renamed"] is frozen["recursive"]["a"]
+
+
+def test_equal_subtrees_are_shared():
+    data = {
+        "a": {"x": [1, 2], "y": {"z": "v"}},
+        "b": {"x": [1, 2], "y": {"z": "v"}},
+        "c": {"y": {"z": "v"}, "x": [1, 2]},
+    }
+
+    frozen = freeze(data)
+
+    assert frozen["a"] is frozen["b"]
+    assert frozen["a"]["y"] is frozen["c"]["y"]
+    assert frozen["a"]["x"] == (1, 2)
+    # same items in another order is a different table
+    assert frozen["c"] is not frozen["a"]
+    assert list(frozen["c"]) == ["y", "x"]
+
+
+def test_equal_values_of_different_types_are_not_shared():
+    frozen = freeze(
+        {"a": {"v": 1}, "b": {"v": 1.0}, "c": {"v": True}, "d": [0.0], "e": [-0.0]}
+    )
+
+    assert type(frozen["a"]["v"]) is int
+    assert type(frozen["b"]["v"]) is float
+    assert frozen["c"]["v"] is True
+    assert str(frozen["e"][0]) == "-0.0"
+
+
+def test_interned_dict_shares_across_calls():
+    interned = {}
+    first = freeze({"t": {"k": [1]}}, interned)
+    second = freeze({"other": {"k": [1]}}, interned)
+
+    assert first["t"] is second["other"]
+
+
+def test_freeze_deep_tree():
+    data = leaf = {}
+    for _ in range(5000):
+        leaf["child"] = {"list": [leaf.get("value", 0)]}
+        leaf = leaf["child"]
+
+    assert freeze(data).to_dict() == data
+
+
+def test_frozen_table_mapping_behaviour():
+    table = FrozenTable({"a": 1, "b": (1, 2)})
+
+    assert isinstance(table, Mapping)
+    assert table == {"a": 1, "b": (1, 2)}
+    assert table == FrozenTable({"b": (1, 2), "a": 1})
+    assert {table: "hashable"}[FrozenTable({"a": 1, "b": (1, 2)})] == "hashable"
+    assert pickle.loads(pickle.dumps(table)) == table
+    assert table.to_dict() == {"a": 1, "b": [1, 2]}
+
+
+def test_frozen_with_select_and_disk_cache(tmp_path):
+    selected = resolve_config(ROOT, select=["section.var_b"], frozen=True)
+    assert selected == FrozenTable({"section": FrozenTable({"var_b": "val_b"})})
+
+    plain = resolve_config(ROOT)
+    for _ in range(2):
+        cached = resolve_config(ROOT, cache_dir=tmp_path, frozen=True)
+        assert isinstance(cached, FrozenTable)
+        assert cached.to_dict() == plain
+
+
+def test_frozen_and_lazy_are_exclusive():
+    with pytest.raises(ValueError, match="lazy cannot be combined with frozen"):
+        resolve_config(ROOT, lazy=True, frozen=True)
+
+
+def test_equal_instants_with_different_offsets_stay_apart(tmp_path):
+    (tmp_path / "a.toml").write_text("x = 1979-05-27T07:32:00Z\n")
+    (tmp_path / "b.toml").write_text("x = 1979-05-27T02:32:00-05:00\n")
+    root = tmp_path / "root.toml"
+    root.write_text('imports = [{import = "a.toml"}, {import = "b.toml"}]\n')
+
+    result = resolve_config(root, frozen=True)
+
+    assert result["a"]["x"].isoformat() == "1979-05-27T07:32:00+00:00"
+    assert result["b"]["x"].isoformat() == "1979-05-27T02:32:00-05:00"
+    assert result["a"] is not result["b"]
@@ -0,0 +1,69 @@
+from pathlib import Path
+from reconfig import resolve_config
+from reconfig.import_types import Import, compile_imports
+
+
+BASE = Path("/import_free")
+
+
+def test_compile_imports():
+    leaf = {"key": "value"}
+    deep_import = {"imports": [{"import": "a.toml"}, {"bad": "import"}]}
+    middle = {"deep": deep_import, "leaf": leaf}
+    data = {"middle": middle, "other": {"leaf": {"key": 1}}}
+
+    assert compile_imports(data) == {
+        id(data): [],
+        id(middle): [],
+        id(deep_import): [Import("a.toml"), {"bad": "import"}],
+    }
+
+
+def test_import_free_tables_are_reused():
+    lookup = {"table_0": {"key": 0}, "table_1": {"key": 1}}
+    files = {
+        BASE / "root.toml": {
+            "imports": [{"import": "data.toml"}],
+            "service": {
+                "imports": [{"import": "data.toml::lookup", "as": "copy"}],
+                "settings": {"timeout": 10},
+            },
+        },
+        BASE / "data.toml": {"lookup": lookup},
+    }
+
+    result = resolve_config(BASE / "root.toml", loader=files.__getitem__)
+
+    assert result == {
+        "data": {"lookup": lookup},
+        "service": {"copy": lookup, "settings": {"timeout": 10}},
+    }
+    # the first use shares the loaded table, later uses get a copy
+    assert result["data"]["lookup"] is lookup
+    assert result["service"]["copy"] is not lookup
+    assert (
+        result["service"]["settings"]
+        is files[BASE / "root.toml"]["service"]["settings"]
+    )
+
+
+def test_tables_with_nested_imports_are_resolved():
+    files = {
+        BASE / "root.toml": {
+            "outer": {
+                "plain": {"key": "value"},
+                "inner": {"imports": [{"import": "leaf.toml"}]},
+            },
+        },
+        BASE / "leaf.toml": {"leaf_var": "leaf_value"},
+    }
+
+    result = resolve_config(BASE / "root.toml", loader=files.__getitem__)
+
+    assert result == {
+        "outer": {
+            "plain": {"key": "value"},
+            "inner": {"leaf": {"leaf_var": "leaf_value"}},
+        },
+    }
+    assert "imports" in files[BASE / "root.toml"]["outer"]["inner"]
@@ -0,0 +1,117 @@
+from pathlib import Path
+from reconfig import GraphEdge, Profiler, Resolver, graph, resolve_config
+from reconfig.import_types import FromImportMany, FromImportStar, Import, ImportAs
+import pytest
+from test.helpers import TEST_ROOTS
+
+
+CONFIGS = Path("./test/test_configs/conf_integration").resolve()
+ROOT = CONFIGS / "root.toml"
+A, B, C = CONFIGS / "a.toml", CONFIGS / "b.toml", CONFIGS / "c.toml"
+RECURSIVE = CONFIGS / "recursive.toml"
+
+
+def test_edges():
+    g = graph(ROOT)
+
+    assert g.root == ROOT
+    assert g.files == [ROOT, RECURSIVE, A, B, C]
+    assert [(e.parent, e.child, e.table) for e in g.edges] == [
+        (ROOT, RECURSIVE, ()),
+        (ROOT, A, ("section",)),
+        (ROOT, A, ("section",)),
+        (ROOT, A, ("section",)),
+        (ROOT, B, ("section",)),
+        (ROOT, B, ("section",)),
+        (ROOT, B, ("section",)),
+        (ROOT, C, ("section",)),
+        (ROOT, C, ("section",)),
+        (RECURSIVE, A, ()),
+        (RECURSIVE, B, ()),
+        (RECURSIVE, C, ()),
+    ]
+    assert g.edges[0] == GraphEdge(ROOT, RECURSIVE, Import("./recursive.toml"), ())
+    assert g.edges[3].imp == ImportAs("a.toml", as_name="a_renamed")
+    assert g.edges[7].imp == FromImportStar("c.toml")
+    assert g.edges[8].imp.inside_address == ("section_c",)
+    assert type(g.edges[8].imp) is FromImportMany
+
+
+def test_nested_tables(tmp_path):
+    (tmp_path / "x.toml").write_text("")
+    (tmp_path / "root.toml").write_text(
+        "imports = [{import = 'x.toml', as = 'top'}]\n"
+        "[a.b]\nimports = [{import = 'x.toml::k', as = 'deep'}]\n"
+        "[c]\nimports = [{from = 'x.toml', import = 'k'}]\n"
+    )
+
+    g = graph(tmp_path / "root.toml", max_workers=2)
+
+    assert [e.table for e in g.edges] == [(), ("a", "b"), ("c",)]
+
+
+@pytest.mark.parametrize("root", TEST_ROOTS, ids=str)
+def test_topological_order_is_resolution_order(root):
+    profiler = Profiler()
+    resolve_config(root, profiler=profiler)
+    finished = [
+        e.name
+        for e in sorted(profiler.events, key=lambda e: e.start + e.duration)
+        if e.category == "resolve"
+    ]
+
+    assert [str(p) for p in graph(root).topological_order()] == finished
+
+
+def test_cycles(tmp_path):
+    for name, imports in [
+        ("root", ["a"]),
+        ("a", ["b", "d"]),
+        ("b", ["c"]),
+        ("c", ["a", "c"]),
+        ("d", ["a"]),
+    ]:
+        lines = ", ".join(f"{{import = '{i}.toml'}}" for i in imports)
+        (tmp_path / f"{name}.toml").write_text(f"imports = [{lines}]\n")
+    p = {name: (tmp_path / f"{name}.toml").resolve() for name in "root a b c d".split()}
+
+    g = graph(p["root"])
+
+    assert g.cycles() == [
+        [p["a"], p["b"], p["c"], p["a"]],
+        [p["c"], p["c"]],
+        [p["a"], p["d"], p["a"]],
+    ]
+    with pytest.raises(
+        ValueError, match="Circular import detected: .*a.toml -> .*b.toml"
+    ):
+        g.topological_order()
+    assert g.affected([p["d"]]) == {p["root"], p["a"], p["b"], p["c"], p["d"]}
+
+
+def test_dag_without_cycles():
+    g = graph(ROOT)
+
+    assert g.cycles() == []
+    assert g.affected([C]) == {C, RECURSIVE, ROOT}
+    assert g.importers()[A] == {ROOT, RECURSIVE}
+
+
+@pytest.mark.parametrize("root", TEST_ROOTS, ids=str)
+def test_resolver_graph_matches_graph(root):
+    resolver = Resolver(root)
+    resolver.resolve()
+    expected = graph(root)
+
+    assert resolver.graph().topological_order() == expected.topological_order()
+    assert resolver.importers() == expected.importers()
+    assert resolver.affected(expected.files[-1:]) == expected.affected(
+        expected.files[-1:]
+    )
+
+
+def test_circular_fixture():
+    configs = Path("./test/error_configs/conf_circular_import").resolve()
+    g = graph(configs / "root.toml")
+
+    assert g.cycles() == [[configs / "a.toml", configs / "b.toml", configs / "a.toml"]]
@@ -0,0 +1,61 @@
+import dataclasses
+from pathlib import Path
+from reconfig import Resolver
+from reconfig.import_types import (
+    FromImportMany,
+    FromImportOneAs,
+    Import,
+    detect_import,
+)
+import reconfig.import_types
+import pytest
+
+
+def test_import_string_is_parsed_once():
+    imp = Import("dir/a.toml::section.sub.var")
+
+    assert imp.path_string == "dir/a.toml"
+    assert imp.inside_address == ("section", "sub", "var")
+    assert Import("a.toml").inside_address == ()
+
+
+def test_imports_are_frozen_and_slotted():
+    imp = FromImportOneAs("a.toml", import_name="var", as_name="renamed")
+
+    assert not hasattr(imp, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        imp.as_name = "other"  # type: ignore[misc]
+    assert hash(imp) == hash(FromImportOneAs("a.toml", "var", "renamed"))
+
+
+def test_detect_import_many_names_as_tuple():
+    imp = detect_import({"from": "a.toml", "import": ["x", "y"]})
+
+    assert imp == FromImportMany("a.toml", import_names=("x", "y"))
+
+
+def test_shared_file_imports_are_compiled_once(tmp_path, monkeypatch):
+    """Re-resolving an importer reuses its compiled imports."""
+    (tmp_path / "base.toml").write_text('var = "value"\n')
+    (tmp_path / "mid.toml").write_text(
+        'imports = [{import = "base.toml"}, {from = "base.toml", import = "var"}]\n'
+    )
+    (tmp_path / "root.toml").write_text('imports = [{import = "mid.toml"}]\n')
+
+    calls = []
+    original = reconfig.import_types.detect_import
+
+    def counting_detect_import(import_dict):
+        calls.append(import_dict)
+        return original(import_dict)
+
+    monkeypatch.setattr(reconfig.import_types, "detect_import", counting_detect_import)
+    resolver = Resolver(tmp_path / "root.toml")
+    resolver.resolve()
+    assert len(calls) == 3
+
+    (tmp_path / "base.toml").write_text('var = "new_value"\n')
+    result = resolver.update({Path(tmp_path / "base.toml")})
+
+    assert len(calls) == 3
+    assert result == {"mid": {"base": {"var": "new_value"}, "var": "new_value"}}
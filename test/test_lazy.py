@@ -0,0 +1,151 @@
+import sys
+from collections import Counter
+from pathlib import Path
+from reconfig import LazyTable, resolve_config
+import pytest
+from test.helpers import ERROR_ROOTS, TEST_ROOTS, counting_loader
+
+
+@pytest.mark.parametrize("root", TEST_ROOTS, ids=str)
+def test_lazy_matches_eager(root):
+    result = resolve_config(root, lazy=True)
+
+    assert isinstance(result, LazyTable)
+    assert result == resolve_config(root)
+    assert result.to_dict() == resolve_config(root)
+
+
+@pytest.mark.parametrize("root", ERROR_ROOTS, ids=str)
+def test_lazy_errors_are_enforced(root):
+    with pytest.raises(ValueError):
+        resolve_config(root, lazy=True).to_dict()
+
+
+def test_imports_load_on_first_access():
+    root = Path("./test/test_configs/conf_integration/root.toml")
+    counter = Counter()
+    result = resolve_config(
+        root, loader=counting_loader(counter, by_name=True), lazy=True
+    )
+
+    assert counter == Counter({"root.toml": 1})
+    assert list(result) == ["section", "recursive"]
+
+    assert result["section"]["var_a"] == "val_a"
+    assert counter == Counter({"root.toml": 1, "a.toml": 1, "c.toml": 1})
+
+    assert result["section"]["var_b"] == "val_b"
+    assert result["recursive"]["a"]["var_a"] == "val_a"
+    assert counter == Counter(
+        {"root.toml": 1, "a.toml": 1, "b.toml": 1, "c.toml": 1, "recursive.toml": 1}
+    )
+
+
+def test_star_imports_load_eagerly(tmp_path):
+    (tmp_path / "star.toml").write_text('star_var = "star_value"\n')
+    (tmp_path / "other.toml").write_text('other_var = "other_value"\n')
+    (tmp_path / "root.toml").write_text(
+        "imports = [\n"
+        '    {from = "star.toml", import = "*"},\n'
+        '    {import = "other.toml"},\n'
+        "]\n"
+    )
+    counter = Counter()
+    result = resolve_config(
+        tmp_path / "root.toml", loader=counting_loader(counter, by_name=True), lazy=True
+    )
+
+    assert counter == Counter({"root.toml": 1, "star.toml": 1})
+    assert list(result) == ["star_var", "other"]
+
+
+def test_circular_import_raises_on_access():
+    root = Path("./test/error_configs/conf_circular_import/root.toml")
+    result = resolve_config(root, lazy=True)
+
+    with pytest.raises(ValueError, match="Circular import detected"):
+        result["a"]["b"]["a"]
+
+
+def test_missing_name_raises_on_access(tmp_path):
+    (tmp_path / "a.toml").write_text('var = "value"\n')
+    (tmp_path / "root.toml").write_text(
+        'imports = [{from = "a.toml", import = "missing"}]\n'
+    )
+    result = resolve_config(tmp_path / "root.toml", lazy=True)
+
+    assert list(result) == ["missing"]
+    with pytest.raises(KeyError):
+        result["missing"]
+
+
+def test_lazy_rejects_eager_only_options():
+    root = Path("./test/test_configs/conf_integration/root.toml")
+
+    with pytest.raises(ValueError):
+        resolve_config(root, lazy=True, max_workers=4)
+
+
+def test_star_import_chain_beyond_recursion_limit():
+    base = Path("/deep")
+    length = 2 * sys.getrecursionlimit()
+    files = {
+        base / f"f{i}.toml": {
+            "imports": [{"from": f"f{i + 1}.toml", "import": "*"}],
+            f"var{i}": i,
+        }
+        for i in range(length)
+    }
+    files[base / f"f{length}.toml"] = {f"var{length}": length}
+
+    result = resolve_config(base / "f0.toml", loader=files.__getitem__, lazy=True)
+
+    assert len(result) == length + 1
+    assert result[f"var{length}"] == length
+
+
+def write_cycle_off_the_first_path(tmp_path: Path) -> Path:
+    # f and y import each other, but z reaches y without passing f
+    files = {
+        "root.toml": 'imports = [{import = "x.toml"}, {import = "z.toml"}]\n',
+        "x.toml": 'imports = [{import = "f.toml"}]\n',
+        "z.toml": 'imports = [{import = "y.toml"}]\n',
+        "f.toml": 'fv = 1\nimports = [{import = "y.toml"}]\n',
+        "y.toml": 'yv = 2\nimports = [{import = "f.toml"}]\n',
+    }
+    for name, text in files.items():
+        (tmp_path / name).write_text(text)
+    return tmp_path / "root.toml"
+
+
+def test_cycle_is_found_whichever_branch_is_read_first(tmp_path):
+    root = write_cycle_off_the_first_path(tmp_path)
+    with pytest.raises(ValueError, match="Circular import detected"):
+        resolve_config(root)
+
+    result = resolve_config(root, lazy=True)
+    assert result["z"]["y"]["yv"] == 2
+    with pytest.raises(ValueError, match="Circular import detected"):
+        result["x"]["f"]["y"]["f"]
+    with pytest.raises(ValueError, match="Circular import detected"):
+        resolve_config(root, lazy=True).to_dict()
+    with pytest.raises(ValueError, match="Circular import detected"):
+        resolve_config(root, select=["z.y.yv", "x"])
+
+
+def test_to_dict_checks_unused_parts_of_loaded_files(tmp_path):
+    (tmp_path / "b.toml").write_text("x = 1\n")
+    (tmp_path / "a.toml").write_text(
+        'v = 1\n[t]\nx = 3\nimports = [{from = "b.toml", import = "x"}]\n'
+    )
+    (tmp_path / "root.toml").write_text('imports = [{from = "a.toml", import = "v"}]\n')
+    root = tmp_path / "root.toml"
+
+    assert resolve_config(root, lazy=True)["v"] == 1
+    assert resolve_config(root, select=["v"]) == {"v": 1}
+    for resolved in (
+        lambda: resolve_config(root),
+        resolve_config(root, lazy=True).to_dict,
+    ):
+        with pytest.raises(ValueError, match="Import conflict"):
+            resolved()
@@ -0,0 +1,94 @@
+import threading
+import time
+from pathlib import Path
+from reconfig import resolve_config, load_toml_dict
+import pytest
+from test.helpers import ERROR_ROOTS, TEST_ROOTS
+
+
+@pytest.mark.parametrize("root", TEST_ROOTS, ids=str)
+def test_parallel_matches_serial(root):
+    assert resolve_config(root, max_workers=4) == resolve_config(root)
+
+
+@pytest.mark.parametrize("root", ERROR_ROOTS, ids=str)
+def test_parallel_errors_match_serial(root):
+    with pytest.raises(ValueError) as serial:
+        resolve_config(root)
+    with pytest.raises(ValueError) as parallel:
+        resolve_config(root, max_workers=4)
+
+    assert str(parallel.value) == str(serial.value)
+
+
+def test_missing_file_error_matches_serial(tmp_path):
+    root = tmp_path / "root.toml"
+    root.write_text('imports = [{import = "missing.toml"}]\n')
+
+    with pytest.raises(FileNotFoundError) as serial:
+        resolve_config(root)
+    with pytest.raises(FileNotFoundError) as parallel:
+        resolve_config(root, max_workers=4)
+
+    assert str(parallel.value) == str(serial.value)
+
+
+def test_siblings_are_loaded_concurrently(tmp_path):
+    names = [f"frag_{i}" for i in range(8)]
+    for name in names:
+        (tmp_path / f"{name}.toml").write_text(f'{name}_var = "{name}"\n')
+    root = tmp_path / "root.toml"
+    root.write_text(
+        "imports = [" + ", ".join(f'{{import = "{n}.toml"}}' for n in names) + "]\n"
+    )
+
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def slow_loader(path: Path) -> dict:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return load_toml_dict(path)
+
+    result = resolve_config(root, loader=slow_loader, max_workers=8)
+
+    assert list(result) == names
+    assert peak > 1
+
+
+@pytest.mark.parametrize("root", TEST_ROOTS, ids=str)
+def test_processes_match_serial(root):
+    # repr also compares the order of keys
+    assert repr(resolve_config(root, processes=2)) == repr(resolve_config(root))
+
+
+@pytest.mark.parametrize("root", ERROR_ROOTS, ids=str)
+def test_processes_errors_match_serial(root):
+    with pytest.raises(ValueError) as serial:
+        resolve_config(root)
+    with pytest.raises(ValueError) as parallel:
+        resolve_config(root, processes=2)
+
+    assert str(parallel.value) == str(serial.value)
+
+
+def test_processes_with_other_options(tmp_path):
+    root = TEST_ROOTS[0]
+    expected = resolve_config(root)
+
+    # not picklable, so every file is loaded in this process
+    assert (
+        resolve_config(root, loader=lambda p: load_toml_dict(p), processes=2)
+        == expected
+    )
+    for _ in range(2):
+        assert resolve_config(root, processes=2, cache_dir=tmp_path) == expected
+    assert resolve_config(root, processes=2, frozen=True) == expected
+    with pytest.raises(ValueError, match="cannot be combined with processes"):
+        resolve_config(root, processes=2, max_workers=2)
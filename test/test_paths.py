@@ -0,0 +1,73 @@
+from collections import Counter
+from pathlib import Path
+from reconfig import resolve_config
+import reconfig.reconfig
+
+
+def write_linked_tree(tmp_path: Path) -> Path:
+    """links/link.toml -> real/target.toml; both dirs have a sibling.toml."""
+    real = tmp_path / "real"
+    links = tmp_path / "links"
+    real.mkdir()
+    links.mkdir()
+    (real / "target.toml").write_text('imports = [{import = "sibling.toml"}]\n')
+    (real / "sibling.toml").write_text('where = "real"\n')
+    (links / "sibling.toml").write_text('where = "links"\n')
+    (links / "link.toml").symlink_to(real / "target.toml")
+    return links / "link.toml"
+
+
+def test_symlinks_are_resolved_to_their_target(tmp_path):
+    """Relative imports in a linked file are relative to the link's target."""
+    link = write_linked_tree(tmp_path)
+    root = tmp_path / "root.toml"
+    root.write_text(
+        "imports = [\n"
+        f'    {{import = "{link}"}},\n'
+        '    {import = "links/link.toml", as = "rel"},\n'
+        "]\n"
+    )
+
+    result = resolve_config(root)
+
+    # the key comes from the import string, the content from the target
+    assert result == {
+        "link": {"sibling": {"where": "real"}},
+        "rel": {"sibling": {"where": "real"}},
+    }
+
+
+def test_trusted_absolute_paths_keep_symlinks(tmp_path):
+    """Trusted absolute imports are not resolved, so a linked file's relative
+    imports are relative to the directory of the link."""
+    link = write_linked_tree(tmp_path)
+    root = tmp_path / "root.toml"
+    root.write_text(f'imports = [{{import = "{link.parent}/../links/./link.toml"}}]\n')
+
+    result = resolve_config(root, trust_absolute_paths=True)
+
+    assert result == {"link": {"sibling": {"where": "links"}}}
+
+
+def test_repeated_imports_are_canonicalized_once(tmp_path, monkeypatch):
+    (tmp_path / "base.toml").write_text('var = "value"\n')
+    (tmp_path / "root.toml").write_text(
+        "imports = [\n"
+        '    {import = "base.toml", as = "first"},\n'
+        '    {import = "base.toml", as = "second"},\n'
+        "]\n"
+        "[section]\n"
+        'imports = [{from = "base.toml", import = "var"}]\n'
+    )
+    counter = Counter()
+    original = reconfig.reconfig.resolve_path
+
+    def counting_resolve_path(base_path, path_str, trust_absolute=False):
+        counter[(base_path, path_str)] += 1
+        return original(base_path, path_str, trust_absolute)
+
+    monkeypatch.setattr(reconfig.reconfig, "resolve_path", counting_resolve_path)
+    result = resolve_config(tmp_path / "root.toml")
+
+    assert result["section"] == {"var": "value"}
+    assert list(counter.values()) == [1]
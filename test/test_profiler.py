@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+from reconfig import Profiler, load_toml_dict, resolve_config
+import pytest
+
+
+ROOT = Path("./test/test_configs/conf_integration/root.toml")
+
+
+def test_profile_of_every_file():
+    profiler = Profiler()
+    result = resolve_config(ROOT, profiler=profiler)
+
+    assert result == resolve_config(ROOT)
+    files = {path.name: profile for path, profile in profiler.files.items()}
+    assert set(files) == {"root.toml", "recursive.toml", "a.toml", "b.toml", "c.toml"}
+    for path, profile in profiler.files.items():
+        assert profile.bytes_read == path.stat().st_size
+        assert profile.load_time > 0 and profile.parse_time > 0
+        assert profile.resolve_time > 0
+
+
+def test_import_counts_and_types():
+    profiler = Profiler()
+    resolve_config(ROOT, profiler=profiler)
+    files = {path.name: profile for path, profile in profiler.files.items()}
+
+    assert files["root.toml"].imports == 0
+    assert files["recursive.toml"].imports == 1
+    # root.toml imports a.toml three times, recursive.toml once
+    assert files["a.toml"].imports == 4
+    assert files["a.toml"].import_types == {"Import": 3, "ImportAs": 1}
+    assert files["b.toml"].import_types == {
+        "Import": 1,
+        "FromImportOne": 2,
+        "FromImportOneAs": 1,
+    }
+    assert files["c.toml"].import_types == {
+        "Import": 1,
+        "FromImportStar": 1,
+        "FromImportMany": 1,
+    }
+
+
+def test_custom_loader_counts_as_load_time():
+    profiler = Profiler()
+    resolve_config(ROOT, loader=load_toml_dict, profiler=profiler)
+
+    for path, profile in profiler.files.items():
+        assert profile.load_time > 0
+        assert profile.parse_time == 0
+        assert profile.bytes_read == path.stat().st_size
+
+
+def test_resolve_time_excludes_imported_files():
+    """Self times of all files add up to the root's span plus its own load."""
+    profiler = Profiler()
+    resolve_config(ROOT, profiler=profiler)
+
+    spans = [e for e in profiler.events if e.category == "resolve"]
+    assert len(spans) == 5
+    root_span = max(spans, key=lambda e: e.duration)
+    root = profiler.files[ROOT.resolve()]
+    assert root_span.name == str(ROOT.resolve())
+    assert sum(p.total_time for p in profiler.files.values()) == pytest.approx(
+        root_span.duration + root.load_time + root.parse_time
+    )
+
+
+def test_table_is_sorted():
+    profiler = Profiler()
+    resolve_config(ROOT, profiler=profiler)
+
+    lines = profiler.table(sort_by="bytes_read").splitlines()
+    assert lines[0].split()[:2] == ["total", "ms"]
+    sizes = [int(line.split()[4]) for line in lines[1:]]
+    assert sizes == sorted(sizes, reverse=True)
+    assert any("[Import x3, ImportAs x1]" in line for line in lines)
+    assert len(profiler.table(limit=2).splitlines()) == 3
+
+
+def test_chrome_trace(tmp_path):
+    profiler = Profiler()
+    resolve_config(ROOT, profiler=profiler)
+    trace_file = tmp_path / "trace.json"
+
+    profiler.write_chrome_trace(trace_file)
+
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    assert {e["cat"] for e in events} == {"load", "parse", "resolve"}
+    assert all(e["ph"] == "X" and e["ts"] >= 0 and e["dur"] >= 0 for e in events)
+    root = next(e for e in events if e["cat"] == "resolve" and "root.toml" in e["name"])
+    for e in events:
+        if e["cat"] == "resolve":
+            assert root["ts"] <= e["ts"]
+            assert e["ts"] + e["dur"] <= root["ts"] + root["dur"] + 1e-3
+
+
+def test_profiler_with_other_options(tmp_path):
+    profiler = Profiler()
+    resolve_config(ROOT, profiler=profiler, max_workers=4, cache_dir=tmp_path)
+    assert len(profiler.files) == 5
+    assert all(p.parse_time > 0 for p in profiler.files.values())
+
+    with pytest.raises(ValueError, match="cannot be combined"):
+        resolve_config(ROOT, lazy=True, profiler=Profiler())
+    with pytest.raises(ValueError, match="cannot be combined with processes"):
+        resolve_config(ROOT, processes=2, profiler=Profiler())
@@ -0,0 +1,155 @@
+from pathlib import Path
+from reconfig import Origin, Provenance, resolve_config
+from reconfig.import_types import (
+    FromImportMany,
+    FromImportOne,
+    FromImportOneAs,
+    FromImportStar,
+    Import,
+    ImportAs,
+)
+import pytest
+
+
+CONFIGS = Path("./test/test_configs/conf_integration").resolve()
+ROOT = CONFIGS / "root.toml"
+A, B, C = CONFIGS / "a.toml", CONFIGS / "b.toml", CONFIGS / "c.toml"
+RECURSIVE = CONFIGS / "recursive.toml"
+
+
+@pytest.fixture(scope="module")
+def provenance():
+    provenance = Provenance()
+    resolve_config(ROOT, provenance=provenance)
+    return provenance
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        (
+            "section.var_a",
+            Origin(A, ("var_a",), Import("a.toml::var_a"), ROOT, ("section",)),
+        ),
+        (
+            "section.a_renamed.section_a.sub_section_a.sub_sec_var",
+            Origin(
+                A,
+                ("section_a", "sub_section_a", "sub_sec_var"),
+                ImportAs("a.toml", as_name="a_renamed"),
+                ROOT,
+                ("section",),
+            ),
+        ),
+        (
+            "section.var_b",
+            Origin(
+                B,
+                ("var_b",),
+                FromImportOne("b.toml", import_name="var_b"),
+                ROOT,
+                ("section",),
+            ),
+        ),
+        (
+            "section.renamed_sec_val_b",
+            Origin(
+                B,
+                ("section_b", "sec_val_b"),
+                FromImportOneAs(
+                    "b.toml::section_b",
+                    import_name="sec_val_b",
+                    as_name="renamed_sec_val_b",
+                ),
+                ROOT,
+                ("section",),
+            ),
+        ),
+        (
+            "section.section_c.section_var_c1",
+            Origin(
+                C,
+                ("section_c", "section_var_c1"),
+                FromImportStar("c.toml"),
+                ROOT,
+                ("section",),
+            ),
+        ),
+        (
+            "section.section_var_c2",
+            Origin(
+                C,
+                ("section_c", "section_var_c2"),
+                FromImportMany(
+                    "c.toml::section_c",
+                    import_names=("section_var_c0", "section_var_c2"),
+                ),
+                ROOT,
+                ("section",),
+            ),
+        ),
+        (
+            ("recursive", "b", "section_b"),
+            Origin(B, ("section_b",), Import("b.toml"), RECURSIVE, ()),
+        ),
+        ("recursive", Origin(RECURSIVE, (), Import("./recursive.toml"), ROOT, ())),
+    ],
+)
+def test_where(provenance, key, expected):
+    origin = provenance.where(key)
+    assert origin == expected
+    assert type(origin.imp) is type(expected.imp)
+
+
+def test_values_of_the_root(tmp_path):
+    root = tmp_path / "root.toml"
+    root.write_text('name = "app"\n[server]\nport = 80\n')
+    provenance = Provenance()
+    resolve_config(root, provenance=provenance)
+
+    assert provenance.where("server.port") == Origin(root.resolve(), ("server", "port"))
+
+
+def test_chains_of_imports(tmp_path):
+    (tmp_path / "leaf.toml").write_text("[db]\nhost = 'db1'\nport = 1\n")
+    (tmp_path / "mid.toml").write_text(
+        "[services]\nimports = [{from = 'leaf.toml', import = '*'}]\n"
+    )
+    (tmp_path / "root.toml").write_text(
+        "[app]\nimports = [{import = 'mid.toml::services.db', as = 'database'}]\n"
+    )
+    provenance = Provenance()
+    resolve_config(tmp_path / "root.toml", provenance=provenance)
+
+    assert provenance.where("app.database.host") == Origin(
+        (tmp_path / "leaf.toml").resolve(),
+        ("db", "host"),
+        FromImportStar("leaf.toml"),
+        (tmp_path / "mid.toml").resolve(),
+        ("services",),
+    )
+
+
+def test_same_with_other_options(provenance, tmp_path):
+    keys = [
+        "section.var_b",
+        "section.a_renamed.var_a",
+        "recursive.c.section_c",
+        "section.section_var_c0",
+    ]
+    for options in [
+        {"frozen": True},
+        {"max_workers": 4},
+        {"cache_dir": tmp_path},
+        {"cache_dir": tmp_path},
+    ]:
+        other = Provenance()
+        resolve_config(ROOT, provenance=other, **options)
+        assert [other.where(k) for k in keys] == [provenance.where(k) for k in keys]
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="Nothing has been resolved"):
+        Provenance().where("a")
+    with pytest.raises(ValueError, match="cannot be combined"):
+        resolve_config(ROOT, lazy=True, provenance=Provenance())
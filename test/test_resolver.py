@@ -0,0 +1,134 @@
+from collections import Counter
+from pathlib import Path
+from reconfig import Resolver, resolve_config
+import pytest
+from test.helpers import counting_loader
+
+
+ROOT = """
+imports = [
+    {import = "a.toml"},
+    {import = "b.toml"},
+]
+"""
+
+A = """
+imports = [
+    {from = "base.toml", import = "*"},
+]
+a_var = "a_value"
+"""
+
+B = """
+imports = [
+    {import = "base.toml::base_var"},
+    {import = "leaf.toml"},
+]
+"""
+
+BASE = """
+base_var = "base_value"
+"""
+
+LEAF = """
+leaf_var = "leaf_value"
+"""
+
+
+def write_tree(tmp_path: Path) -> Path:
+    for name, content in [("a", A), ("b", B), ("base", BASE), ("leaf", LEAF)]:
+        (tmp_path / f"{name}.toml").write_text(content)
+    root = tmp_path / "root.toml"
+    root.write_text(ROOT)
+    return root
+
+
+def test_resolver_matches_resolve_config(tmp_path):
+    root = write_tree(tmp_path)
+    resolver = Resolver(root)
+
+    assert resolver.resolve() == resolve_config(root)
+    assert resolver.files == {
+        (tmp_path / f"{name}.toml").resolve()
+        for name in ["root", "a", "b", "base", "leaf"]
+    }
+
+
+def test_update_reloads_only_changed_files(tmp_path):
+    """Only changed files hit the loader; importers reuse their loaded data."""
+    root = write_tree(tmp_path)
+    counter = Counter()
+    resolver = Resolver(root, loader=counting_loader(counter))
+    resolver.resolve()
+    counter.clear()
+
+    leaf = tmp_path / "leaf.toml"
+    leaf.write_text('leaf_var = "new_leaf_value"\n')
+    result = resolver.update({leaf})
+
+    assert counter == Counter({leaf.resolve(): 1})
+    assert result == resolve_config(root)
+    assert result["b"]["leaf"] == {"leaf_var": "new_leaf_value"}
+
+
+def test_affected_files_are_transitive_importers(tmp_path):
+    root = write_tree(tmp_path)
+    resolver = Resolver(root)
+    resolver.resolve()
+
+    affected = resolver.affected({tmp_path / "leaf.toml"})
+    assert affected == {
+        (tmp_path / "leaf.toml").resolve(),
+        (tmp_path / "b.toml").resolve(),
+        root.resolve(),
+    }
+
+
+def test_update_follows_new_imports(tmp_path):
+    """Files added to or dropped from `imports` are picked up on update."""
+    root = write_tree(tmp_path)
+    resolver = Resolver(root)
+    resolver.resolve()
+
+    b = tmp_path / "b.toml"
+    b.write_text('imports = [{import = "base.toml::base_var"}]\n')
+    result = resolver.update({b})
+
+    assert result == resolve_config(root)
+    assert (tmp_path / "leaf.toml").resolve() not in resolver.files
+
+
+def test_result_does_not_share_cache(tmp_path):
+    root = write_tree(tmp_path)
+    resolver = Resolver(root)
+    first = resolver.resolve()
+    first["a"]["base_var"] = "mutated"
+
+    second = resolver.update({tmp_path / "leaf.toml"})
+    assert second["a"]["base_var"] == "base_value"
+
+
+def test_update_after_failed_update(tmp_path):
+    """A failed update must not hide files from later updates."""
+    root = tmp_path / "root.toml"
+    root.write_text('imports = [{import = "x.toml"}, {import = "b.toml"}]\n')
+    x = tmp_path / "x.toml"
+    x.write_text('x = "ok"\n')
+    (tmp_path / "b.toml").write_text('imports = [{import = "leaf.toml"}]\n')
+    leaf = tmp_path / "leaf.toml"
+    leaf.write_text('leaf = "old"\n')
+    resolver = Resolver(root)
+    resolver.resolve()
+
+    x.write_text("x = \n")
+    with pytest.raises(ValueError):
+        resolver.update({x})
+    leaf.write_text('leaf = "new"\n')
+    with pytest.raises(ValueError):
+        resolver.update({leaf})
+    assert leaf.resolve() in resolver.files
+    x.write_text('x = "fixed"\n')
+    result = resolver.update({x})
+
+    assert result == resolve_config(root)
+    assert result["b"]["leaf"] == {"leaf": "new"}
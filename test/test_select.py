@@ -0,0 +1,52 @@
+from collections import Counter
+from pathlib import Path
+from reconfig import resolve_config
+import pytest
+from test.helpers import counting_loader
+
+
+ROOT = Path("./test/test_configs/conf_integration/root.toml")
+
+
+def test_select_returns_only_selected_paths():
+    result = resolve_config(
+        ROOT, select=["section.var_b", "recursive.a.section_a", "section.section_c"]
+    )
+
+    full = resolve_config(ROOT)
+    assert result == {
+        "section": {
+            "var_b": full["section"]["var_b"],
+            "section_c": full["section"]["section_c"],
+        },
+        "recursive": {"a": {"section_a": full["recursive"]["a"]["section_a"]}},
+    }
+
+
+def test_select_loads_only_contributing_files():
+    counter = Counter()
+    result = resolve_config(
+        ROOT, loader=counting_loader(counter, by_name=True), select=["section.var_b"]
+    )
+
+    assert result == {"section": {"var_b": "val_b"}}
+    # c.toml is star-imported into [section], so its keys must be known
+    assert counter == Counter({"root.toml": 1, "b.toml": 1, "c.toml": 1})
+
+
+def test_select_whole_import():
+    counter = Counter()
+    result = resolve_config(
+        ROOT, loader=counting_loader(counter, by_name=True), select=["recursive"]
+    )
+
+    assert result == {"recursive": resolve_config(ROOT)["recursive"]}
+    assert "c.toml" in counter
+    assert counter["root.toml"] == 1
+
+
+def test_select_missing_key_raises():
+    with pytest.raises(KeyError, match="section.missing"):
+        resolve_config(ROOT, select=["section.missing"])
+    with pytest.raises(KeyError, match="section.var_b.deeper"):
+        resolve_config(ROOT, select=["section.var_b.deeper"])
@@ -0,0 +1,133 @@
+import datetime
+import math
+from pathlib import Path
+from reconfig import resolve_config
+from reconfig.snapshot import SnapshotTable, open_snapshot, write_snapshot
+import pytest
+
+
+def round_trip(data: dict, tmp_path: Path) -> SnapshotTable:
+    path = tmp_path / "config.snap"
+    write_snapshot(data, path)
+    return open_snapshot(path)
+
+
+def test_resolved_config_round_trip(tmp_path):
+    config = resolve_config(Path("./test/test_configs/conf_integration/root.toml"))
+
+    snapshot = round_trip(config, tmp_path)
+
+    assert snapshot == config
+    assert snapshot.to_dict() == config
+    assert type(snapshot.to_dict()) is dict
+
+
+def test_value_types(tmp_path):
+    tz = datetime.timezone(datetime.timedelta(hours=2))
+    data = {
+        "none": None,
+        "bools": [True, False],
+        "ints": [0, -1, 2**63 - 1, -(2**63), 2**64, -(2**100)],
+        "floats": [1.5, -0.0, math.inf],
+        "str": "ünïcødé",
+        "empty": {"table": {}, "array": []},
+        "dates": [
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 600000, tzinfo=tz),
+            datetime.datetime(2024, 1, 2, 3, 4, 5),
+            datetime.date(2024, 1, 2),
+            datetime.time(3, 4, 5),
+        ],
+        "tables": [{"name": "a", "nested": [[1], [2, {"x": 1}]]}],
+    }
+
+    snapshot = round_trip(data, tmp_path)
+
+    assert snapshot.to_dict() == data
+    assert [type(v) for v in snapshot["dates"]] == [type(v) for v in data["dates"]]
+    assert math.copysign(1, snapshot["floats"][1]) == -1
+    assert math.isnan(round_trip({"nan": math.nan}, tmp_path)["nan"])
+    assert isinstance(snapshot["tables"][0], SnapshotTable)
+
+
+def test_mapping_behaviour(tmp_path):
+    snapshot = round_trip({"b": 1, "a": {"c": 2}}, tmp_path)
+
+    assert list(snapshot) == ["b", "a"]
+    assert len(snapshot) == 2
+    assert "a" in snapshot and "z" not in snapshot
+    assert snapshot.get("z") is None
+    with pytest.raises(KeyError):
+        snapshot["z"]
+
+
+def test_lookup_by_sorted_keys(tmp_path):
+    keys = ["ab", "a", "", "é", "b", "ä", "a\x00", "Z"] + [f"k{i}" for i in range(500)]
+    snapshot = round_trip({key: i for i, key in enumerate(keys)}, tmp_path)
+
+    assert list(snapshot) == keys
+    assert [snapshot[key] for key in keys] == list(range(len(keys)))
+    for missing in ["aa", "c", "k5000", "\uffff", 1]:
+        assert missing not in snapshot
+
+
+def test_strings_are_stored_once(tmp_path):
+    value = "x" * 1000
+    data = {f"k{i}": {"value": value} for i in range(100)}
+    path = tmp_path / "many.snap"
+    write_snapshot(data, path)
+
+    assert open_snapshot(path) == data
+    assert path.stat().st_size < len(value) + 100 * 64
+
+
+def test_deep_nesting(tmp_path):
+    data = leaf = {}
+    for _ in range(5000):
+        leaf["child"] = {}
+        leaf = leaf["child"]
+
+    snapshot = round_trip(data, tmp_path)
+
+    assert snapshot.to_dict() == data
+
+
+@pytest.mark.parametrize("options", [{"frozen": True}, {"lazy": True}], ids=str)
+def test_frozen_and_lazy_output(tmp_path, options):
+    root = Path("./test/test_configs/conf_integration/root.toml")
+    config = resolve_config(root, **options)
+
+    snapshot = round_trip(config, tmp_path)
+
+    assert snapshot.to_dict() == resolve_config(root)
+
+
+def test_tuples_are_arrays(tmp_path):
+    snapshot = round_trip({"a": (1, (2, "x")), "b": [()]}, tmp_path)
+    assert snapshot.to_dict() == {"a": [1, [2, "x"]], "b": [[]]}
+
+
+def test_unsupported_type(tmp_path):
+    with pytest.raises(TypeError, match="Cannot store set in a snapshot"):
+        write_snapshot({"a": {1, 2}}, tmp_path / "config.snap")
+    with pytest.raises(TypeError, match="stores a table, got list"):
+        write_snapshot([1, 2], tmp_path / "config.snap")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_not_a_snapshot(tmp_path):
+    path = tmp_path / "config.snap"
+    path.write_bytes(b"x" * 64)
+
+    with pytest.raises(ValueError, match="Not a reconfig snapshot"):
+        open_snapshot(path)
+
+
+def test_rewrite_keeps_open_snapshots_valid(tmp_path):
+    path = tmp_path / "config.snap"
+    write_snapshot({"version": 1}, path)
+    old = open_snapshot(path)
+
+    write_snapshot({"version": 2, "extra": "x" * 100}, path)
+
+    assert old["version"] == 1
+    assert open_snapshot(path)["version"] == 2
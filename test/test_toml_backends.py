@@ -0,0 +1,194 @@
+"""Conformance suite: every installed TOML backend must parse exactly like tomllib."""
+
+import datetime
+import math
+import pickle
+import tomllib
+from pathlib import Path
+from reconfig import resolve_config, toml_loader
+from reconfig.loaders import available_toml_backends, toml_parser
+import pytest
+
+
+BACKENDS = available_toml_backends()
+
+FIXTURES = sorted(Path("./test").glob("**/*.toml"))
+
+VALID_DOCUMENTS = {
+    "strings": '''
+basic = "tab\\tnewline\\nquote\\"unicode\\u00e9\\U0001F600"
+literal = 'C:\\Users\\path'
+multiline = """
+first
+  second \\
+  continued"""
+multiline_literal = \'\'\'
+raw \\n text\'\'\'
+empty = ""
+"quoted key" = 1
+"dotted.quoted" = 2
+"" = "empty key"
+''',
+    "numbers": """
+int = 9_223_372_036_854_775_807
+negative = -9223372036854775808
+hex = 0xDEAD_beef
+octal = 0o755
+binary = 0b1101
+float = 6.626e-34
+fraction = -0.01
+neg_zero = -0.0
+inf = inf
+neg_inf = -inf
+nan = nan
+""",
+    "dates": """
+offset = 1979-05-27T07:32:00Z
+offset_fraction = 1979-05-27T00:32:00.999999-07:00
+offset_space = 1979-05-27 07:32:00+05:30
+local = 1979-05-27T07:32:00
+local_fraction = 1979-05-27T00:32:00.123
+date = 1979-05-27
+time = 07:32:00
+time_fraction = 00:32:00.999999
+""",
+    "collections": """
+ints = [1, 2, 3]
+mixed = [1, "two", 3.0, [4], {five = 5}]
+empty = []
+trailing = [
+  1,
+  2,
+]
+inline = {a = 1, b = {c = [1, 2]}}
+empty_inline = {}
+
+[table.nested]
+key = "value"
+
+[table."quoted.part".deeper]
+key = 1
+
+[[array_of_tables]]
+name = "first"
+
+[[array_of_tables]]
+name = "second"
+[array_of_tables.sub]
+key = true
+
+[empty_table]
+""",
+    "crlf": "a = 1\r\nbasic = \"\"\"l1\r\nl2\"\"\"\r\nliteral = '''l1\r\nl2'''\r\n",
+    "overflow": "big = 1e1000\nsmall = -1e1000\ntiny = 1e-400\n",
+    "dotted_keys": """
+a.b.c = 1
+a.b.d = 2
+site."google.com" = true
+""",
+    "imports": """
+imports = [
+    {import = "a.toml::section.value"},
+    {from = "b.toml", import = ["x", "y"]},
+]
+[section]
+imports = [{from = "c.toml", import = "*"}]
+""",
+}
+
+INVALID_DOCUMENTS = {
+    "missing_value": "key = ",
+    "duplicate_key": "a = 1\na = 2",
+    "duplicate_table": "[t]\n[t]",
+    "redefine_inline": "a = {b = 1}\na.c = 2",
+    "bad_string": 'a = "unterminated',
+    "bad_date": "a = 1979-13-45",
+    "bare_word": "a = word",
+    "mixed_newline": "a = [1,\n2,,]",
+}
+
+
+def assert_identical(actual, expected, where="root"):
+    assert type(actual) is type(expected), where
+    if isinstance(expected, dict):
+        assert list(actual) == list(expected), where
+        for key in expected:
+            assert_identical(actual[key], expected[key], f"{where}.{key}")
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected), where
+        for i, (a, e) in enumerate(zip(actual, expected)):
+            assert_identical(a, e, f"{where}[{i}]")
+    elif isinstance(expected, float) and math.isnan(expected):
+        assert math.isnan(actual), where
+    elif isinstance(expected, float):
+        assert actual == expected, where
+        assert math.copysign(1, actual) == math.copysign(1, expected), where
+    elif isinstance(expected, (datetime.datetime, datetime.time)):
+        assert actual == expected, where
+        assert actual.utcoffset() == expected.utcoffset(), where
+        assert type(actual.tzinfo) is type(expected.tzinfo), where
+    else:
+        assert actual == expected, where
+
+
+def test_tomllib_is_always_available():
+    assert "tomllib" in BACKENDS
+    assert BACKENDS[-1] == "tomllib"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name", VALID_DOCUMENTS)
+def test_backend_parses_like_tomllib(backend, name):
+    document = VALID_DOCUMENTS[name]
+    actual = toml_parser(backend)(document)
+    assert_identical(actual, tomllib.loads(document))
+    # the disk cache and process pools pickle parsed data
+    assert_identical(pickle.loads(pickle.dumps(actual)), actual)
+
+
+@pytest.mark.filterwarnings("ignore:Free-form arguments:DeprecationWarning")
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name", INVALID_DOCUMENTS)
+def test_backend_rejects_invalid_documents(backend, name):
+    with pytest.raises(ValueError) as error:
+        toml_parser(backend)(INVALID_DOCUMENTS[name])
+    assert str(pickle.loads(pickle.dumps(error.value))) == str(error.value)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("path", FIXTURES, ids=str)
+def test_backend_parses_fixtures_like_tomllib(backend, path):
+    text = path.read_text()
+    assert_identical(toml_parser(backend)(text), tomllib.loads(text))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_resolve_config_with_backend(backend):
+    root = Path("./test/test_configs/conf_integration/root.toml")
+    expected = resolve_config(root, loader=toml_loader("tomllib"))
+
+    assert resolve_config(root, loader=toml_loader(backend)) == expected
+
+
+def test_default_backend_with_disk_cache(tmp_path):
+    root = tmp_path / "root.toml"
+    root.write_text(VALID_DOCUMENTS["dates"])
+    expected = tomllib.loads(VALID_DOCUMENTS["dates"])
+
+    for _ in range(2):
+        result = resolve_config(root, cache_dir=tmp_path / "cache")
+        assert_identical(result, expected)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown TOML backend"):
+        toml_parser("no_such_backend")
+
+
+def test_backend_from_environment(monkeypatch):
+    monkeypatch.setenv("RECONFIG_TOML_BACKEND", "tomllib")
+    toml_parser.cache_clear()
+    try:
+        assert toml_parser() is tomllib.loads
+    finally:
+        toml_parser.cache_clear()
@@ -0,0 +1,162 @@
+import time
+from pathlib import Path
+from reconfig import resolve_config
+from reconfig.watch import ConfigWatcher
+import pytest
+
+
+ROOT = """
+imports = [
+    {import = "a.toml"},
+    {import = "b.toml"},
+]
+"""
+
+A = """
+a_var = "a_value"
+"""
+
+B = """
+b_var = "b_value"
+"""
+
+
+def write_tree(tmp_path: Path) -> Path:
+    (tmp_path / "a.toml").write_text(A)
+    (tmp_path / "b.toml").write_text(B)
+    root = tmp_path / "root.toml"
+    root.write_text(ROOT)
+    return root
+
+
+def test_burst_of_writes_is_one_reload(tmp_path):
+    root = write_tree(tmp_path)
+    watcher = ConfigWatcher(root, debounce=0.5)
+    calls = []
+    watcher.subscribe(lambda config, keys: calls.append((config, keys)))
+
+    (tmp_path / "a.toml").write_text('a_var = "a_value_changed"\n')
+    assert not watcher.poll(now=10.0)
+    (tmp_path / "b.toml").write_text('b_var = "b_value_changed"\n')
+    assert not watcher.poll(now=10.3)
+    assert not watcher.poll(now=10.6)
+    assert watcher.poll(now=10.9)
+
+    assert len(calls) == 1
+    config, keys = calls[0]
+    assert keys == {"a", "b"}
+    assert config == {
+        "a": {"a_var": "a_value_changed"},
+        "b": {"b_var": "b_value_changed"},
+    }
+    assert watcher.config == config
+
+
+def test_only_changed_keys_are_reported(tmp_path):
+    root = write_tree(tmp_path)
+    watcher = ConfigWatcher(root, debounce=0.0)
+    calls = []
+    watcher.subscribe(lambda config, keys: calls.append(keys))
+
+    (tmp_path / "b.toml").write_text('b_var = "b_value_changed"\n')
+    watcher.poll()
+
+    assert calls == [{"b"}]
+
+
+def test_watched_files_follow_imports(tmp_path):
+    root = write_tree(tmp_path)
+    watcher = ConfigWatcher(root, debounce=0.0)
+    assert watcher.watched_files == {
+        (tmp_path / name).resolve() for name in ["root.toml", "a.toml", "b.toml"]
+    }
+
+    (tmp_path / "c.toml").write_text('c_var = "c_value"\n')
+    root.write_text('imports = [{import = "a.toml"}, {import = "c.toml"}]\n')
+    watcher.poll()
+
+    assert watcher.watched_files == {
+        (tmp_path / name).resolve() for name in ["root.toml", "a.toml", "c.toml"]
+    }
+
+
+def test_broken_file_keeps_last_good_config(tmp_path):
+    root = write_tree(tmp_path)
+    errors = []
+    watcher = ConfigWatcher(root, debounce=0.0, on_error=errors.append)
+    good = watcher.config
+
+    (tmp_path / "a.toml").write_text("a_var = \n")
+    assert watcher.poll()
+    assert len(errors) == 1
+    assert watcher.config == good
+
+    (tmp_path / "a.toml").write_text('a_var = "fixed"\n')
+    watcher.poll()
+    assert watcher.config["a"] == {"a_var": "fixed"}
+
+
+def test_error_without_handler_is_raised(tmp_path):
+    root = write_tree(tmp_path)
+    watcher = ConfigWatcher(root, debounce=0.0)
+
+    (tmp_path / "a.toml").write_text("a_var = \n")
+    with pytest.raises(ValueError):
+        watcher.poll()
+
+
+def test_fixing_a_broken_file_picks_up_other_changes(tmp_path):
+    root = tmp_path / "root.toml"
+    root.write_text('imports = [{import = "x.toml"}, {import = "b.toml"}]\n')
+    x = tmp_path / "x.toml"
+    x.write_text('x = "ok"\n')
+    (tmp_path / "b.toml").write_text('imports = [{import = "leaf.toml"}]\n')
+    leaf = tmp_path / "leaf.toml"
+    leaf.write_text('leaf = "old"\n')
+    errors = []
+    watcher = ConfigWatcher(root, debounce=0.0, on_error=errors.append)
+
+    x.write_text("x = \n")
+    watcher.poll(now=1.0)
+    leaf.write_text('leaf = "newer"\n')
+    watcher.poll(now=2.0)
+    x.write_text('x = "fixed"\n')
+    watcher.poll(now=3.0)
+
+    assert len(errors) == 2
+    assert watcher.config == resolve_config(root)
+    assert watcher.config["b"]["leaf"] == {"leaf": "newer"}
+
+
+def test_background_errors_are_logged(tmp_path, caplog):
+    root = write_tree(tmp_path)
+    watcher = ConfigWatcher(root, interval=0.01, debounce=0.0)
+
+    with watcher:
+        (tmp_path / "a.toml").write_text("a_var = \n")
+        deadline = time.monotonic() + 5
+        while not caplog.records and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert "Reloading" in caplog.records[0].getMessage()
+    assert issubclass(caplog.records[0].exc_info[0], ValueError)
+
+
+def test_plain_changes_skip_unchanged_files(tmp_path):
+    root = write_tree(tmp_path)
+    watcher = ConfigWatcher(root, debounce=0.0)
+    calls = []
+    watcher.subscribe_changes(lambda config, changes: calls.append(changes))
+    unchanged = watcher.resolver.shared["b"]
+
+    (tmp_path / "a.toml").write_text('a_var = "changed"\n[extra]\nx = 1\n')
+    assert watcher.poll(now=10.0)
+
+    # the diff ran on trees that share b.toml's table
+    assert watcher.resolver.shared["b"] is unchanged
+    assert [change.path for change in calls[0]] == [("a", "a_var"), ("a", "extra")]
+    # values handed to subscribers do not alias the resolver's cache
+    calls[0][1].new["x"] = 2
+    (tmp_path / "b.toml").write_text('b_var = "changed"\n')
+    assert watcher.poll(now=20.0)
+    assert watcher.config["a"]["extra"] == {"x": 1}